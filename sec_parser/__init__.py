@@ -8,6 +8,9 @@ from sec_parser.processing_engine.core import (
     Edgar10QParser,
 )
 from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.instrumentation import Instrumentation
+from sec_parser.processing_engine.parse_cache import ParseCache
+from sec_parser.processing_engine.processing_log import ProcessingLogLevel
 from sec_parser.processing_engine.types import ParsingOptions
 from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
     AbstractProcessingStep,
@@ -66,4 +69,7 @@ __all__ = [
     # Misc
     "render",
     "ParsingOptions",
+    "ProcessingLogLevel",
+    "ParseCache",
+    "Instrumentation",
 ]
@@ -12,12 +12,34 @@ from sec_parser.processing_engine.core import (
     Edgar10QParser,
 )
 from sec_parser.processing_engine.html_tag import HtmlTag
-from sec_parser.processing_engine.html_tag_parser import HtmlTagParser
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+    StreamingHtmlTagParser,
+)
+from sec_parser.processing_engine.instrumentation import (
+    CheckStats,
+    Instrumentation,
+    InstrumentationCallback,
+    ParseStats,
+    StepStats,
+)
+from sec_parser.processing_engine.lxml_html_tag import LxmlHtmlTag
+from sec_parser.processing_engine.parse_cache import ParseCache
 
 __all__ = [
     "HtmlTagParser",
+    "LxmlHtmlTagParser",
+    "StreamingHtmlTagParser",
     "AbstractSemanticElementParser",
     "Edgar10KParser",
     "Edgar10QParser",
     "HtmlTag",
+    "LxmlHtmlTag",
+    "ParseCache",
+    "Instrumentation",
+    "InstrumentationCallback",
+    "ParseStats",
+    "StepStats",
+    "CheckStats",
 ]
@@ -3,12 +3,19 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Callable
 
+from sec_parser.exceptions import SecParserValueError
 from sec_parser.processing_engine.html_tag_parser import (
     AbstractHtmlTagParser,
     HtmlTagParser,
 )
+from sec_parser.processing_engine.parse_cache import get_fingerprint
+from sec_parser.processing_engine.parse_many import parse_many
+from sec_parser.processing_engine.processing_log import ProcessingLog
 from sec_parser.processing_engine.types import ParsingOptions
 from sec_parser.processing_steps.empty_element_classifier import EmptyElementClassifier
+from sec_parser.processing_steps.fused_elementwise_processing_step import (
+    fuse_elementwise_steps,
+)
 from sec_parser.processing_steps.highlighted_text_classifier import (
     HighlightedTextClassifier,
 )
@@ -44,11 +51,13 @@ from sec_parser.processing_steps.text_classifier import TextClassifier
 from sec_parser.processing_steps.text_element_merger import TextElementMerger
 from sec_parser.processing_steps.title_classifier import TitleClassifier
 from sec_parser.processing_steps.top_section_manager import (
+    TopSectionManager,
     TopSectionManagerFor10K,
     TopSectionManagerFor10Q,
 )
 from sec_parser.semantic_elements.composite_semantic_element import (
     CompositeSemanticElement,
+    get_inner_elements,
 )
 from sec_parser.semantic_elements.highlighted_text_element import HighlightedTextElement
 from sec_parser.semantic_elements.semantic_elements import (
@@ -57,9 +66,17 @@ from sec_parser.semantic_elements.semantic_elements import (
     TextElement,
 )
 from sec_parser.semantic_elements.table_element.table_element import TableElement
+from sec_parser.semantic_elements.top_section_start_marker import TopSectionStartMarker
+from sec_parser.utils.traversal import iter_preorder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
     from sec_parser.processing_engine.html_tag import HtmlTag
+    from sec_parser.processing_engine.html_tag_parser import HtmlSource
+    from sec_parser.processing_engine.instrumentation import Instrumentation
+    from sec_parser.processing_engine.parse_cache import ParseCache
+    from sec_parser.processing_engine.parse_many import HtmlOrPath, ParseManyResult
     from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
         AbstractProcessingStep,
     )
@@ -112,10 +129,15 @@ class AbstractSemanticElementParser(ABC):
         *,
         parsing_options: ParsingOptions | None = None,
         html_tag_parser: AbstractHtmlTagParser | None = None,
+        parse_cache: ParseCache | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self._get_steps = get_steps or self.get_default_steps
         self._parsing_options = parsing_options or ParsingOptions()
         self._html_tag_parser = html_tag_parser or HtmlTagParser()
+        self._parse_cache = parse_cache
+        self._instrumentation = instrumentation
+        self._fingerprint: str | None = None
 
     @abstractmethod
     def get_default_steps(self) -> list[AbstractProcessingStep]:
@@ -128,6 +150,43 @@ class AbstractSemanticElementParser(ABC):
         unwrap_elements: bool | None = None,
         include_containers: bool | None = None,
         include_irrelevant_elements: bool | None = None,
+    ) -> list[AbstractSemanticElement]:
+        cache = self._parse_cache
+        if cache is None:
+            return self._parse(
+                html,
+                unwrap_elements=unwrap_elements,
+                include_containers=include_containers,
+                include_irrelevant_elements=include_irrelevant_elements,
+            )
+
+        fingerprint = get_fingerprint(
+            (
+                self.get_fingerprint(),
+                unwrap_elements,
+                include_containers,
+                include_irrelevant_elements,
+            ),
+        )
+        key = cache.get_key(html, fingerprint)
+        elements = cache.get(key)
+        if elements is None:
+            elements = self._parse(
+                html,
+                unwrap_elements=unwrap_elements,
+                include_containers=include_containers,
+                include_irrelevant_elements=include_irrelevant_elements,
+            )
+            cache.set(key, elements)
+        return elements
+
+    def _parse(
+        self,
+        html: str | bytes,
+        *,
+        unwrap_elements: bool | None,
+        include_containers: bool | None,
+        include_irrelevant_elements: bool | None,
     ) -> list[AbstractSemanticElement]:
         root_tags = self._html_tag_parser.parse(html)
         return self.parse_from_tags(
@@ -137,6 +196,64 @@ class AbstractSemanticElementParser(ABC):
             include_irrelevant_elements=include_irrelevant_elements,
         )
 
+    def get_fingerprint(self) -> str:
+        """
+        Return a fingerprint of the parser configuration, i.e. of the configured
+        steps, the parsing options and the HTML tag parser, which is used
+        as a part of the `parse_cache` key.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = get_fingerprint(
+                (
+                    type(self),
+                    self._get_steps(),
+                    self._parsing_options,
+                    self._html_tag_parser,
+                ),
+            )
+        return self._fingerprint
+
+    def parse_many(
+        self,
+        htmls_or_paths: Iterable[HtmlOrPath],
+        *,
+        workers: int | None = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+    ) -> Iterator[ParseManyResult]:
+        """
+        Parse many documents in parallel, yielding `(index, elements)` pairs,
+        where `index` is the position of the document in `htmls_or_paths`.
+
+        Each document is either its HTML markup (str or bytes), or the path of
+        an HTML file (os.PathLike), which is then read by the worker process.
+
+        The documents are sent in chunks of `chunksize` documents to a pool of
+        `workers` processes, which defaults to the number of CPUs. The parser is
+        sent only once to each worker, so it must be picklable, including a
+        custom `get_steps`, e.g. a module-level function. The results are
+        yielded in the order of the documents, or as soon as they are completed
+        if `ordered` is False.
+
+        With a single worker, the documents are parsed in the current process.
+        Otherwise, the resulting elements are unpickled from the workers: their
+        HtmlTag objects are detached from the document and rebuilt from their
+        source code when needed.
+        """
+        return parse_many(
+            self,
+            htmls_or_paths,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+        )
+
     def parse_from_tags(
         self,
         root_tags: list[HtmlTag],
@@ -144,19 +261,175 @@ class AbstractSemanticElementParser(ABC):
         unwrap_elements: bool | None = None,
         include_containers: bool | None = None,
         include_irrelevant_elements: bool | None = None,
+    ) -> list[AbstractSemanticElement]:
+        elements = self._process(
+            self._create_elements(root_tags),
+            self._get_steps(),
+        )
+        return self._finish_elements(
+            elements,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+        )
+
+    def parse_sections(
+        self,
+        html: str | bytes,
+        section_identifiers: Iterable[str],
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+    ) -> list[AbstractSemanticElement]:
+        """
+        Parse only the top sections with the given identifiers, e.g.
+        `{"part2item1a"}`, returning their elements in document order,
+        each section starting with its TopSectionTitle. A section includes its
+        subsections, e.g. "part1" includes "part1item1".
+
+        The steps up to and including the top section detection process the
+        whole document, as the section boundaries depend on all of it. The
+        remaining steps, e.g. the highlighted text and title classifiers, only
+        process the top-level tags of the requested sections. Before that, the
+        other elements are passed to `collect_statistics` of these steps, so
+        that the page header and page number classifiers still count the
+        repetitions across the whole document.
+
+        The results can therefore differ from the same sections of a full parse:
+        - The title levels follow the order in which the title styles first
+          appear within the requested sections, not within the whole document.
+        - The elements outside of the requested sections count as page header
+          candidates without their text style, and as text even if a full
+          parse would classify them otherwise, e.g. as introductory elements.
+
+        Sections that are not found in the document are skipped.
+        """
+        cache = self._parse_cache
+        identifiers = frozenset(section_identifiers)
+        if cache is None:
+            return self._parse_sections(
+                html,
+                identifiers,
+                unwrap_elements=unwrap_elements,
+                include_containers=include_containers,
+                include_irrelevant_elements=include_irrelevant_elements,
+            )
+
+        fingerprint = get_fingerprint(
+            (
+                self.get_fingerprint(),
+                tuple(sorted(identifiers)),
+                unwrap_elements,
+                include_containers,
+                include_irrelevant_elements,
+            ),
+        )
+        key = cache.get_key(html, fingerprint)
+        elements = cache.get(key)
+        if elements is None:
+            elements = self._parse_sections(
+                html,
+                identifiers,
+                unwrap_elements=unwrap_elements,
+                include_containers=include_containers,
+                include_irrelevant_elements=include_irrelevant_elements,
+            )
+            cache.set(key, elements)
+        return elements
+
+    def _parse_sections(
+        self,
+        html: str | bytes,
+        section_identifiers: frozenset[str],
+        *,
+        unwrap_elements: bool | None,
+        include_containers: bool | None,
+        include_irrelevant_elements: bool | None,
+    ) -> list[AbstractSemanticElement]:
+        root_tags = self._html_tag_parser.parse(html)
+        return self.parse_sections_from_tags(
+            root_tags,
+            section_identifiers,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+        )
+
+    def parse_sections_from_tags(
+        self,
+        root_tags: list[HtmlTag],
+        section_identifiers: Iterable[str],
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
     ) -> list[AbstractSemanticElement]:
         steps = self._get_steps()
-        elements: list[AbstractSemanticElement] = [
-            NotYetClassifiedElement(tag) for tag in root_tags
+        if not any(isinstance(step, TopSectionManager) for step in steps):
+            msg = "Parsing sections requires a TopSectionManager step."
+            raise SecParserValueError(msg)
+        split_index = next(
+            i + 1 for i, step in enumerate(steps) if isinstance(step, TopSectionManager)
+        )
+
+        elements = self._process(
+            self._create_elements(root_tags),
+            steps[:split_index],
+        )
+        selected = select_top_sections(elements, set(section_identifiers))
+        selected_ids = {id(element) for element in selected}
+        others = [element for element in elements if id(element) not in selected_ids]
+        for step in steps[split_index:]:
+            step.collect_statistics(others)
+        elements = self._process(selected, steps[split_index:])
+        return self._finish_elements(
+            elements,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+        )
+
+    def _create_elements(
+        self,
+        root_tags: Iterable[HtmlTag],
+    ) -> list[AbstractSemanticElement]:
+        level = self._parsing_options.processing_log_level
+        return [
+            NotYetClassifiedElement(
+                tag,
+                processing_log=ProcessingLog.create(level),
+            )
+            for tag in root_tags
         ]
 
+    def _process(
+        self,
+        elements: list[AbstractSemanticElement],
+        steps: list[AbstractProcessingStep],
+    ) -> list[AbstractSemanticElement]:
+        steps = fuse_elementwise_steps(steps)
+        if self._instrumentation is not None:
+            return self._instrumentation.process(steps, elements)
         for step in steps:
             elements = step.process(elements)
+        return elements
 
+    def _finish_elements(
+        self,
+        elements: list[AbstractSemanticElement],
+        *,
+        unwrap_elements: bool | None,
+        include_containers: bool | None,
+        include_irrelevant_elements: bool | None,
+    ) -> list[AbstractSemanticElement]:
         if not include_irrelevant_elements:
             elements = [
                 e for e in elements if isinstance(e, IrrelevantElement) is False
             ]
+        if self._parsing_options.detach_html_tags:
+            for element in elements:
+                element.detach()
         if unwrap_elements is False:
             return elements
         return CompositeSemanticElement.unwrap_elements(
@@ -164,6 +437,106 @@ class AbstractSemanticElementParser(ABC):
             include_containers=include_containers,
         )
 
+    def iter_parse(
+        self,
+        html: HtmlSource,
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+    ) -> Iterator[AbstractSemanticElement]:
+        """
+        Lazily parse the document, yielding the semantic elements one by one.
+
+        Combined with StreamingHtmlTagParser, the processing steps start
+        working on the first top-level tags before the rest of the document
+        has been read. Steps that need to see the whole document, such as
+        the top section detection, wait for all preceding elements, so the
+        resulting elements are the same as the ones returned by `parse`.
+
+        Open file objects are read chunk by chunk by StreamingHtmlTagParser,
+        and read as a whole by the other parsers.
+        """
+        root_tags = self._html_tag_parser.iter_parse(html)
+        return self.iter_parse_from_tags(
+            root_tags,
+            unwrap_elements=unwrap_elements,
+            include_containers=include_containers,
+            include_irrelevant_elements=include_irrelevant_elements,
+        )
+
+    def iter_parse_from_tags(
+        self,
+        root_tags: Iterable[HtmlTag],
+        *,
+        unwrap_elements: bool | None = None,
+        include_containers: bool | None = None,
+        include_irrelevant_elements: bool | None = None,
+    ) -> Iterator[AbstractSemanticElement]:
+        steps = fuse_elementwise_steps(self._get_steps())
+        level = self._parsing_options.processing_log_level
+        elements: Iterable[AbstractSemanticElement] = (
+            NotYetClassifiedElement(
+                tag,
+                processing_log=ProcessingLog.create(level),
+            )
+            for tag in root_tags
+        )
+
+        if self._instrumentation is None:
+            for step in steps:
+                elements = step.process_iter(elements)
+        else:
+            elements = self._instrumentation.process_iter(steps, elements)
+
+        for element in elements:
+            if not include_irrelevant_elements and isinstance(
+                element,
+                IrrelevantElement,
+            ):
+                continue
+            if self._parsing_options.detach_html_tags:
+                element.detach()
+            if unwrap_elements is False:
+                yield element
+                continue
+            yield from CompositeSemanticElement.unwrap_elements(
+                [element],
+                include_containers=include_containers,
+            )
+
+
+def select_top_sections(
+    elements: Iterable[AbstractSemanticElement],
+    section_identifiers: set[str],
+) -> list[AbstractSemanticElement]:
+    """
+    Select the top-level elements of the top sections with the given identifiers.
+
+    A section starts with its TopSectionStartMarker, and ends before the next
+    marker of the same or a lower level, so that it includes its subsections.
+    The top sections are searched also within composite elements, which are
+    selected as a whole if any of their inner elements is part of a section.
+    """
+    selected: list[AbstractSemanticElement] = []
+    section_level: int | None = None
+    for element in elements:
+        is_selected = False
+        for inner, _ in iter_preorder([element], get_inner_elements):
+            if isinstance(inner, TopSectionStartMarker):
+                if section_level is not None and inner.level <= section_level:
+                    section_level = None
+                if (
+                    section_level is None
+                    and inner.section_type.identifier in section_identifiers
+                ):
+                    section_level = inner.level
+            if not isinstance(inner, CompositeSemanticElement):
+                is_selected = is_selected or section_level is not None
+        if is_selected:
+            selected.append(element)
+    return selected
+
 
 class Edgar10QParser(AbstractSemanticElementParser):
     """
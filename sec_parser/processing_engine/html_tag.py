@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Callable
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable
 
 import bs4
 import xxhash
@@ -9,29 +11,32 @@ from frozendict import frozendict
 from loguru import logger
 
 from sec_parser.exceptions import SecParserValueError
-from sec_parser.utils.bs4_.approx_table_metrics import (
-    ApproxTableMetrics,
-    get_approx_table_metrics,
-)
-from sec_parser.utils.bs4_.contains_tag import contains_tag
-from sec_parser.utils.bs4_.count_tags import count_tags
 from sec_parser.utils.bs4_.count_text_matches_in_descendants import (
     count_text_matches_in_descendants,
 )
-from sec_parser.utils.bs4_.has_tag_children import has_tag_children
-from sec_parser.utils.bs4_.has_text_outside_tags import has_text_outside_tags
-from sec_parser.utils.bs4_.is_unary_tree import is_unary_tree
-from sec_parser.utils.bs4_.table_check_data_cell import check_table_contains_text_page
+from sec_parser.utils.bs4_.table_facts import TableFacts, get_table_facts
+from sec_parser.utils.bs4_.table_grid import get_table_grid
 from sec_parser.utils.bs4_.table_to_markdown import TableToMarkdown
+from sec_parser.utils.bs4_.tag_index import TagIndex, get_tag_index_entry
 from sec_parser.utils.bs4_.text_styles_metrics import compute_text_styles_metrics
-from sec_parser.utils.bs4_.without_tags import without_tags
+from sec_parser.utils.bs4_.without_tags import (
+    get_text_without_tags,
+    iter_without_tags,
+    without_tags,
+)
 from sec_parser.utils.bs4_.wrap_tags_in_new_parent import wrap_tags_in_new_parent
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.utils.bs4_.table_facts import ApproxTableMetrics
+    from sec_parser.utils.bs4_.table_grid import TableGrid
+    from sec_parser.utils.bs4_.tag_index import TagIndexEntry
 
 TEXT_PREVIEW_LENGTH = 40
 
+DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND = "lxml"
+
 # Regex pattern for opening ix tags
 opening_tag_pattern = re.compile(r"<ix:[^>]+>")
 
@@ -39,6 +44,57 @@ opening_tag_pattern = re.compile(r"<ix:[^>]+>")
 closing_tag_pattern = re.compile(r"</ix:[^>]+>")
 
 
+class NotSetType:
+    def __reduce__(self) -> str:
+        # Preserve the singleton when unpickling.
+        return "NotSet"
+
+
+NotSet = NotSetType()
+
+# Number of accesses to the cached results of HtmlTag objects, indexed by
+# whether the result had to be computed: [hits, misses], for each thread that
+# tracks them. Empty unless accesses are tracked, see `track_cache_accesses`,
+# so that the cached accessors only check whether it is empty.
+_tracked_cache_access_counts: dict[int, list[int]] = {}
+
+
+@contextmanager
+def track_cache_accesses() -> Iterator[list[int]]:
+    """
+    Count the accesses to the cached results of HtmlTag objects made by the
+    current thread within the context, as [hits, misses]. It is used by the
+    instrumentation to measure the cache hit rate of the processing steps.
+    Nested contexts share the counts of the outermost one.
+    """
+    thread_id = threading.get_ident()
+    counts = _tracked_cache_access_counts.get(thread_id)
+    if counts is not None:
+        yield counts
+        return
+    counts = [0, 0]
+    _tracked_cache_access_counts[thread_id] = counts
+    try:
+        yield counts
+    finally:
+        del _tracked_cache_access_counts[thread_id]
+
+
+def get_tracked_cache_access_counts() -> tuple[int, int]:
+    """
+    Get the counts of the accesses to cached results tracked by the current
+    thread so far, as (hits, misses), or zeros if it doesn't track them.
+    """
+    hits, misses = _tracked_cache_access_counts.get(threading.get_ident(), (0, 0))
+    return hits, misses
+
+
+def _count_cache_access(*, miss: bool) -> None:
+    counts = _tracked_cache_access_counts.get(threading.get_ident())
+    if counts is not None:
+        counts[miss] += 1
+
+
 class HtmlTag:
     """
     The HtmlTag class is a wrapper for BeautifulSoup4 Tag objects.
@@ -61,10 +117,41 @@ class HtmlTag:
     def __init__(
         self,
         bs4_element: bs4.PageElement,
+        *,
+        effective_styles_table: dict[Any, Any] | None = None,
+        tag_index: TagIndex | None = None,
+        parser_backend: str | None = None,
     ) -> None:
         self._bs4: bs4.Tag = self._to_tag(bs4_element)
         self._parent: HtmlTag | None = None
+        self._init_document_tables(effective_styles_table, tag_index, parser_backend)
+        self._init_caches()
 
+    def _init_document_tables(
+        self,
+        effective_styles_table: dict[Any, Any] | None = None,
+        tag_index: TagIndex | None = None,
+        parser_backend: str | None = None,
+    ) -> None:
+        # The effective styles and the structural index of the underlying tags,
+        # shared by all the HtmlTag objects of a document. See
+        # `get_text_styles_metrics` and `_get_tag_index_entry`.
+        self._effective_styles_table = (
+            {} if effective_styles_table is None else effective_styles_table
+        )
+        self._tag_index = TagIndex() if tag_index is None else tag_index
+        # The BeautifulSoup4 parser backend the document was parsed with,
+        # with which the tree of a detached tag is rebuilt.
+        self._parser_backend = parser_backend or DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND
+
+    def _get_document_tables(self) -> dict[str, Any]:
+        return {
+            "effective_styles_table": self._effective_styles_table,
+            "tag_index": self._tag_index,
+            "parser_backend": self._parser_backend,
+        }
+
+    def _init_caches(self) -> None:
         # We use cached properties to prevent performance issues in intensive loops.
         # As the source code is immutable, we can afford to use some extra memory
         # for caching. A decorator might be a cleaner solution here.
@@ -77,20 +164,104 @@ class HtmlTag:
         self._source_code: str | None = None
         self._pretty_source_code: str | None = None
         self._compatible_source_code: str | None = None
-        self._approx_table_metrics: ApproxTableMetrics | None | NotSetType = NotSet
         self._contains_tag: dict[tuple[str, bool], bool] = {}
         self._without_tags: dict[tuple[str, ...], HtmlTag] = {}
         self._count_tags: dict[str, int] = {}
         self._has_text_outside_tags: dict[tuple[str, ...], bool] = {}
         self._contains_words: bool | None = None
         self._markdown_table: str | None = None
+        self._table_grid: TableGrid | None = None
+        self._table_facts: TableFacts | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle the tag as its source code and cached results instead of the
+        underlying tree, which references the whole document and may exceed
+        the recursion limit. This allows to send the parsed semantic elements
+        across process boundaries, e.g. from the workers of `parse_many`.
+
+        The unpickled tag is a detached, BeautifulSoup4-based HtmlTag with no
+        parent, whatever the backend of the original tag. Only the results that
+        are already cached are pickled, so the results that depend on the
+        ancestors, such as the text styles metrics, have to be computed before.
+        """
+        self.get_source_code()
+        return {
+            name: value
+            for name in _PICKLED_ATTRIBUTES
+            if (value := getattr(self, name)) is not None
+            and value is not NotSet
+            and value != {}
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._parent = None
+        self._init_document_tables()
+        self._init_caches()
+        self.__dict__.update(state)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Subclasses wrapping other backends are unpickled as a plain HtmlTag.
+        return (_restore_html_tag, (self.__getstate__(),))
+
+    @classmethod
+    def create_detached(
+        cls,
+        source_code: str,
+        *,
+        text: str | None = None,
+        markdown_table: str | None = None,
+        table_facts: TableFacts | None = None,
+        parser_backend: str | None = None,
+    ) -> HtmlTag:
+        """
+        Create a tag that is detached from any document from its source code and
+        from any already known results. The underlying BeautifulSoup4 tree is
+        only built from the source code when it is needed, with the given
+        parser backend.
+        """
+        return _restore_html_tag(
+            {
+                "_source_code": source_code,
+                "_text": text,
+                "_markdown_table": markdown_table,
+                "_table_facts": table_facts,
+                "_parser_backend": (
+                    parser_backend or DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND
+                ),
+            },
+        )
+
+    def to_detached(self) -> HtmlTag:
+        """
+        Return a copy of the tag that is detached from the document. The copy
+        only holds the source code, the text, the hash and the other cached
+        results, so that the document can be garbage collected. The underlying
+        BeautifulSoup4 tree is rebuilt from the source code when it is needed.
+
+        Note: Results that are not cached yet are computed from the source code
+        of the tag alone, e.g. the text styles metrics no longer take the styles
+        of the ancestors into account.
+        """
+        _ = self.text
+        self.to_dict()
+        return _restore_html_tag(self.__getstate__())
+
+    def __getattr__(self, name: str) -> bs4.Tag:
+        # Only called for missing attributes, i.e. for the tree of a detached
+        # tag, which is rebuilt from the source code when needed.
+        if name != "_bs4" or "_source_code" not in self.__dict__:
+            raise AttributeError(name)
+        element = _parse_detached_element(self._source_code, self._parser_backend)
+        self._bs4 = self._to_tag(element).extract()
+        return self._bs4
 
     @property
     def parent(self) -> HtmlTag | None:
         if self._parent is None:
             parent = self._bs4.parent
             if parent is not None:
-                self._parent = HtmlTag(parent)
+                self._parent = HtmlTag(parent, **self._get_document_tables())
         return self._parent
 
     def get_source_code(
@@ -114,6 +285,8 @@ class HtmlTag:
                 self._pretty_source_code = self._bs4.prettify()
             return self._pretty_source_code
 
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._source_code is None)
         if self._source_code is None:
             self._source_code = str(self._bs4)
         return self._source_code
@@ -129,17 +302,25 @@ class HtmlTag:
             else text
         )
 
+    @property
+    def _raw_name(self) -> str:
+        """Returns the tag name as stored by the underlying parser."""
+        return self._bs4.name
+
     def to_dict(self) -> frozendict:
         """Compute the hash of the HTML tag."""
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._frozen_dict is None)
         if self._frozen_dict is None:
+            name = self._raw_name
             self._frozen_dict = frozendict(
                 {
-                    "tag_name": self._bs4.name,
+                    "tag_name": name,
                     "html_preview": self._generate_preview(
                         remove_affixes(
                             self.get_source_code(),
-                            prefixes=(f"<{self._bs4.name}>", f"<{self._bs4.name} "),
-                            suffix=f"</{self._bs4.name}>",
+                            prefixes=(f"<{name}>", f"<{name} "),
+                            suffix=f"</{name}>",
                         ),
                     ),
                     "html_hash": xxhash.xxh32(self.get_source_code()).hexdigest(),
@@ -149,6 +330,8 @@ class HtmlTag:
 
     def contains_words(self) -> bool:
         """Return True if the semantic element contains text."""
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._contains_words is None)
         if self._contains_words is None:
             self._contains_words = (
                 any(char.isalnum() for char in self.text) if self.text else False
@@ -161,6 +344,8 @@ class HtmlTag:
         `text` property recursively extracts text from the child tags.
         The result is cached as the underlying data doesn't change.
         """
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._text is None)
         if self._text is None:
             self._text = self._bs4.text.strip()
         return self._text
@@ -171,12 +356,14 @@ class HtmlTag:
         return self._bs4.name.lower()
 
     def has_tag_children(self) -> bool:
-        return has_tag_children(self._bs4)
+        return self._get_tag_index_entry().has_tag_children
 
     def get_children(self) -> list[HtmlTag]:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._children is None)
         if self._children is None:
             self._children = [
-                HtmlTag(child)
+                HtmlTag(child, **self._get_document_tables())
                 for child in self._bs4.children
                 if not (isinstance(child, bs4.NavigableString) and child.strip() == "")
             ]
@@ -190,12 +377,12 @@ class HtmlTag:
         return True, as there is a 'b' tag within the descendants of the 'div' tag.
         """
         tag_key = (name, include_self)
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._contains_tag.get(tag_key) is None)
         if self._contains_tag.get(tag_key) is None:
-            self._contains_tag[tag_key] = contains_tag(
-                self._bs4,
-                name,
-                include_self=include_self,
-            )
+            self._contains_tag[tag_key] = (
+                include_self and self._raw_name == name
+            ) or self._tag_index.count_tags(self._get_tag_index_entry(), name) > 0
         return self._contains_tag[tag_key]
 
     def has_text_outside_tags(self, tags: list[str] | str) -> bool:
@@ -208,28 +395,35 @@ class HtmlTag:
         tag within the descendants of the 'div' tag.
         """
         tag_names = tuple(tags if isinstance(tags, list) else [tags])
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=tag_names not in self._has_text_outside_tags)
         if tag_names not in self._has_text_outside_tags:
-            self._has_text_outside_tags[tag_names] = has_text_outside_tags(
-                self._bs4,
-                tag_names,
+            self._has_text_outside_tags[tag_names] = (
+                self._tag_index.has_text_outside_tags(
+                    self._get_tag_index_entry(),
+                    tag_names,
+                )
             )
         return self._has_text_outside_tags[tag_names]
 
     def without_tags(self, names: Iterable[str]) -> HtmlTag:
         """
-        `without_tags` method creates a copy of the current HTML tag and removes all
+        `without_tags` method returns a view of the current HTML tag without all
         descendant tags with the specified name. For example, calling
         without_tags(tag, ["b","i"]) on an HtmlTag instance representing
         "<div><b>foo</b><p>bar<i>bax</i></p></div>" would
-        return a copy HtmlTag instance representing "<div><p>bar</p></div>".
+        return an HtmlTag instance representing "<div><p>bar</p></div>".
+
+        The view doesn't copy the underlying tree, see FilteredHtmlTag.
         """
         tag_key = tuple(names)
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._without_tags.get(tag_key) is None)
         if self._without_tags.get(tag_key) is None:
-            self._without_tags[tag_key] = HtmlTag(
-                without_tags(
-                    self._bs4,
-                    names,
-                ),
+            self._without_tags[tag_key] = FilteredHtmlTag(
+                self._bs4,
+                tag_key,
+                parser_backend=self._parser_backend,
             )
         return self._without_tags[tag_key]
 
@@ -242,11 +436,12 @@ class HtmlTag:
         the 'div' tag.
         """
         tag_key = name
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._count_tags.get(tag_key) is None)
         if self._count_tags.get(tag_key) is None:
-            self._count_tags[tag_key] = count_tags(
-                self._bs4,
-                name,
-            )
+            self._count_tags[tag_key] = (
+                self._raw_name == name
+            ) + self._tag_index.count_tags(self._get_tag_index_entry(), name)
         return self._count_tags[tag_key]
 
     def is_unary_tree(self) -> bool:
@@ -261,10 +456,21 @@ class HtmlTag:
         regardless of its children. This is because in the context of this application,
         'table' tags are always considered unary.
         """
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._is_unary_tree is None)
         if self._is_unary_tree is None:
-            self._is_unary_tree = is_unary_tree(self._bs4)
+            self._is_unary_tree = self._get_tag_index_entry().is_unary_tree
         return self._is_unary_tree
 
+    def _get_tag_index_entry(self) -> TagIndexEntry:
+        """
+        Return the entry of the tag in the structural index of the document,
+        from which the tag queries are answered. The index is shared by the
+        HtmlTag objects of the document, so that the descendants of a tag are
+        traversed once, instead of once per query and per nested element.
+        """
+        return get_tag_index_entry(self._bs4, self._tag_index)
+
     def get_text_styles_metrics(self) -> dict[tuple[str, str], float]:
         """
         Compute the percentage distribution of various CSS styles within the text
@@ -283,31 +489,55 @@ class HtmlTag:
 
         Each dictionary entry corresponds to a unique style, (property, value) and
         the percentage of text it affects.
+
+        The effective styles of the tags are resolved once per document, and
+        shared by the HtmlTag objects of the document.
         """
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._text_styles_metrics is None)
         if self._text_styles_metrics is None:
-            self._text_styles_metrics = compute_text_styles_metrics(self._bs4)
+            self._text_styles_metrics = compute_text_styles_metrics(
+                self._bs4,
+                self._effective_styles_table,
+            )
         return self._text_styles_metrics
 
     def get_approx_table_metrics(self) -> ApproxTableMetrics | None:
-        if self._approx_table_metrics is NotSet:
-            self._approx_table_metrics = get_approx_table_metrics(self._bs4)
+        return self.get_table_facts().metrics
 
-        # Appeasing type checkers
-        if self._approx_table_metrics is not None and not isinstance(
-            self._approx_table_metrics,
-            ApproxTableMetrics,
-        ):
-            msg = f"Invalid type for _approx_table_metrics: {type(self._approx_table_metrics).__name__}"
-            raise ValueError(msg)
+    def _get_table_grid(self) -> TableGrid:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._table_grid is None)
+        if self._table_grid is None:
+            self._table_grid = self._compute_table_grid()
+        return self._table_grid
 
-        return self._approx_table_metrics
+    def _compute_table_grid(self) -> TableGrid:
+        return get_table_grid(self._bs4)
+
+    def get_table_facts(self) -> TableFacts:
+        """
+        Return the facts about the table of the tag, i.e. its approximate
+        metrics and whether one of its <td> tags has the text "page". They are
+        collected while reading the table grid, which is shared with the
+        Markdown conversion.
+        """
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._table_facts is None)
+        if self._table_facts is None:
+            self._table_facts = get_table_facts(self._get_table_grid)
+        return self._table_facts
 
     def is_table_of_content(self) -> bool:
-        return check_table_contains_text_page(self._bs4)
+        return self.get_table_facts().has_page_data_cell
 
     def table_to_markdown(self) -> str:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._markdown_table is None)
         if self._markdown_table is None:
-            self._markdown_table = TableToMarkdown(self._bs4).convert()
+            self._markdown_table = TableToMarkdown.convert_grid(
+                self._get_table_grid(),
+            )
         return self._markdown_table
 
     @staticmethod
@@ -332,13 +562,22 @@ class HtmlTag:
         tags: Iterable[HtmlTag],
     ) -> HtmlTag:
         html_tags = tuple(tags)
-        bs4_tags = [tag._bs4 for tag in html_tags]  # noqa: SLF001
 
-        tag = HtmlTag(wrap_tags_in_new_parent(parent_tag_name, bs4_tags))
+        # Let the backend of the wrapped tags create the new parent tag.
+        tag = type(html_tags[0])._create_parent_tag(parent_tag_name, html_tags)  # noqa: SLF001
 
         tag._parent = html_tags[0].parent  # noqa: SLF001
         return tag
 
+    @classmethod
+    def _create_parent_tag(
+        cls,
+        parent_tag_name: str,
+        html_tags: tuple[HtmlTag, ...],
+    ) -> HtmlTag:
+        bs4_tags = [tag._bs4 for tag in html_tags]  # noqa: SLF001
+        return HtmlTag(wrap_tags_in_new_parent(parent_tag_name, bs4_tags))
+
     def count_text_matches_in_descendants(
         self,
         predicate: Callable[[str], bool],
@@ -352,15 +591,176 @@ class HtmlTag:
         )
 
 
+class FilteredHtmlTag(HtmlTag):
+    """
+    The FilteredHtmlTag class is a view of a BeautifulSoup4 tag that leaves out
+    the descendant tags with the specified names, as returned by
+    `HtmlTag.without_tags`.
+
+    The text, the children and the source code are read from the original tree
+    on the fly, skipping the excluded tags, so that memory and time stay
+    proportional to what is actually read. The remaining operations work on
+    a copy of the tree without the excluded tags, which is only made when
+    one of them is used.
+    """
+
+    def __init__(
+        self,
+        bs4_tag: bs4.Tag,
+        names: Iterable[str],
+        *,
+        parser_backend: str | None = None,
+    ) -> None:
+        self._tag = bs4_tag
+        self._names = frozenset(names)
+        self._filtered_copy: bs4.Tag | None = None
+        self._parent: HtmlTag | None = None
+        self._init_document_tables(parser_backend=parser_backend)
+        self._init_caches()
+
+    @property
+    def _bs4(self) -> bs4.Tag:  # type: ignore[override]
+        if self._filtered_copy is None:
+            self._filtered_copy = without_tags(self._tag, self._names)
+        return self._filtered_copy
+
+    @property
+    def parent(self) -> HtmlTag | None:
+        return self._parent
+
+    @property
+    def _raw_name(self) -> str:
+        return self._tag.name
+
+    @property
+    def name(self) -> str:
+        return self._tag.name.lower()
+
+    def get_source_code(
+        self,
+        *,
+        pretty: bool = False,
+        enable_compatibility: bool = False,
+    ) -> str:
+        if enable_compatibility:
+            return super().get_source_code(
+                pretty=pretty,
+                enable_compatibility=enable_compatibility,
+            )
+        if pretty:
+            if self._pretty_source_code is None:
+                self._pretty_source_code = self._tag.decode(
+                    indent_level=True,
+                    iterator=iter_without_tags(self._tag, self._names),
+                )
+            return self._pretty_source_code
+
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._source_code is None)
+        if self._source_code is None:
+            self._source_code = self._tag.decode(
+                iterator=iter_without_tags(self._tag, self._names),
+            )
+        return self._source_code
+
+    @property
+    def text(self) -> str:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._text is None)
+        if self._text is None:
+            self._text = get_text_without_tags(self._tag, self._names).strip()
+        return self._text
+
+    def has_tag_children(self) -> bool:
+        return any(
+            isinstance(child, bs4.Tag) and child.name not in self._names
+            for child in self._tag.children
+        )
+
+    def get_children(self) -> list[HtmlTag]:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._children is None)
+        if self._children is None:
+            children: list[HtmlTag] = []
+            for child in self._tag.children:
+                if isinstance(child, bs4.Tag):
+                    if child.name in self._names:
+                        continue
+                    filtered_child = FilteredHtmlTag(
+                        child,
+                        self._names,
+                        parser_backend=self._parser_backend,
+                    )
+                    filtered_child._parent = self
+                    children.append(filtered_child)
+                elif child.strip() != "":
+                    children.append(
+                        HtmlTag(child, parser_backend=self._parser_backend),
+                    )
+            self._children = children
+        return self._children
+
+
 class EmptyNavigableStringError(SecParserValueError):
     pass
 
 
-class NotSetType:
-    pass
+# Results that do not reference other parts of the tree.
+_PICKLED_ATTRIBUTES = (
+    "_text",
+    "_is_unary_tree",
+    "_text_styles_metrics",
+    "_frozen_dict",
+    "_source_code",
+    "_pretty_source_code",
+    "_compatible_source_code",
+    "_contains_tag",
+    "_count_tags",
+    "_has_text_outside_tags",
+    "_contains_words",
+    "_markdown_table",
+    "_table_facts",
+    "_parser_backend",
+)
 
 
-NotSet = NotSetType()
+def create_document_tables(parser_backend: str | None = None) -> dict[str, Any]:
+    """
+    Create the tables to be shared by the HtmlTag objects of a document,
+    to be passed as keyword arguments to their constructor.
+    """
+    return {
+        "effective_styles_table": {},
+        "tag_index": TagIndex(),
+        "parser_backend": parser_backend,
+    }
+
+
+def _parse_detached_element(source_code: str, parser_backend: str) -> bs4.PageElement:
+    """
+    Parse the source code of a detached tag with the parser backend of its
+    document, so that the rebuilt tree is normalized like the original one.
+
+    Parsers such as lxml wrap the markup into <html> and <body> tags, and move
+    some tags out of their context, e.g. <td> tags outside of a table. If the
+    tag cannot be found as-is in the parsed document, the markup is parsed
+    with "html.parser", which keeps any fragment as it is.
+    """
+    soup = bs4.BeautifulSoup(source_code, parser_backend)
+    for parent in (soup.body, soup.head, soup):
+        if parent is None:
+            continue
+        for element in parent.contents:
+            if str(element) == source_code:
+                return element
+    soup = bs4.BeautifulSoup(source_code, "html.parser")
+    return next(iter(soup.contents))
+
+
+def _restore_html_tag(state: dict[str, Any]) -> HtmlTag:
+    tag = HtmlTag.__new__(HtmlTag)
+    tag.__setstate__(state)
+    return tag
 
 
 def remove_affixes(text: str, prefixes: tuple, suffix: str) -> str:
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import re
 import warnings
 from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, Any, Union
 
 import bs4
-from bs4.builder import XMLParsedAsHTMLWarning
+from bs4.builder import LXMLTreeBuilder, ParserRejectedMarkup, XMLParsedAsHTMLWarning
+from lxml import etree
 
 from sec_parser.exceptions import SecParserValueError
-from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.html_tag import (
+    DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND,
+    HtmlTag,
+    create_document_tables,
+)
+from sec_parser.processing_engine.lxml_html_tag import LxmlHtmlTag
+from sec_parser.utils.bs4_.tag_index import index_document
+from sec_parser.utils.lxml_.normalize_whitespace import normalize_whitespace
+from sec_parser.utils.lxml_.string_nodes import is_blank_string, iter_child_nodes
 
-DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND = "lxml"
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+# Matches the beginning of an opening or a closing tag.
+_TAG_START_PATTERN = re.compile(r"</?[A-Za-z]")
+_TAG_START_PATTERN_BYTES = re.compile(rb"</?[A-Za-z]")
+
+HtmlSource = Union[str, bytes, IO[str], IO[bytes]]
 
 
 class AbstractHtmlTagParser(ABC):
@@ -17,6 +35,25 @@ class AbstractHtmlTagParser(ABC):
     def parse(self, html: str | bytes) -> list[HtmlTag]:
         raise NotImplementedError  # pragma: no cover
 
+    def iter_parse(self, html: HtmlSource) -> Iterator[HtmlTag]:
+        """
+        Yield the top-level tags of the document one by one.
+
+        The default implementation reads and parses the whole document first.
+        Subclasses can override it to emit tags as soon as they are available.
+        """
+        if not isinstance(html, (str, bytes)):
+            html = html.read()
+        yield from self.parse(html)
+
+
+def _raise_no_top_level_tags() -> None:
+    msg = (
+        "The HTML document did not contain any top-level tags. "
+        "This may indicate that the document is malformed."
+    )
+    raise SecParserValueError(msg)
+
 
 class HtmlTagParser(AbstractHtmlTagParser):
     """
@@ -32,16 +69,17 @@ class HtmlTagParser(AbstractHtmlTagParser):
         root: bs4.Tag = self._parse_to_bs4(html)
 
         elements: list[HtmlTag] = []
+        document_tables: dict[str, Any] = create_document_tables(
+            self._parser_backend,
+        )
+        # The tags of the document share a single index, built in one pass.
+        index_document(root, document_tables["tag_index"])
         for child in root.children:
             if isinstance(child, bs4.NavigableString) and not child.strip():
                 continue
-            elements.append(HtmlTag(child))
+            elements.append(HtmlTag(child, **document_tables))
         if not elements:
-            msg = (
-                "The HTML document did not contain any top-level tags. "
-                "This may indicate that the document is malformed."
-            )
-            raise SecParserValueError(msg)
+            _raise_no_top_level_tags()
         return elements
 
     def _parse_to_bs4(self, html: str | bytes) -> bs4.Tag:
@@ -55,3 +93,376 @@ class HtmlTagParser(AbstractHtmlTagParser):
             root = root.html
             root = root.body if root.body else root
         return root
+
+
+class LxmlHtmlTagParser(AbstractHtmlTagParser):
+    """
+    The LxmlHtmlTagParser parses an HTML document with lxml and wraps the
+    resulting lxml elements into LxmlHtmlTag objects, bypassing BeautifulSoup4.
+
+    The document is decoded and parsed in exactly the same way as
+    HtmlTagParser does with its default backend, and the tree is normalized
+    like BeautifulSoup4 normalizes it, so the produced tags are
+    interchangeable with the ones produced by HtmlTagParser. They are just
+    considerably faster to work with.
+    """
+
+    def parse(self, html: str | bytes) -> list[HtmlTag]:
+        markup, encoding, root = self._parse_to_lxml(html)
+        if root is None:
+            # The document doesn't contain a single element, e.g. it consists
+            # of comments only. BeautifulSoup4 keeps such documents, so let it
+            # handle this corner case.
+            return HtmlTagParser().parse(html)
+
+        _restore_valueless_boolean_attributes(root, markup, encoding)
+        html_element = next(root.iter("html"), root)
+        root = next(html_element.iterdescendants("body"), html_element)
+        normalize_whitespace(root)
+
+        document_tables: dict[str, Any] = create_document_tables()
+        elements: list[HtmlTag] = [
+            LxmlHtmlTag(child, **document_tables)
+            for child in iter_child_nodes(root)
+            if not is_blank_string(child)
+        ]
+        if not elements:
+            _raise_no_top_level_tags()
+        return elements
+
+    def _parse_to_lxml(
+        self,
+        html: str | bytes,
+    ) -> tuple[str | bytes, str | None, etree._Element | None]:
+        builder = LXMLTreeBuilder()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+            strategies = list(builder.prepare_markup(html))
+
+        errors: list[Exception] = []
+        for markup, encoding, _, _ in strategies:
+            parser = etree.HTMLParser(recover=True, encoding=encoding)
+            try:
+                parser.feed(markup)
+                return markup, encoding, parser.close()
+            except etree.XMLSyntaxError:
+                # Raised for empty documents.
+                return markup, encoding, None
+            except (UnicodeDecodeError, LookupError, etree.ParserError) as e:
+                errors.append(e)
+
+        msg = "The markup was rejected by the parser: " + "; ".join(
+            str(e) for e in errors
+        )
+        raise SecParserValueError(msg)
+
+
+class StreamingHtmlTagParser(AbstractHtmlTagParser):
+    """
+    The StreamingHtmlTagParser feeds the document to lxml's incremental
+    parser chunk by chunk and emits each child of <body> as an HtmlTag
+    as soon as it has been closed.
+
+    The tree is built by the same BeautifulSoup4 tree builder that
+    HtmlTagParser uses, so the emitted tags are identical to the ones
+    produced by HtmlTagParser. The difference is that the first tags are
+    available before the rest of the document has been read, which allows
+    the processing steps to start working on them right away.
+
+    The emitted tags are extracted from the tree, and each of them gets its
+    own document tables, so that nothing but the emitted tag keeps its
+    subtree alive. The peak memory therefore depends on the tags that are
+    still in use, not on the size of the document. Each emitted tag is
+    placed into copies of its ancestors, without their other children,
+    so that it still inherits their styles.
+
+    The parser drives the tree builder of BeautifulSoup4 4.12 directly,
+    which is why the dependency is pinned to that minor version.
+
+    Besides strings and bytes, the parser accepts open file objects. These are
+    read chunk by chunk, so the raw document never has to be held in memory.
+    For binary file objects the encoding is detected from the first
+    `ENCODING_DETECTION_SIZE` bytes.
+    """
+
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+    ENCODING_DETECTION_SIZE = 64 * 1024
+
+    def __init__(self, chunk_size: int | None = None) -> None:
+        self._chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        if self._chunk_size <= 0:
+            msg = "chunk_size must be a positive integer."
+            raise SecParserValueError(msg)
+
+    def parse(self, html: HtmlSource) -> list[HtmlTag]:
+        return list(self.iter_parse(html))
+
+    def iter_parse(self, html: HtmlSource) -> Iterator[HtmlTag]:
+        first_chunk, remaining_chunks = self._split_first_chunk(html)
+        soup = bs4.BeautifulSoup("", features=DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND)
+        builder = soup.builder
+
+        rejections: list[ParserRejectedMarkup] = []
+        for markup, encoding, declared_encoding, replaced in _iter_strategies(
+            builder,
+            first_chunk,
+        ):
+            soup.reset()
+            builder.initialize_soup(soup)
+            soup.original_encoding = encoding
+            soup.declared_html_encoding = declared_encoding
+            soup.contains_replacement_characters = replaced
+            tracker = _TopLevelTagTracker(soup)
+            try:
+                yield from self._feed(builder, tracker, markup, remaining_chunks)
+            except ParserRejectedMarkup as e:
+                if tracker.emitted_count > 0:
+                    msg = f"The parser rejected the markup mid-document: {e}"
+                    raise SecParserValueError(msg) from e
+                rejections.append(e)
+                continue
+            finally:
+                builder.soup = None
+            if tracker.emitted_count == 0:
+                _raise_no_top_level_tags()
+            return
+
+        msg = "The markup was rejected by the parser: " + "; ".join(
+            str(e) for e in rejections
+        )
+        raise SecParserValueError(msg)
+
+    def _feed(
+        self,
+        builder: bs4.builder.TreeBuilder,
+        tracker: _TopLevelTagTracker,
+        markup: str | bytes,
+        remaining_chunks: Iterator[str | bytes],
+    ) -> Iterator[HtmlTag]:
+        soup = tracker.soup
+        builder.reset()
+        try:
+            builder.parser = builder.parser_for(soup.original_encoding)
+            for chunk in self._iter_chunks(markup, remaining_chunks):
+                builder.parser.feed(chunk)
+                yield from tracker.pop_completed()
+            builder.parser.close()
+        except (UnicodeDecodeError, LookupError, etree.ParserError) as e:
+            raise ParserRejectedMarkup(e) from e
+
+        # Close out any unfinished strings and close all the open tags,
+        # exactly like BeautifulSoup does at the end of parsing.
+        soup.endData()
+        while soup.currentTag.name != soup.ROOT_TAG_NAME:
+            soup.popTag()
+        yield from tracker.pop_completed(final=True)
+
+    def _split_first_chunk(
+        self,
+        html: HtmlSource,
+    ) -> tuple[str | bytes, Iterator[str | bytes]]:
+        if isinstance(html, (str, bytes)):
+            # The whole document is available, so the encoding detection
+            # sees the same markup as BeautifulSoup would.
+            return html, iter(())
+        read = getattr(html, "read", None)
+        if read is None:
+            msg = f"Unsupported HTML source type: {type(html).__name__}"
+            raise SecParserValueError(msg)
+
+        def read_remaining() -> Iterator[str | bytes]:
+            while chunk := read(self._chunk_size):
+                yield chunk
+
+        # The first chunk is used to detect the encoding, so it has to be large
+        # enough to contain the encoding declaration of the document.
+        return read(max(self._chunk_size, self.ENCODING_DETECTION_SIZE)), (
+            read_remaining()
+        )
+
+    def _iter_chunks(
+        self,
+        markup: str | bytes,
+        remaining_chunks: Iterator[str | bytes],
+    ) -> Iterator[str | bytes]:
+        # lxml's incremental HTML parser can misinterpret text that is split
+        # between two chunks (e.g. the contents of a <script> tag), so the
+        # chunks are only ever split right before the start of a tag.
+        chunks, tail = self._split_before_tags(markup)
+        yield from chunks
+        for data in remaining_chunks:
+            chunks, tail = self._split_before_tags(tail + data)
+            yield from chunks
+        chunks, tail = self._split_before_tags(tail)
+        yield from chunks
+
+        # lxml has to be fed at least once, even if the markup is empty.
+        yield tail
+
+    def _split_before_tags(
+        self,
+        markup: str | bytes,
+    ) -> tuple[list[str | bytes], str | bytes]:
+        pattern = (
+            _TAG_START_PATTERN if isinstance(markup, str) else _TAG_START_PATTERN_BYTES
+        )
+        chunks = []
+        start = 0
+        while match := pattern.search(markup, start + self._chunk_size):
+            chunks.append(markup[start : match.start()])
+            start = match.start()
+        return chunks, markup[start:]
+
+
+def _iter_strategies(
+    builder: bs4.builder.TreeBuilder,
+    markup: str | bytes,
+) -> Iterator[tuple[str | bytes, str | None, str | None, bool]]:
+    """
+    Yield the ways to decode the markup one by one, like BeautifulSoup does,
+    so that the costly character set detection only runs if the encodings
+    tried before it are rejected.
+    """
+    strategies = builder.prepare_markup(markup)
+    while True:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+            strategy = next(strategies, None)
+        if strategy is None:
+            return
+        yield strategy
+
+
+class _TopLevelTagTracker:
+    """
+    Keeps track of the children of <body> that have been closed by the parser
+    but have not been emitted yet.
+    """
+
+    def __init__(self, soup: bs4.BeautifulSoup) -> None:
+        self.soup = soup
+        self.emitted_count = 0
+        self._root: bs4.Tag | None = None
+
+    def pop_completed(self, *, final: bool = False) -> Iterator[HtmlTag]:
+        root = self._find_root(final=final)
+        if root is None:
+            return
+        contents = root.contents
+        end = len(contents)
+        if not final and end > 0 and self._is_open(contents[-1]):
+            end -= 1
+        for child in contents[:end]:
+            child.extract()
+            if isinstance(child, bs4.NavigableString) and not child.strip():
+                continue
+            self._copy_ancestors(root).append(child)
+            document_tables = create_document_tables()
+            index_document(child, document_tables["tag_index"])
+            self.emitted_count += 1
+            yield HtmlTag(child, **document_tables)
+
+    def _find_root(self, *, final: bool) -> bs4.Tag | None:
+        if self._root is None:
+            html = self.soup.html
+            if html is not None and html.body is not None:
+                self._root = html.body
+            elif final:
+                # Same fallback as HtmlTagParser for documents without <body>.
+                self._root = html if html is not None else self.soup
+        return self._root
+
+    def _is_open(self, element: bs4.PageElement) -> bool:
+        return any(tag is element for tag in reversed(self.soup.tagStack))
+
+    def _copy_ancestors(self, root: bs4.Tag) -> bs4.Tag | bs4.BeautifulSoup:
+        """Copy the root and its ancestors, without any of their children."""
+        if root is self.soup:
+            return bs4.BeautifulSoup("", features=DEFAULT_BEAUTIFUL_SOUP_PARSER_BACKEND)
+        copy = self.soup.new_tag(root.name, attrs=dict(root.attrs))
+        parent = copy
+        for ancestor in root.parents:
+            if ancestor is self.soup:
+                break
+            parent_copy = self.soup.new_tag(ancestor.name, attrs=dict(ancestor.attrs))
+            parent_copy.append(parent)
+            parent = parent_copy
+        return copy
+
+
+# When libxml2 builds a tree, it sets the value of valueless boolean attributes,
+# such as <td nowrap>, to the name of the attribute. BeautifulSoup4 receives
+# the raw parser events instead and stores an empty value.
+_BOOLEAN_ATTRIBUTES = (
+    "checked",
+    "compact",
+    "declare",
+    "defer",
+    "disabled",
+    "ismap",
+    "multiple",
+    "nohref",
+    "noresize",
+    "noshade",
+    "nowrap",
+    "readonly",
+    "selected",
+)
+_FIND_BOOLEAN_ATTRIBUTES = etree.XPath(
+    "//*[{}]".format(" or ".join(f"@{n}='{n}'" for n in _BOOLEAN_ATTRIBUTES)),
+)
+
+
+def _restore_valueless_boolean_attributes(
+    root: etree._Element,
+    markup: str | bytes,
+    encoding: str | None,
+) -> None:
+    elements = _FIND_BOOLEAN_ATTRIBUTES(root)
+    if not elements:
+        return
+    names = {n for element in elements for n in _BOOLEAN_ATTRIBUTES if n in element.attrib}
+    if any(_has_explicit_value(markup, name) for name in names):
+        # Both forms may be present, so the exact values are taken from the
+        # parser events, which is slower but rarely needed.
+        _restore_from_parser_events(root, markup, encoding)
+        return
+    for element in elements:
+        for name in names:
+            if element.get(name) == name:
+                element.set(name, "")
+
+
+def _has_explicit_value(markup: str | bytes, name: str) -> bool:
+    if isinstance(markup, str):
+        return re.search(rf"{name}\s*=", markup, re.IGNORECASE) is not None
+    return re.search(rf"{name}\s*=".encode(), markup, re.IGNORECASE) is not None
+
+
+def _restore_from_parser_events(
+    root: etree._Element,
+    markup: str | bytes,
+    encoding: str | None,
+) -> None:
+    recorder = _ValuelessBooleanAttributesRecorder()
+    parser = etree.HTMLParser(target=recorder, recover=True, encoding=encoding)
+    parser.feed(markup)
+    parser.close()
+    for element, names in zip(root.iter(etree.Element), recorder.names_per_element):
+        for name in names:
+            element.set(name, "")
+
+
+class _ValuelessBooleanAttributesRecorder:
+    """Parser target that records the valueless boolean attributes of each tag."""
+
+    def __init__(self) -> None:
+        self.names_per_element: list[tuple[str, ...]] = []
+
+    def start(self, _: str, attrib: dict[str, str]) -> None:
+        self.names_per_element.append(
+            tuple(n for n in _BOOLEAN_ATTRIBUTES if attrib.get(n) == ""),
+        )
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from sec_parser.processing_engine.html_tag import (
+    get_tracked_cache_access_counts,
+    track_cache_accesses,
+)
+from sec_parser.processing_steps.fused_elementwise_processing_step import (
+    FusedElementwiseProcessingStep,
+)
+from sec_parser.processing_steps.individual_semantic_element_extractor.individual_semantic_element_extractor import (
+    IndividualSemanticElementExtractor,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+        AbstractElementwiseProcessingStep,
+    )
+    from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
+        AbstractProcessingStep,
+    )
+    from sec_parser.processing_steps.abstract_classes.processing_context import (
+        ElementProcessingContext,
+    )
+    from sec_parser.processing_steps.individual_semantic_element_extractor.single_element_checks.abstract_single_element_check import (
+        AbstractSingleElementCheck,
+    )
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+    # The class name of an element, or of a composite element followed by
+    # the types of its inner elements.
+    TypeSnapshot = str | tuple
+
+# Wall time, CPU time, HtmlTag cache hits and misses at a point in time.
+_Counters = tuple[float, float, int, int]
+
+
+def _read_counters() -> _Counters:
+    return (
+        time.perf_counter(),
+        time.thread_time(),
+        *get_tracked_cache_access_counts(),
+    )
+
+
+class _MeasuredStats:
+    wall_time: float
+    cpu_time: float
+    cache_hits: int
+    cache_misses: int
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Share of the accesses to cached HtmlTag results that were hits."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else None
+
+    def _add_since(self, start: _Counters) -> None:
+        wall, cpu, hits, misses = _read_counters()
+        self.wall_time += wall - start[0]
+        self.cpu_time += cpu - start[1]
+        self.cache_hits += hits - start[2]
+        self.cache_misses += misses - start[3]
+
+
+@dataclass
+class StepStats(_MeasuredStats):
+    """
+    Statistics of a processing step.
+
+    `elements_in` and `elements_out` count the top-level elements passed to
+    and returned by the step, and `transformations` counts the elements,
+    including inner elements, whose type was changed by the step, keyed
+    by the names of the original and the new type.
+
+    A FusedElementwiseProcessingStep reports the steps it runs as
+    `inner_steps`. Their elements are counted each time they are passed
+    to the step, and their times only include the processing of elements,
+    not the traversal shared by all inner steps.
+    """
+
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    elements_in: int = 0
+    elements_out: int = 0
+    transformations: Counter[tuple[str, str]] = field(default_factory=Counter)
+    inner_steps: list[StepStats] = field(default_factory=list)
+
+
+@dataclass
+class CheckStats(_MeasuredStats):
+    """
+    Statistics of a single element check, where `results` counts
+    the results (True, False or None) returned by the check.
+    """
+
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    calls: int = 0
+    results: Counter[bool | None] = field(default_factory=Counter)
+
+
+@dataclass
+class ParseStats(_MeasuredStats):
+    """
+    Statistics of processing a document with the steps of a parser. The time
+    spent on parsing the HTML into tags is not included.
+
+    Note: The time of a step includes the time of the checks it runs.
+    """
+
+    steps: list[StepStats] = field(default_factory=list)
+    checks: list[CheckStats] = field(default_factory=list)
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class InstrumentationCallback:
+    """
+    Base class for receiving the statistics collected by Instrumentation.
+    Override the methods of interest, e.g. to send the statistics to
+    a monitoring system.
+    """
+
+    def on_step_end(self, stats: StepStats) -> None:
+        """
+        Receive the statistics of a step once it is done. When parsing lazily,
+        all the steps work at the same time, so this happens once the document
+        is processed.
+        """
+
+    def on_parse_end(self, stats: ParseStats) -> None:
+        """Receive the statistics once all the steps are done with a document."""
+
+
+class Instrumentation:
+    """
+    Instrumentation measures the wall time, the CPU time, the number of
+    elements, the type transformations and the HtmlTag cache hit rate of every
+    processing step and single element check used by a parser.
+
+    Pass an instance to the parser, e.g.
+    `Edgar10QParser(instrumentation=Instrumentation([callback]))`. The
+    statistics of the last parsed document are available as `last_stats`,
+    and are passed to the callbacks.
+
+    The accesses to the cached results of HtmlTag objects are only counted
+    while an instrumented parser processes a document, and only for the
+    thread that runs it.
+
+    Note: Statistics of documents parsed in the worker processes of
+    `parse_many` are not sent back to the main process.
+    """
+
+    def __init__(self, callbacks: Iterable[InstrumentationCallback] = ()) -> None:
+        self._callbacks = list(callbacks)
+        self.last_stats: ParseStats | None = None
+
+    def process(
+        self,
+        steps: list[AbstractProcessingStep],
+        elements: list[AbstractSemanticElement],
+    ) -> list[AbstractSemanticElement]:
+        """Process the elements with the steps, collecting their statistics."""
+        stats = self._start(steps)
+        with track_cache_accesses():
+            start = _read_counters()
+            snapshots = _take_snapshots(elements)
+            for step, step_stats in zip(steps, stats.steps):
+                step_start = _read_counters()
+                step_stats.elements_in = len(elements)
+                elements = step.process(elements)
+                step_stats._add_since(step_start)  # noqa: SLF001
+                step_stats.elements_out = len(elements)
+                new_snapshots = _take_snapshots(elements)
+                _count_transformations(
+                    snapshots,
+                    new_snapshots,
+                    step_stats.transformations,
+                )
+                snapshots = new_snapshots
+                for callback in self._callbacks:
+                    callback.on_step_end(step_stats)
+            stats._add_since(start)  # noqa: SLF001
+        self._finish(stats)
+        return elements
+
+    def process_iter(
+        self,
+        steps: list[AbstractProcessingStep],
+        elements: Iterable[AbstractSemanticElement],
+    ) -> Iterator[AbstractSemanticElement]:
+        """
+        Lazily process the elements with the steps, collecting their
+        statistics. As the steps pull elements from each other, the time
+        of a step is the time spent in the step minus the time spent in
+        the previous steps.
+        """
+        stats = self._start(steps)
+        stages = [_MeasuredIterator(elements)]
+        for step in steps:
+            stages.append(_MeasuredIterator(step.process_iter(stages[-1])))
+        try:
+            with track_cache_accesses():
+                yield from stages[-1]
+        finally:
+            for previous, stage, step_stats in zip(stages, stages[1:], stats.steps):
+                step_stats.wall_time = stage.wall_time - previous.wall_time
+                step_stats.cpu_time = stage.cpu_time - previous.cpu_time
+                step_stats.cache_hits = stage.cache_hits - previous.cache_hits
+                step_stats.cache_misses = stage.cache_misses - previous.cache_misses
+                step_stats.elements_in = len(previous.snapshots)
+                step_stats.elements_out = len(stage.snapshots)
+                _count_transformations(
+                    previous.snapshots,
+                    stage.snapshots,
+                    step_stats.transformations,
+                )
+                for callback in self._callbacks:
+                    callback.on_step_end(step_stats)
+            stats.wall_time = stages[-1].wall_time - stages[0].wall_time
+            stats.cpu_time = stages[-1].cpu_time - stages[0].cpu_time
+            stats.cache_hits = stages[-1].cache_hits - stages[0].cache_hits
+            stats.cache_misses = stages[-1].cache_misses - stages[0].cache_misses
+            self._finish(stats)
+
+    def _start(self, steps: list[AbstractProcessingStep]) -> ParseStats:
+        stats = ParseStats()
+        for step in steps:
+            step_stats = StepStats(name=step.__class__.__name__)
+            inner_steps: Iterable[AbstractElementwiseProcessingStep] = (
+                step.steps
+                if isinstance(step, FusedElementwiseProcessingStep)
+                else [step]  # type: ignore[list-item]
+            )
+            for inner_step in inner_steps:
+                if inner_step is not step:
+                    inner_stats = StepStats(name=inner_step.__class__.__name__)
+                    _instrument_step(inner_step, inner_stats)
+                    step_stats.inner_steps.append(inner_stats)
+                if isinstance(inner_step, IndividualSemanticElementExtractor):
+                    for check in inner_step._contains_single_element_checks:  # noqa: SLF001
+                        check_stats = CheckStats(name=check.__class__.__name__)
+                        _instrument_check(check, check_stats)
+                        stats.checks.append(check_stats)
+            stats.steps.append(step_stats)
+        return stats
+
+    def _finish(self, stats: ParseStats) -> None:
+        self.last_stats = stats
+        for callback in self._callbacks:
+            callback.on_parse_end(stats)
+
+
+class _MeasuredIterator(_MeasuredStats):
+    """
+    Wraps an iterator of elements, measuring the total time spent in it,
+    including the time spent in the iterators it pulls elements from.
+    """
+
+    def __init__(self, elements: Iterable[AbstractSemanticElement]) -> None:
+        self._iterator = iter(elements)
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.snapshots: list[TypeSnapshot] = []
+
+    def __iter__(self) -> Iterator[AbstractSemanticElement]:
+        return self
+
+    def __next__(self) -> AbstractSemanticElement:
+        start = _read_counters()
+        try:
+            element = next(self._iterator)
+            self.snapshots.append(_take_snapshot(element))
+        finally:
+            self._add_since(start)
+        return element
+
+
+def _instrument_step(
+    step: AbstractElementwiseProcessingStep,
+    stats: StepStats,
+) -> None:
+    # Elements are passed to the steps of a fused step one by one,
+    # so the statistics are collected for each element.
+    process_element = step._process_element  # noqa: SLF001
+    depth = 0
+
+    def measured_process_element(
+        element: AbstractSemanticElement,
+        context: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        nonlocal depth
+        stats.elements_in += 1
+        start = _read_counters()
+        depth += 1
+        try:
+            result = process_element(element, context)
+        finally:
+            depth -= 1
+            # Steps may process elements recursively, e.g. the inner
+            # elements of a new composite element, which is timed once.
+            if depth == 0:
+                stats._add_since(start)  # noqa: SLF001
+        stats.elements_out += 1
+        if type(result) is not type(element):
+            key = (element.__class__.__name__, result.__class__.__name__)
+            stats.transformations[key] += 1
+        return result
+
+    step._process_element = measured_process_element  # type: ignore[method-assign] # noqa: SLF001
+
+
+def _instrument_check(check: AbstractSingleElementCheck, stats: CheckStats) -> None:
+    contains_single_element = check.contains_single_element
+
+    def measured_contains_single_element(
+        element: AbstractSemanticElement,
+    ) -> bool | None:
+        start = _read_counters()
+        try:
+            result = contains_single_element(element)
+        finally:
+            stats._add_since(start)  # noqa: SLF001
+        stats.calls += 1
+        stats.results[result] += 1
+        return result
+
+    check.contains_single_element = measured_contains_single_element  # type: ignore[method-assign]
+
+
+def _take_snapshot(element: AbstractSemanticElement) -> TypeSnapshot:
+    if isinstance(element, CompositeSemanticElement):
+        return (
+            element.__class__.__name__,
+            _take_snapshots(element.inner_elements),
+        )
+    return element.__class__.__name__
+
+
+def _take_snapshots(elements: Iterable[AbstractSemanticElement]) -> list[TypeSnapshot]:
+    return [_take_snapshot(e) for e in elements]
+
+
+def _count_transformations(
+    before: list[TypeSnapshot],
+    after: list[TypeSnapshot],
+    transformations: Counter[tuple[str, str]],
+) -> None:
+    # Elements are matched by position, which is only possible when the
+    # step kept the number of elements, e.g. not when merging elements.
+    if len(before) != len(after):
+        return
+    for old, new in zip(before, after):
+        old_name = old if isinstance(old, str) else old[0]
+        new_name = new if isinstance(new, str) else new[0]
+        if old_name != new_name:
+            transformations[(old_name, new_name)] += 1
+        elif isinstance(old, tuple) and isinstance(new, tuple):
+            _count_transformations(old[1], new[1], transformations)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from loguru import logger
+from lxml import etree
+
+from sec_parser.processing_engine.html_tag import (
+    EmptyNavigableStringError,
+    HtmlTag,
+    _count_cache_access,
+    _tracked_cache_access_counts,
+)
+from sec_parser.utils.lxml_.contains_tag import contains_tag
+from sec_parser.utils.lxml_.count_tags import count_tags
+from sec_parser.utils.lxml_.count_text_matches_in_descendants import (
+    count_text_matches_in_descendants,
+)
+from sec_parser.utils.lxml_.get_text import get_text
+from sec_parser.utils.lxml_.has_tag_children import has_tag_children
+from sec_parser.utils.lxml_.has_text_outside_tags import has_text_outside_tags
+from sec_parser.utils.lxml_.is_unary_tree import is_unary_tree
+from sec_parser.utils.lxml_.string_nodes import (
+    get_node_string,
+    is_blank_string,
+    is_element,
+    iter_child_nodes,
+)
+from sec_parser.utils.lxml_.table_grid import get_table_grid
+from sec_parser.utils.lxml_.text_styles_metrics import compute_text_styles_metrics
+from sec_parser.utils.lxml_.to_bs4 import to_bs4
+from sec_parser.utils.lxml_.to_source_code import to_source_code
+from sec_parser.utils.lxml_.wrap_tags_in_new_parent import wrap_tags_in_new_parent
+
+if TYPE_CHECKING:  # pragma: no cover
+    import bs4
+
+    from sec_parser.utils.bs4_.table_grid import TableGrid
+    from sec_parser.utils.bs4_.tag_index import TagIndex
+    from sec_parser.utils.lxml_.string_nodes import ChildNode
+
+
+class LxmlHtmlTag(HtmlTag):
+    """
+    The LxmlHtmlTag class is an HtmlTag that wraps lxml elements directly,
+    without building a BeautifulSoup4 tree first.
+
+    All methods used by the processing steps are implemented on top of
+    lxml's C-level iteration and return exactly the same results as
+    their BeautifulSoup4 counterparts. The few remaining operations, such as
+    pretty-printing, convert the element to an equivalent bs4.Tag on demand.
+    """
+
+    def __init__(
+        self,
+        lxml_node: ChildNode,
+        *,
+        effective_styles_table: dict[Any, Any] | None = None,
+        tag_index: TagIndex | None = None,
+        parser_backend: str | None = None,
+    ) -> None:
+        self._element: etree._Element = self._to_element(lxml_node)
+        self._bs4_tag: bs4.Tag | None = None
+        self._parent: HtmlTag | None = None
+        self._init_document_tables(effective_styles_table, tag_index, parser_backend)
+        self._init_caches()
+
+    @property
+    def _bs4(self) -> bs4.Tag:  # type: ignore[override]
+        if self._bs4_tag is None:
+            self._bs4_tag = to_bs4(self._element)
+        return self._bs4_tag
+
+    @property
+    def parent(self) -> HtmlTag | None:
+        if self._parent is None:
+            parent = self._element.getparent()
+            if parent is not None:
+                self._parent = LxmlHtmlTag(parent, **self._get_document_tables())
+        return self._parent
+
+    @property
+    def _raw_name(self) -> str:
+        return self._element.tag
+
+    def get_source_code(
+        self,
+        *,
+        pretty: bool = False,
+        enable_compatibility: bool = False,
+    ) -> str:
+        if pretty or enable_compatibility:
+            return super().get_source_code(
+                pretty=pretty,
+                enable_compatibility=enable_compatibility,
+            )
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._source_code is None)
+        if self._source_code is None:
+            self._source_code = to_source_code(self._element)
+        return self._source_code
+
+    @property
+    def text(self) -> str:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._text is None)
+        if self._text is None:
+            self._text = get_text(self._element).strip()
+        return self._text
+
+    @property
+    def name(self) -> str:
+        return self._element.tag.lower()
+
+    def has_tag_children(self) -> bool:
+        return has_tag_children(self._element)
+
+    def get_children(self) -> list[HtmlTag]:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._children is None)
+        if self._children is None:
+            self._children = [
+                LxmlHtmlTag(child, **self._get_document_tables())
+                for child in iter_child_nodes(self._element)
+                if not is_blank_string(child)
+            ]
+        return self._children
+
+    # The tag queries below scan the descendants with lxml's C-level iteration,
+    # which is faster than filling the TagIndex of the document in Python.
+
+    def contains_tag(self, name: str, *, include_self: bool = False) -> bool:
+        tag_key = (name, include_self)
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._contains_tag.get(tag_key) is None)
+        if self._contains_tag.get(tag_key) is None:
+            self._contains_tag[tag_key] = contains_tag(
+                self._element,
+                name,
+                include_self=include_self,
+            )
+        return self._contains_tag[tag_key]
+
+    def has_text_outside_tags(self, tags: list[str] | str) -> bool:
+        tag_names = tuple(tags if isinstance(tags, list) else [tags])
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=tag_names not in self._has_text_outside_tags)
+        if tag_names not in self._has_text_outside_tags:
+            self._has_text_outside_tags[tag_names] = has_text_outside_tags(
+                self._element,
+                tag_names,
+            )
+        return self._has_text_outside_tags[tag_names]
+
+    def count_tags(self, name: str) -> int:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._count_tags.get(name) is None)
+        if self._count_tags.get(name) is None:
+            self._count_tags[name] = count_tags(self._element, name)
+        return self._count_tags[name]
+
+    def is_unary_tree(self) -> bool:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._is_unary_tree is None)
+        if self._is_unary_tree is None:
+            self._is_unary_tree = is_unary_tree(self._element)
+        return self._is_unary_tree
+
+    def get_text_styles_metrics(self) -> dict[tuple[str, str], float]:
+        if _tracked_cache_access_counts:
+            _count_cache_access(miss=self._text_styles_metrics is None)
+        if self._text_styles_metrics is None:
+            self._text_styles_metrics = compute_text_styles_metrics(
+                self._element,
+                self._effective_styles_table,
+            )
+        return self._text_styles_metrics
+
+    def _compute_table_grid(self) -> TableGrid:
+        return get_table_grid(self._element)
+
+    def count_text_matches_in_descendants(
+        self,
+        predicate: Callable[[str], bool],
+        *,
+        exclude_links: bool | None = None,
+    ) -> int:
+        return count_text_matches_in_descendants(
+            self._element,
+            predicate,
+            exclude_links=exclude_links,
+        )
+
+    @classmethod
+    def _create_parent_tag(
+        cls,
+        parent_tag_name: str,
+        html_tags: tuple[HtmlTag, ...],
+    ) -> HtmlTag:
+        elements = [tag._element for tag in html_tags]  # type: ignore[attr-defined] # noqa: SLF001
+        return LxmlHtmlTag(wrap_tags_in_new_parent(parent_tag_name, elements))
+
+    @staticmethod
+    def _to_element(node: ChildNode) -> etree._Element:
+        if is_element(node):
+            return node  # type: ignore[return-value]
+        if isinstance(node, str) or node.tag in (
+            etree.Comment,
+            etree.ProcessingInstruction,
+        ):
+            string = get_node_string(node)
+            if string.strip() == "":
+                msg = "NavigableString is empty"
+                raise EmptyNavigableStringError(msg)
+            element = etree.Element("span")
+            element.text = string
+            logger.trace("Converting string node to lxml element <span>")
+            return element
+        msg = f"Unsupported element type: {type(node).__name__}"
+        raise TypeError(msg)
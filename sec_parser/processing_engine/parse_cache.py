@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import pickle
+import re
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import xxhash
+
+from sec_parser.exceptions import SecParserValueError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+DEFAULT_MAX_SIZE = 1024**3
+
+CACHE_FILE_SUFFIX = ".pickle"
+
+# Objects nested deeper than this are only described by their type.
+MAX_FINGERPRINT_DEPTH = 8
+
+
+class ParseCache:
+    """
+    The ParseCache class is a persistent, content-addressed cache of parsing
+    results, stored as one pickle file per document in `directory`.
+
+    The cache key combines the hash of the raw HTML, the sec-parser version,
+    and a fingerprint of the parser configuration (see `get_fingerprint`).
+    Once the files exceed `max_size` bytes in total, the least recently used
+    ones are evicted. The total size is scanned once, and then tracked from the
+    written files, so the files written by other processes are only taken into
+    account when the directory is scanned again, i.e. on eviction.
+
+    The cached elements are unpickled, so their HtmlTag objects are detached
+    from the document and rebuilt from their source code when needed.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if max_size < 0:
+            msg = f"max_size must be equal or greater than 0, got {max_size}"
+            raise SecParserValueError(msg)
+        self._directory = Path(directory)
+        self._max_size = max_size
+        # Total size of the files, or None until the directory is scanned.
+        self._total_size: int | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get_key(self, html: str | bytes, fingerprint: str) -> str:
+        raw = html.encode("utf-8", "surrogatepass") if isinstance(html, str) else html
+        key = xxhash.xxh3_128(raw)
+        key.update(f"\0{get_sec_parser_version()}\0{fingerprint}".encode())
+        return key.hexdigest()
+
+    def get(self, key: str) -> list[AbstractSemanticElement] | None:
+        path = self._get_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        with contextlib.suppress(FileNotFoundError):
+            # The modification time is used to find the least recently used files.
+            os.utime(path)
+        return pickle.loads(data)  # noqa: S301
+
+    def set(self, key: str, elements: list[AbstractSemanticElement]) -> None:
+        data = pickle.dumps(elements, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self._max_size:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so that concurrent readers,
+        # e.g. the workers of `parse_many`, never see partial files.
+        path = self._get_path(key)
+        fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            replaced_size = _get_size(path)
+            Path(temp_path).replace(path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        if self._total_size is None:
+            self.evict()
+            return
+        self._total_size += len(data) - replaced_size
+        if self._total_size > self._max_size:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the cache fits in max_size."""
+        files = []
+        for path in self._directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+            with contextlib.suppress(FileNotFoundError):
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if total_size <= self._max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+        self._total_size = total_size
+
+    def clear(self) -> None:
+        for path in self._directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+        self._total_size = None
+
+    def _get_path(self, key: str) -> Path:
+        return self._directory / f"{key}{CACHE_FILE_SUFFIX}"
+
+
+def _get_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def get_sec_parser_version() -> str:
+    try:
+        return version("sec-parser")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def get_fingerprint(obj: object) -> str:
+    """
+    Return a deterministic description of the configuration of an object,
+    e.g. of the processing steps, that is stable across processes.
+
+    Objects are described by their class and attributes, functions and
+    classes by their qualified names, and unordered collections are sorted.
+    """
+    return _describe(obj, depth=0, seen=set())
+
+
+def _describe(obj: Any, *, depth: int, seen: set[int]) -> str:  # noqa: ANN401, PLR0911
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes, re.Pattern)):
+        return repr(obj)
+    if isinstance(obj, type) or (callable(obj) and hasattr(obj, "__qualname__")):
+        owner = getattr(obj, "__self__", None)
+        prefix = "" if owner is None else f"{_get_name(type(owner))}:"
+        return f"{prefix}{_get_name(obj)}"
+    if depth > MAX_FINGERPRINT_DEPTH or id(obj) in seen:
+        return _get_name(type(obj))
+
+    seen = seen | {id(obj)}
+
+    def describe(value: object) -> str:
+        return _describe(value, depth=depth + 1, seen=seen)
+
+    if isinstance(obj, (list, tuple)):
+        return f"[{','.join(describe(v) for v in obj)}]"
+    if isinstance(obj, (set, frozenset)):
+        return f"{{{','.join(sorted(describe(v) for v in obj))}}}"
+    if isinstance(obj, dict):
+        items = sorted(f"{describe(k)}:{describe(v)}" for k, v in obj.items())
+        return f"{{{','.join(items)}}}"
+    attributes = getattr(obj, "__dict__", None)
+    if attributes is None:
+        return _get_name(type(obj))
+    return f"{_get_name(type(obj))}({describe(attributes)})"
+
+
+def _get_name(obj: Any) -> str:  # noqa: ANN401
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', '')}"
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+from sec_parser.exceptions import SecParserRuntimeError, SecParserValueError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.processing_engine.core import AbstractSemanticElementParser
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+# Either the HTML markup of a document, or the path of an HTML file.
+HtmlOrPath = Union[str, bytes, "os.PathLike[str]"]
+
+ParseManyResult = tuple[int, list["AbstractSemanticElement"]]
+
+# Number of chunks that are queued per worker, so that the workers never wait
+# for the next chunk, without reading all the documents into memory upfront.
+PENDING_CHUNKS_PER_WORKER = 2
+
+# Parser and parsing arguments of the current worker process, set once
+# by the pool initializer instead of being sent along with every chunk.
+_worker_parser: AbstractSemanticElementParser | None = None
+_worker_parse_kwargs: dict[str, Any] = {}
+
+
+def parse_many(
+    parser: AbstractSemanticElementParser,
+    htmls_or_paths: Iterable[HtmlOrPath],
+    *,
+    workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    **parse_kwargs: bool | None,
+) -> Iterator[ParseManyResult]:
+    """
+    Parse many documents with a pool of worker processes, yielding the index
+    of each document in `htmls_or_paths` together with its semantic elements.
+
+    `workers` defaults to the number of CPUs. With a single worker, the
+    documents are parsed in the current process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        msg = f"workers must be equal or greater than 1, got {workers}"
+        raise SecParserValueError(msg)
+    if chunksize < 1:
+        msg = f"chunksize must be equal or greater than 1, got {chunksize}"
+        raise SecParserValueError(msg)
+    return _parse_many(
+        parser,
+        _iter_chunks(enumerate(htmls_or_paths), chunksize),
+        workers=workers,
+        ordered=ordered,
+        parse_kwargs=parse_kwargs,
+    )
+
+
+def _parse_many(
+    parser: AbstractSemanticElementParser,
+    chunks: Iterator[list[tuple[int, HtmlOrPath]]],
+    *,
+    workers: int,
+    ordered: bool,
+    parse_kwargs: dict[str, Any],
+) -> Iterator[ParseManyResult]:
+    if workers == 1:
+        for chunk in chunks:
+            yield from _parse_chunk_with(parser, chunk, parse_kwargs)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(parser, parse_kwargs),
+    ) as executor:
+        pending_limit = workers * PENDING_CHUNKS_PER_WORKER
+        try:
+            if ordered:
+                yield from _iter_ordered(executor, chunks, pending_limit)
+            else:
+                yield from _iter_as_completed(executor, chunks, pending_limit)
+        finally:
+            # Do not parse the remaining documents on errors or early exits.
+            executor.shutdown(cancel_futures=True)
+
+
+def _iter_ordered(
+    executor: ProcessPoolExecutor,
+    chunks: Iterator[list[tuple[int, HtmlOrPath]]],
+    pending_limit: int,
+) -> Iterator[ParseManyResult]:
+    pending: deque[Future[list[ParseManyResult]]] = deque(
+        executor.submit(_parse_chunk, chunk)
+        for chunk in islice(chunks, pending_limit)
+    )
+    while pending:
+        results = pending.popleft().result()
+        for chunk in islice(chunks, 1):
+            pending.append(executor.submit(_parse_chunk, chunk))
+        yield from results
+
+
+def _iter_as_completed(
+    executor: ProcessPoolExecutor,
+    chunks: Iterator[list[tuple[int, HtmlOrPath]]],
+    pending_limit: int,
+) -> Iterator[ParseManyResult]:
+    pending: set[Future[list[ParseManyResult]]] = {
+        executor.submit(_parse_chunk, chunk)
+        for chunk in islice(chunks, pending_limit)
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for chunk in islice(chunks, len(done)):
+            pending.add(executor.submit(_parse_chunk, chunk))
+        for future in done:
+            yield from future.result()
+
+
+def _iter_chunks(
+    items: Iterator[tuple[int, HtmlOrPath]],
+    chunksize: int,
+) -> Iterator[list[tuple[int, HtmlOrPath]]]:
+    while chunk := list(islice(items, chunksize)):
+        yield chunk
+
+
+def _init_worker(
+    parser: AbstractSemanticElementParser,
+    parse_kwargs: dict[str, Any],
+) -> None:
+    global _worker_parser, _worker_parse_kwargs  # noqa: PLW0603
+    _worker_parser = parser
+    _worker_parse_kwargs = parse_kwargs
+
+
+def _parse_chunk(chunk: list[tuple[int, HtmlOrPath]]) -> list[ParseManyResult]:
+    if _worker_parser is None:  # pragma: no cover
+        msg = "Worker process was not initialized"
+        raise SecParserRuntimeError(msg)
+    return list(_parse_chunk_with(_worker_parser, chunk, _worker_parse_kwargs))
+
+
+def _parse_chunk_with(
+    parser: AbstractSemanticElementParser,
+    chunk: list[tuple[int, HtmlOrPath]],
+    parse_kwargs: dict[str, Any],
+) -> Iterator[ParseManyResult]:
+    for index, html_or_path in chunk:
+        html = (
+            Path(html_or_path).read_bytes()
+            if isinstance(html_or_path, os.PathLike)
+            else html_or_path
+        )
+        yield index, parser.parse(html, **parse_kwargs)
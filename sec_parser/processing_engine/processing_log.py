@@ -1,6 +1,8 @@
-import copy
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Any, Union
+from enum import Enum
+from typing import Any, Callable, Union
 
 from loguru import logger
 
@@ -8,6 +10,21 @@ LogItemOrigin = str
 LogItemPayload = Union[str, dict[str, Any]]
 
 
+class ProcessingLogLevel(Enum):
+    """
+    ProcessingLogLevel defines how much is recorded in the processing logs.
+
+    - OFF: Nothing is recorded, and no messages are built.
+    - SUMMARY: Only the creation of elements, e.g. the conversion of an element
+      into another type, is recorded, along with the origin of the change.
+    - FULL: The details reported by the steps and checks are recorded as well.
+    """
+
+    OFF = "off"
+    SUMMARY = "summary"
+    FULL = "full"
+
+
 @dataclass(frozen=True)
 class LogItem:
     origin: LogItemOrigin
@@ -15,21 +32,102 @@ class LogItem:
 
 
 class ProcessingLog:
-    def __init__(self) -> None:
+    """
+    ProcessingLog records how an element was processed.
+
+    Copies share the items of the original log instead of duplicating them:
+    a copy only stores the items added to it, along with a link to the
+    original log and the number of the original log's items it contains.
+
+    Note: As the items are shared, their payloads must not be mutated.
+    """
+
+    def __init__(
+        self,
+        *,
+        level: ProcessingLogLevel = ProcessingLogLevel.FULL,
+    ) -> None:
+        self._level = level
         self._log: list[LogItem] = []
 
+        # The log this log was copied from, and the number of its own items
+        # that are shared with this log.
+        self._parent: ProcessingLog | None = None
+        self._parent_length = 0
+
+    @property
+    def level(self) -> ProcessingLogLevel:
+        """
+        The level of the log. It cannot be changed, as the logs with the
+        OFF level are a single shared instance, see `create`.
+        """
+        return self._level
+
+    @classmethod
+    def create(cls, level: ProcessingLogLevel) -> ProcessingLog:
+        """
+        Create a log with the given level. As nothing is recorded when the
+        level is OFF, all such logs are a single shared instance.
+        """
+        if level is ProcessingLogLevel.OFF:
+            return _DISABLED_PROCESSING_LOG
+        return cls(level=level)
+
     def add_item(
         self,
         *,
-        message: LogItemPayload,
+        message: LogItemPayload | Callable[[], LogItemPayload],
         log_origin: LogItemOrigin,
+        is_summary: bool = False,
     ) -> None:
-        logger.trace("Adding log item: {}", str(message))
+        """
+        Record an item. The message can be given as a callable, so that it is
+        only built when the item is recorded according to the level of the log.
+        Items are only recorded at the SUMMARY level if `is_summary` is True.
+        """
+        level = self._level
+        if level is ProcessingLogLevel.OFF or (
+            level is ProcessingLogLevel.SUMMARY and not is_summary
+        ):
+            return
+        if callable(message):
+            message = message()
+        logger.trace("Adding log item: {}", message)
         log_item = LogItem(log_origin, message)
         self._log.append(log_item)
 
     def get_items(self) -> tuple[LogItem, ...]:
-        return tuple(self._log)
+        # Collect the linked logs without recursion, each with the number
+        # of its own items that are visible from this log.
+        logs: list[tuple[ProcessingLog, int]] = []
+        log: ProcessingLog | None = self
+        length = len(self._log)
+        while log is not None:
+            logs.append((log, length))
+            length = log._parent_length  # noqa: SLF001
+            log = log._parent  # noqa: SLF001
+
+        items: list[LogItem] = []
+        for log_, length_ in reversed(logs):
+            items.extend(log_._log[:length_])  # noqa: SLF001
+        return tuple(items)
+
+    def copy(self) -> ProcessingLog:
+        """
+        Return a copy of the log. Items added to the copy are not visible
+        in the original log, and vice versa.
+        """
+        if self.level is ProcessingLogLevel.OFF:
+            return self
+        log = ProcessingLog(level=self.level)
+        if self._log:
+            log._parent = self
+            log._parent_length = len(self._log)
+        else:
+            # Share the same items directly, which keeps the chains short.
+            log._parent = self._parent
+            log._parent_length = self._parent_length
+        return log
+
 
-    def copy(self) -> "ProcessingLog":
-        return copy.deepcopy(self)
+_DISABLED_PROCESSING_LOG = ProcessingLog(level=ProcessingLogLevel.OFF)
@@ -1,7 +1,18 @@
 from dataclasses import dataclass
 
+from sec_parser.processing_engine.processing_log import ProcessingLogLevel
+
 
 @dataclass(frozen=True)
 class ParsingOptions:
     # Integrity checks are disabled by default to improve performance
     html_integrity_checks: bool = False
+
+    # Replace the HtmlTag of every resulting element with a detached copy
+    # that keeps only the source code, text, hash and table metrics, so that
+    # the parsed document can be garbage collected.
+    detach_html_tags: bool = False
+
+    # How much is recorded in the processing logs of the elements. Disabling
+    # the logs avoids building a log message for every element and step.
+    processing_log_level: ProcessingLogLevel = ProcessingLogLevel.FULL
@@ -11,7 +11,9 @@ from sec_parser.processing_steps.abstract_classes.processing_context import (
 )
 from sec_parser.semantic_elements.composite_semantic_element import (
     CompositeSemanticElement,
+    get_inner_elements,
 )
+from sec_parser.utils.traversal import iter_postorder
 
 if TYPE_CHECKING:  # pragma: no cover
     from sec_parser.semantic_elements.abstract_semantic_element import (
@@ -36,13 +38,12 @@ class AbstractElementBatchProcessingStep(AbstractProcessingStep):
         *,
         _context: ElementProcessingContext,
     ) -> list[AbstractSemanticElement]:
-        for element in elements:
+        # The inner elements of a composite element are processed before the
+        # elements that contain it, as in a post-order traversal.
+        for element, _ in iter_postorder(elements, get_inner_elements):
             if isinstance(element, CompositeSemanticElement):
                 element.inner_elements = tuple(
-                    self._process_recursively(
-                        list(element.inner_elements),
-                        _context=_context,
-                    ),
+                    self._process_elements(list(element.inner_elements), _context),
                 )
         return self._process_elements(elements, _context)
 
@@ -16,14 +16,23 @@ from sec_parser.semantic_elements.composite_semantic_element import (
     CompositeSemanticElement,
 )
 from sec_parser.semantic_elements.semantic_elements import ErrorWhileProcessingElement
+from sec_parser.utils.traversal import iter_preorder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
 
 MODULE_LOGGER_NAME = __name__
 
+# Decisions stored in the dispatch table of AbstractElementwiseProcessingStep,
+# telling what to do with an element of a given class.
+SKIP = 0
+PROCESS = 1
+RECURSE = 2
+
 
 class AbstractElementwiseProcessingStep(AbstractProcessingStep):
     """
@@ -36,6 +45,12 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
     # change the iteration count.
     _NUM_ITERATIONS = 1
 
+    # Set _HAS_CROSS_ELEMENT_DEPENDENCIES to False in subclasses whose
+    # transformation of an element depends on nothing but the element itself.
+    # Consecutive steps like these are fused into a single traversal of the
+    # elements by `fuse_elementwise_steps`.
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = True
+
     def __init__(
         self,
         *,
@@ -49,6 +64,10 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
         self._types_to_exclude = types_to_exclude or set()
         self._types_to_exclude.add(ErrorWhileProcessingElement)
 
+        # Maps each concrete element class to its decision (SKIP, PROCESS or
+        # RECURSE), so that the type filters are only evaluated once per class.
+        self._decisions: dict[type[AbstractSemanticElement], int] = {}
+
     @abstractmethod
     def _process_element(
         self,
@@ -64,44 +83,99 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def _get_decision(self, cls: type[AbstractSemanticElement]) -> int:
+        """
+        Return the decision for elements of the given class, based on
+        `types_to_process` and `types_to_exclude`. The decision is computed
+        once per class and cached.
+        """
+        decision = self._decisions.get(cls)
+        if decision is None:
+            if (
+                self._types_to_process
+                and not issubclass(cls, tuple(self._types_to_process))
+            ) or issubclass(cls, tuple(self._types_to_exclude)):
+                decision = SKIP
+            elif issubclass(cls, CompositeSemanticElement):
+                decision = RECURSE
+            else:
+                decision = PROCESS
+            self._decisions[cls] = decision
+        return decision
+
+    def _should_process(self, element: AbstractSemanticElement) -> bool:
+        """Check the element against `types_to_process` and `types_to_exclude`."""
+        return self._get_decision(type(element)) != SKIP
+
     def _process_recursively(
         self,
         elements: list[AbstractSemanticElement],
         *,
         _context: ElementProcessingContext,
     ) -> list[AbstractSemanticElement]:
-        for i, e in enumerate(elements):
-            # avoids lint error "`element` overwritten by assignment target"
-            element = e
+        decisions = self._decisions
+        # The processed elements by the id of the elements they replace.
+        replacements: dict[int, AbstractSemanticElement] = {}
+        # The composite elements whose inner elements are being processed,
+        # i.e. the ancestors of the current element.
+        composites: list[AbstractSemanticElement] = []
+        for element, depth in iter_preorder(elements, self._get_inner_elements):
+            while len(composites) > depth:
+                self._replace_inner_elements(composites.pop(), replacements)
+
+            decision = decisions.get(type(element))
+            if decision is None:
+                decision = self._get_decision(type(element))
+            if decision == SKIP:
+                continue
+            if decision == RECURSE:
+                composites.append(element)
+                continue
 
             try:
-                if self._types_to_process and not any(
-                    isinstance(element, t) for t in self._types_to_process
-                ):
-                    continue
-                if any(isinstance(element, t) for t in self._types_to_exclude):
-                    continue
-
-                if isinstance(element, CompositeSemanticElement):
-                    inner_elements = self._process_recursively(
-                        list(element.inner_elements),
-                        _context=_context,
-                    )
-                    element.inner_elements = tuple(inner_elements)
-                else:
-                    element = self._process_element(element, _context)
-
-                elements[i] = element
+                replacements[id(element)] = self._process_element(element, _context)
             except SecParserError as e:
                 logger.exception(e)
-                elements[i] = ErrorWhileProcessingElement.create_from_element(
-                    element,
-                    error=e,
-                    log_origin=self.__class__.__name__,
+                replacements[id(element)] = (
+                    ErrorWhileProcessingElement.create_from_element(
+                        element,
+                        error=e,
+                        log_origin=self.__class__.__name__,
+                    )
                 )
 
+        while composites:
+            self._replace_inner_elements(composites.pop(), replacements)
+        for i, element in enumerate(elements):
+            elements[i] = replacements.get(id(element), element)
         return elements
 
+    def _get_inner_elements(
+        self,
+        element: AbstractSemanticElement,
+    ) -> tuple[AbstractSemanticElement, ...]:
+        if self._decisions[type(element)] != RECURSE:
+            return ()
+        return element.inner_elements  # type: ignore[attr-defined]
+
+    def _replace_inner_elements(
+        self,
+        element: AbstractSemanticElement,
+        replacements: dict[int, AbstractSemanticElement],
+    ) -> None:
+        try:
+            element.inner_elements = tuple(  # type: ignore[attr-defined]
+                replacements.pop(id(e), e)
+                for e in element.inner_elements  # type: ignore[attr-defined]
+            )
+        except SecParserError as e:
+            logger.exception(e)
+            replacements[id(element)] = ErrorWhileProcessingElement.create_from_element(
+                element,
+                error=e,
+                log_origin=self.__class__.__name__,
+            )
+
     def _process(
         self,
         elements: list[AbstractSemanticElement],
@@ -113,3 +187,17 @@ class AbstractElementwiseProcessingStep(AbstractProcessingStep):
             self._process_recursively(elements, _context=context)
 
         return elements
+
+    def _process_iter(
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> Iterator[AbstractSemanticElement]:
+        if self._NUM_ITERATIONS != 1:
+            # Later iterations may depend on what was seen during the
+            # earlier ones, so the whole document is needed.
+            yield from super()._process_iter(elements)
+            return
+
+        context = ElementProcessingContext(iteration=0)
+        for element in elements:
+            yield from self._process_recursively([element], _context=context)
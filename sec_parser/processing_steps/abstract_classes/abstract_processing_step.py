@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from sec_parser.exceptions import SecParserRuntimeError
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
 ElementTransformer = Callable[[AbstractSemanticElement], AbstractSemanticElement]
 
 
@@ -44,6 +47,34 @@ class AbstractProcessingStep(ABC):
         Note: The `elements` argument could potentially be mutated for
         performance reasons.
         """
+        self._mark_as_processed()
+        return self._process(elements)
+
+    def process_iter(
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> Iterator[AbstractSemanticElement]:
+        """
+        Lazily transform a stream of semantic elements.
+
+        Steps that can transform each element on its own emit the elements
+        as they arrive. All other steps first consume the whole stream.
+        """
+        self._mark_as_processed()
+        return self._process_iter(elements)
+
+    def collect_statistics(  # noqa: B027
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> None:
+        """
+        Take elements that the step will not process into account in the
+        statistics that it collects across elements, e.g. the elements outside
+        of the sections requested from `parse_sections`, as left by the earlier
+        steps. Must be called before `process`. Does nothing by default.
+        """
+
+    def _mark_as_processed(self) -> None:
         if self._already_processed:
             msg = (
                 "This Step instance has already processed a document. "
@@ -54,7 +85,6 @@ class AbstractProcessingStep(ABC):
             raise AlreadyProcessedError(msg)
 
         self._already_processed = True
-        return self._process(elements)
 
     @abstractmethod
     def _process(
@@ -68,3 +98,13 @@ class AbstractProcessingStep(ABC):
         transformation logic.
         """
         raise NotImplementedError  # pragma: no cover
+
+    def _process_iter(
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> Iterator[AbstractSemanticElement]:
+        """
+        Transform a stream of elements. By default, the whole stream
+        is collected and passed to `_process`.
+        """
+        yield from self._process(list(elements))
@@ -27,6 +27,8 @@ class EmptyElementClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with IrrelevantElement instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         *,
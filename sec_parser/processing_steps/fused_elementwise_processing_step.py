@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from sec_parser.exceptions import SecParserError, SecParserValueError
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    RECURSE,
+    SKIP,
+    AbstractElementwiseProcessingStep,
+)
+from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
+    AbstractProcessingStep,
+)
+from sec_parser.processing_steps.abstract_classes.processing_context import (
+    ElementProcessingContext,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+from sec_parser.semantic_elements.semantic_elements import ErrorWhileProcessingElement
+from sec_parser.utils.traversal import iter_preorder
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+
+# Methods that a fusable step must inherit unchanged, as the fused step
+# calls `_process_element` directly instead.
+_TRAVERSAL_METHODS = (
+    "process",
+    "process_iter",
+    "_process",
+    "_process_iter",
+    "_process_recursively",
+    "_get_inner_elements",
+    "_replace_inner_elements",
+)
+
+
+class FusedElementwiseProcessingStep(AbstractProcessingStep):
+    """
+    FusedElementwiseProcessingStep runs several elementwise steps in a single
+    traversal of the elements, including the inner elements of composite
+    elements, instead of one traversal per step.
+
+    Each element goes through the steps in order before the next element is
+    processed. As every step still sees the elements in the same order, and
+    the steps do not depend on other elements, the result is the same as
+    running the steps one after another.
+    """
+
+    def __init__(self, steps: Iterable[AbstractElementwiseProcessingStep]) -> None:
+        super().__init__()
+        self._steps = tuple(steps)
+        for step in self._steps:
+            if not is_fusable(step):
+                msg = f"{step.__class__.__name__} cannot be fused with other steps"
+                raise SecParserValueError(msg)
+
+    @property
+    def steps(self) -> tuple[AbstractElementwiseProcessingStep, ...]:
+        return self._steps
+
+    def _mark_as_processed(self) -> None:
+        super()._mark_as_processed()
+        for step in self._steps:
+            step._mark_as_processed()  # noqa: SLF001
+
+    def _process(
+        self,
+        elements: list[AbstractSemanticElement],
+    ) -> list[AbstractSemanticElement]:
+        context = ElementProcessingContext(iteration=0)
+        return self._process_recursively(elements, self._steps, context)
+
+    def _process_iter(
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> Iterator[AbstractSemanticElement]:
+        context = ElementProcessingContext(iteration=0)
+        for element in elements:
+            yield from self._process_recursively([element], self._steps, context)
+
+    def _process_recursively(
+        self,
+        elements: list[AbstractSemanticElement],
+        steps: tuple[AbstractElementwiseProcessingStep, ...],
+        context: ElementProcessingContext,
+    ) -> list[AbstractSemanticElement]:
+        # The processed elements by the id of the elements they replace.
+        replacements: dict[int, AbstractSemanticElement] = {}
+        # The composite elements whose inner elements are being processed,
+        # i.e. the ancestors of the current element, with the ids of the
+        # elements they replace, and the steps that apply to the elements
+        # at each depth.
+        composites: list[tuple[int, CompositeSemanticElement]] = []
+        steps_by_depth = [steps]
+        # The inner elements of the last processed element, if any step applies
+        # to them. They are requested right after the element is processed.
+        inner_elements: tuple[AbstractSemanticElement, ...] = ()
+
+        def get_inner_elements(
+            _: AbstractSemanticElement,
+        ) -> tuple[AbstractSemanticElement, ...]:
+            return inner_elements
+
+        for e, depth in iter_preorder(elements, get_inner_elements):
+            while len(composites) > depth:
+                _replace_inner_elements(
+                    *composites.pop(),
+                    replacements,
+                    steps_by_depth.pop(),
+                )
+            element = e
+
+            # Steps that apply to a composite element are applied to its
+            # inner elements once the element went through all the steps.
+            inner_steps: list[AbstractElementwiseProcessingStep] = []
+            for step in steps_by_depth[depth]:
+                decision = step._get_decision(type(element))  # noqa: SLF001
+                if decision == SKIP:
+                    continue
+                if decision == RECURSE:
+                    inner_steps.append(step)
+                    continue
+                try:
+                    element = step._process_element(element, context)  # noqa: SLF001
+                except SecParserError as error:
+                    logger.exception(error)
+                    element = ErrorWhileProcessingElement.create_from_element(
+                        element,
+                        error=error,
+                        log_origin=step.__class__.__name__,
+                    )
+
+            if element is not e:
+                replacements[id(e)] = element
+            inner_elements = ()
+            if inner_steps and isinstance(element, CompositeSemanticElement):
+                inner_elements = element.inner_elements
+                composites.append((id(e), element))
+                steps_by_depth.append(tuple(inner_steps))
+
+        while composites:
+            _replace_inner_elements(
+                *composites.pop(),
+                replacements,
+                steps_by_depth.pop(),
+            )
+        for i, element in enumerate(elements):
+            elements[i] = replacements.get(id(element), element)
+        return elements
+
+
+def _replace_inner_elements(
+    key: int,
+    element: CompositeSemanticElement,
+    replacements: dict[int, AbstractSemanticElement],
+    steps: tuple[AbstractElementwiseProcessingStep, ...],
+) -> None:
+    """
+    Replace the processed inner elements of the composite element, which
+    replaces the element with the id `key`. Like the unfused steps, an error
+    turns the composite element into an ErrorWhileProcessingElement, reported
+    by the first step that processed the inner elements.
+    """
+    try:
+        element.inner_elements = tuple(
+            replacements.pop(id(e), e) for e in element.inner_elements
+        )
+    except SecParserError as error:
+        logger.exception(error)
+        replacements[key] = ErrorWhileProcessingElement.create_from_element(
+            element,
+            error=error,
+            log_origin=steps[0].__class__.__name__,
+        )
+
+
+def is_fusable(step: AbstractProcessingStep) -> bool:
+    """
+    Check whether the step is a single-pass elementwise step which declares
+    that it has no cross-element dependencies, and which does not customize
+    how the elements are traversed.
+    """
+    if not isinstance(step, AbstractElementwiseProcessingStep):
+        return False
+    cls = type(step)
+    return (
+        not cls._HAS_CROSS_ELEMENT_DEPENDENCIES
+        and cls._NUM_ITERATIONS == 1
+        and all(
+            getattr(cls, name) is getattr(AbstractElementwiseProcessingStep, name)
+            for name in _TRAVERSAL_METHODS
+        )
+    )
+
+
+def fuse_elementwise_steps(
+    steps: Iterable[AbstractProcessingStep],
+) -> list[AbstractProcessingStep]:
+    """
+    Replace every run of consecutive fusable steps (see `is_fusable`)
+    with a single FusedElementwiseProcessingStep.
+    """
+    result: list[AbstractProcessingStep] = []
+    run: list[AbstractElementwiseProcessingStep] = []
+
+    def flush() -> None:
+        if len(run) > 1:
+            result.append(FusedElementwiseProcessingStep(run))
+        else:
+            result.extend(run)
+        run.clear()
+
+    for step in steps:
+        if is_fusable(step):
+            run.append(step)  # type: ignore[arg-type]
+        else:
+            flush()
+            result.append(step)
+    flush()
+    return result
@@ -25,6 +25,8 @@ class HighlightedTextClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with HighlightedText instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         types_to_process: set[type[AbstractSemanticElement]] | None = None,
@@ -22,6 +22,8 @@ class ImageClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with ImageElement instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def _process_element(
         self,
         element: AbstractSemanticElement,
@@ -31,6 +31,8 @@ class IndividualSemanticElementExtractor(AbstractElementwiseProcessingStep):
     can hold significant meaning.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         *,
@@ -88,7 +90,9 @@ class IndividualSemanticElementExtractor(AbstractElementwiseProcessingStep):
             if contains_single_element is not None:
                 element.processing_log.add_item(
                     log_origin=check.__class__.__name__,
-                    message=f"Contains single element: {contains_single_element}",
+                    message=lambda result=contains_single_element: (
+                        f"Contains single element: {result}"
+                    ),
                 )
                 return contains_single_element
         return True
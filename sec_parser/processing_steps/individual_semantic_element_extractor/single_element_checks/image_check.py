@@ -21,10 +21,9 @@ class ImageCheck(AbstractSingleElementCheck):
         img_count = el_tag.count_tags("img")
 
         if img_count > 1:
-            msg = f"Detected multiple <img> tags ({img_count})"
             element.processing_log.add_item(
                 log_origin=self.__class__.__name__,
-                message=msg,
+                message=lambda: f"Detected multiple <img> tags ({img_count})",
             )
             return False
 
@@ -21,10 +21,9 @@ class TableCheck(AbstractSingleElementCheck):
         table_count = el_tag.count_tags("table")
 
         if table_count > 1:
-            msg = f"Detected multiple <table> tags ({table_count})"
             element.processing_log.add_item(
                 log_origin=self.__class__.__name__,
-                message=msg,
+                message=lambda: f"Detected multiple <table> tags ({table_count})",
             )
             return False
 
@@ -17,7 +17,7 @@ class XbrlTagCheck(AbstractSingleElementCheck):
         if element.html_tag.name.startswith("ix"):
             element.processing_log.add_item(
                 log_origin=self.__class__.__name__,
-                message=f"Detected XBRL tag {element.html_tag.name}",
+                message=lambda: f"Detected XBRL tag {element.html_tag.name}",
             )
             return False
 
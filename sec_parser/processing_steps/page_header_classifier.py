@@ -8,13 +8,24 @@ from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processin
     AbstractElementwiseProcessingStep,
     ElementProcessingContext,
 )
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+    get_inner_elements,
+)
 from sec_parser.semantic_elements.highlighted_text_element import (
     HighlightedTextElement,
     TextStyle,
 )
-from sec_parser.semantic_elements.semantic_elements import PageHeaderElement
+from sec_parser.semantic_elements.semantic_elements import (
+    NotYetClassifiedElement,
+    PageHeaderElement,
+    TextElement,
+)
+from sec_parser.utils.traversal import iter_preorder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
@@ -48,6 +59,25 @@ class PageHeaderClassifier(AbstractElementwiseProcessingStep):
         self._candidate_count: Counter[PageHeaderCandidate] = Counter()
         self._most_common_candidates: dict[PageHeaderCandidate, int] | None = None
 
+    def collect_statistics(
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> None:
+        """
+        Count the page header candidates among the given elements that are,
+        or are not yet classified as, text. The elements that are not
+        classified yet count as unstyled text.
+        """
+        for element, _ in iter_preorder(elements, get_inner_elements):
+            if isinstance(element, CompositeSemanticElement) or not isinstance(
+                element,
+                (NotYetClassifiedElement, TextElement, HighlightedTextElement),
+            ):
+                continue
+            candidate = self._get_candidate(element)
+            if candidate is not None:
+                self._candidate_count[candidate] += 1
+
     def _process_element(
         self,
         element: AbstractSemanticElement,
@@ -62,13 +92,19 @@ class PageHeaderClassifier(AbstractElementwiseProcessingStep):
         raise ValueError(msg)
 
     def _find_page_header_candidates(self, element: AbstractSemanticElement) -> None:
-        if len(element.text) > PageHeaderCandidate.TEXT_LENGTH_THRESHOLD:
+        candidate = self._get_candidate(element)
+        if candidate is None:
             return
-        style = element.style if isinstance(element, HighlightedTextElement) else None
-        candidate = PageHeaderCandidate(element.text, style)
         self._element_to_page_header_candidate[element] = candidate
         self._candidate_count[candidate] += 1
 
+    @staticmethod
+    def _get_candidate(element: AbstractSemanticElement) -> PageHeaderCandidate | None:
+        if len(element.text) > PageHeaderCandidate.TEXT_LENGTH_THRESHOLD:
+            return None
+        style = element.style if isinstance(element, HighlightedTextElement) else None
+        return PageHeaderCandidate(element.text, style)
+
     def _classify_elements(
         self,
         element: AbstractSemanticElement,
@@ -81,7 +117,7 @@ class PageHeaderClassifier(AbstractElementwiseProcessingStep):
             return element
 
         element.processing_log.add_item(
-            message=f"Matches one of the most common candidates: {candidate}",
+            message=lambda: f"Matches one of the most common candidates: {candidate}",
             log_origin=self.__class__.__name__,
         )
         return PageHeaderElement.create_from_element(
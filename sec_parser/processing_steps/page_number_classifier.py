@@ -9,9 +9,23 @@ from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processin
     AbstractElementwiseProcessingStep,
     ElementProcessingContext,
 )
-from sec_parser.semantic_elements.semantic_elements import PageNumberElement
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+    get_inner_elements,
+)
+from sec_parser.semantic_elements.highlighted_text_element import (
+    HighlightedTextElement,
+)
+from sec_parser.semantic_elements.semantic_elements import (
+    NotYetClassifiedElement,
+    PageNumberElement,
+    TextElement,
+)
+from sec_parser.utils.traversal import iter_preorder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
     from sec_parser.semantic_elements.abstract_semantic_element import (
         AbstractSemanticElement,
     )
@@ -53,6 +67,24 @@ class PageNumberClassifier(AbstractElementwiseProcessingStep):
             MostCommonCandidateSearchStatus.NOT_SEARCHED
         )
 
+    def collect_statistics(
+        self,
+        elements: Iterable[AbstractSemanticElement],
+    ) -> None:
+        """
+        Count the page number candidates among the given elements that are,
+        or are not yet classified as, text.
+        """
+        for element, _ in iter_preorder(elements, get_inner_elements):
+            if isinstance(element, CompositeSemanticElement) or not isinstance(
+                element,
+                (NotYetClassifiedElement, TextElement, HighlightedTextElement),
+            ):
+                continue
+            candidate = self._get_candidate(element)
+            if candidate is not None:
+                self._candidate_count[candidate] += 1
+
     def _process_element(
         self,
         element: AbstractSemanticElement,
@@ -67,22 +99,28 @@ class PageNumberClassifier(AbstractElementwiseProcessingStep):
         raise ValueError(msg)
 
     def _find_page_number_candidates(self, element: AbstractSemanticElement) -> None:
-        if len(element.text) > PageNumberCandidate.TEXT_LENGTH_THRESHOLD:
-            return
-        if not any(char.isdigit() for char in element.text):
-            return
-        text_without_digits = "".join(c for c in element.text if not c.isdigit())
-        if element.text == text_without_digits:
+        candidate = self._get_candidate(element)
+        if candidate is None:
             return
 
         element.processing_log.add_item(
             message="Identified as a page number candidate.",
             log_origin=self.__class__.__name__,
         )
-        candidate = PageNumberCandidate(text_without_digits)
         self._element_to_page_number_candidate[element] = candidate
         self._candidate_count[candidate] += 1
 
+    @staticmethod
+    def _get_candidate(element: AbstractSemanticElement) -> PageNumberCandidate | None:
+        if len(element.text) > PageNumberCandidate.TEXT_LENGTH_THRESHOLD:
+            return None
+        if not any(char.isdigit() for char in element.text):
+            return None
+        text_without_digits = "".join(c for c in element.text if not c.isdigit())
+        if element.text == text_without_digits:
+            return None
+        return PageNumberCandidate(text_without_digits)
+
     def _classify_elements(
         self,
         element: AbstractSemanticElement,
@@ -95,7 +133,7 @@ class PageNumberClassifier(AbstractElementwiseProcessingStep):
             return element
 
         element.processing_log.add_item(
-            message=f"Matches the most common (x{self._most_common_candidate_count}) candidate: {candidate}",
+            message=lambda: f"Matches the most common (x{self._most_common_candidate_count}) candidate: {candidate}",
             log_origin=self.__class__.__name__,
         )
         return PageNumberElement.create_from_element(
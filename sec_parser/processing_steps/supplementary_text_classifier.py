@@ -30,6 +30,8 @@ class SupplementaryTextClassifier(
     primarily by replacing suitable candidates with SupplementaryText instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         *,
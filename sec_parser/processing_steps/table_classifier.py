@@ -22,6 +22,8 @@ class TableClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with TableElement instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         *,
@@ -40,7 +42,7 @@ class TableClassifier(AbstractElementwiseProcessingStep):
         _: ElementProcessingContext,
     ) -> AbstractSemanticElement:
         if element.html_tag.contains_tag("table", include_self=True):
-            metrics = element.html_tag.get_approx_table_metrics()
+            metrics = element.html_tag.get_table_facts().metrics
             if metrics is None:
                 element.processing_log.add_item(
                     log_origin=self.__class__.__name__,
@@ -54,7 +56,7 @@ class TableClassifier(AbstractElementwiseProcessingStep):
                 )
             element.processing_log.add_item(
                 log_origin=self.__class__.__name__,
-                message=(
+                message=lambda: (
                     f"Skipping: Table has {metrics.rows} rows, which is below the "
                     f"threshold of {self._row_count_threshold}."
                 ),
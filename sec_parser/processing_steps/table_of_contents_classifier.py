@@ -24,6 +24,8 @@ class TableOfContentsClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with TableOfContentsElement instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         *,
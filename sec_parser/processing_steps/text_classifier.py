@@ -22,6 +22,8 @@ class TextClassifier(AbstractElementwiseProcessingStep):
     primarily by replacing suitable candidates with TextElement instances.
     """
 
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
     def __init__(
         self,
         *,
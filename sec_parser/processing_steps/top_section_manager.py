@@ -184,7 +184,7 @@ class TopSectionManager(AbstractElementwiseProcessingStep):
         if candidate is not None:
             self._candidates.append(candidate)
             element.processing_log.add_item(
-                message=f"Identified as candidate: {candidate.section_type.identifier}",
+                message=lambda: f"Identified as candidate: {candidate.section_type.identifier}",
                 log_origin=self.__class__.__name__,
             )
 
@@ -281,17 +281,15 @@ class TopSectionManager(AbstractElementwiseProcessingStep):
         return element
 
     def _update_last_order_number(self, element: AbstractSemanticElement, order: float) -> None:
-        message = f"this.order={order} last_order_number={self._last_order_number}."
         element.processing_log.add_item(
-            message=message,
+            message=lambda: f"this.order={order} last_order_number={self._last_order_number}.",
             log_origin=self.__class__.__name__,
         )
         self._last_order_number = order
 
     def _log_order_number_not_greater(self, element: AbstractSemanticElement, order: float) -> None:
-        message = f"Order number {order} is not greater than last order number {self._last_order_number}."
         element.processing_log.add_item(
-            message=message,
+            message=lambda: f"Order number {order} is not greater than last order number {self._last_order_number}.",
             log_origin=self.__class__.__name__,
         )
 
@@ -44,13 +44,21 @@ class AbstractSemanticElement(ABC):  # noqa: B024
         if log_origin:
             self.processing_log.add_item(
                 log_origin=log_origin,
-                message=self.to_dict(include_previews=False),
+                message=lambda: self.to_dict(include_previews=False),
+                is_summary=True,
             )
 
     @property
     def html_tag(self) -> HtmlTag:
         return self._html_tag
 
+    def detach(self) -> None:
+        """
+        Replace the HtmlTag with a copy detached from the document, so that
+        the element no longer keeps the whole document in memory.
+        """
+        self._html_tag = self._html_tag.to_detached()
+
     @classmethod
     def create_from_element(
         cls,
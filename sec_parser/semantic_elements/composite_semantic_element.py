@@ -6,6 +6,7 @@ from sec_parser.exceptions import SecParserValueError
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
+from sec_parser.utils.traversal import iter_preorder
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable
@@ -70,6 +71,11 @@ class CompositeSemanticElement(AbstractSemanticElement):
             raise SecParserValueError(msg)
         self._inner_elements = elements
 
+    def detach(self) -> None:
+        super().detach()
+        for element in self._inner_elements:
+            element.detach()
+
     @classmethod
     def create_from_element(
         cls,
@@ -107,24 +113,24 @@ class CompositeSemanticElement(AbstractSemanticElement):
         include_containers: bool | None = None,
     ) -> list[AbstractSemanticElement]:
         """
-        Recursively flatten a list of AbstractSemanticElement objects.
+        Flatten a list of AbstractSemanticElement objects, however deeply nested.
         For each CompositeSemanticElement encountered, its inner_elements
-        are also recursively flattened. The 'include_containers' parameter controls
+        are also flattened. The 'include_containers' parameter controls
         whether the CompositeSemanticElement itself is included in the flattened list.
         """
-        include_containers = False if include_containers is None else include_containers
-        flattened_elements = []
-        for e in elements:
-            if not isinstance(e, CompositeSemanticElement):
-                flattened_elements.append(e)
-                continue
-
-            if include_containers:
-                flattened_elements.append(e)
-            flattened_elements.extend(
-                cls.unwrap_elements(
-                    e.inner_elements,
-                    include_containers=include_containers,
-                ),
-            )
-        return flattened_elements
+        if include_containers:
+            return [e for e, _ in iter_preorder(elements, get_inner_elements)]
+        return [
+            e
+            for e, _ in iter_preorder(elements, get_inner_elements)
+            if not isinstance(e, CompositeSemanticElement)
+        ]
+
+
+def get_inner_elements(
+    element: AbstractSemanticElement,
+) -> tuple[AbstractSemanticElement, ...]:
+    """Get the inner elements of a composite element, or none for other elements."""
+    if isinstance(element, CompositeSemanticElement):
+        return element.inner_elements
+    return ()
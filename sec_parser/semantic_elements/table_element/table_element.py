@@ -11,6 +11,11 @@ from sec_parser.semantic_elements.abstract_semantic_element import (
 class TableElement(AbstractSemanticElement):
     """The TableElement class represents a standard table within a document."""
 
+    def detach(self) -> None:
+        # The table facts are kept by the detached HtmlTag.
+        self.html_tag.get_table_facts()
+        super().detach()
+
     def get_summary(self) -> str:
         """
         Return a human-readable summary of the semantic element.
@@ -18,7 +23,7 @@ class TableElement(AbstractSemanticElement):
         This method aims to provide a simplified, human-friendly representation of
         the underlying HtmlTag.
         """
-        metrics = self.html_tag.get_approx_table_metrics()
+        metrics = self.html_tag.get_table_facts().metrics
         if metrics is None:
             return "Table with {len(self.text)} characters."
         return (
@@ -38,7 +43,7 @@ class TableElement(AbstractSemanticElement):
             include_contents=include_contents,
         )
         if include_previews is not False:
-            metrics = self.html_tag.get_approx_table_metrics()
+            metrics = self.html_tag.get_table_facts().metrics
             result_dict["metrics"] = asdict(metrics) if metrics is not None else None
         return result_dict
 
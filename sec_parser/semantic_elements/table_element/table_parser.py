@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from io import StringIO
 
+import numpy as np
 import pandas as pd
+from lxml import etree
+from pandas.errors import EmptyDataError
+
+from sec_parser.utils.lxml_.table_grid import get_table_grid
 
 
 class TableParser:
@@ -11,14 +16,7 @@ class TableParser:
 
     @staticmethod
     def _basic_preprocessing(html: str) -> pd.DataFrame:
-        if not isinstance(html, pd.DataFrame):
-            tables = pd.read_html(StringIO(html), flavor="lxml")
-            if len(tables) == 0:
-                msg = "No tables found"
-                raise ValueError(msg)
-            table = tables[0]
-        else:
-            table = html
+        table = html if isinstance(html, pd.DataFrame) else _read_first_table(html)
         table = table.dropna(how="all")
         table.columns = pd.Index(table.iloc[0].tolist())
         table = table[1:]
@@ -35,55 +33,62 @@ class TableParser:
 
     @staticmethod
     def _remove_blank_columns(df: pd.DataFrame) -> pd.DataFrame:
-        columns_to_remove = []
-        for i, _ in enumerate(df.columns):
-            if i < len(df.columns) - 1:
-                current_column = df.columns[i]
-                next_column = df.columns[i + 1]
-                non_empty_rows = df[
-                    (df[current_column] != "") & (df[next_column] != "")
-                ]
-                if (
-                    non_empty_rows[current_column] == non_empty_rows[next_column]
-                ).all():
-                    if (df[current_column] == "").sum() >= (
-                        df[next_column] == ""
-                    ).sum():
-                        columns_to_remove.append(current_column)
-                    else:
-                        columns_to_remove.append(next_column)
-        return df.drop(columns=columns_to_remove)
+        """
+        Remove one column of each pair of adjacent columns that have the same
+        values in the rows where both are non-empty: the one with the most
+        empty values, or the first one if both have as many.
+        """
+        values = df.to_numpy(dtype=object)
+        left, right = values[:, :-1], values[:, 1:]
+        both_non_empty = (left != "") & (right != "")
+        is_duplicate = ((left == right) | ~both_non_empty).all(axis=0)
+        empty_counts = (values == "").sum(axis=0)
+        removes_left = empty_counts[:-1] >= empty_counts[1:]
+
+        to_remove = np.zeros(values.shape[1], dtype=bool)
+        to_remove[:-1] |= is_duplicate & removes_left
+        to_remove[1:] |= is_duplicate & ~removes_left
+        return df.drop(columns=df.columns[to_remove])
 
     @staticmethod
     def _merge_columns_by_marker(table: pd.DataFrame, marker: str) -> pd.DataFrame:
-        for i, _ in enumerate(table.columns):
-            if i < len(table.columns) - 1:
-                current_column = table.columns[i]
-                next_column = table.columns[i + 1]
-                non_marker_rows = table[
-                    (table[current_column] != marker) & (table[next_column] != marker)
-                ]
-                non_empty_non_marker_rows = non_marker_rows[
-                    (non_marker_rows[current_column] != "")
-                    & (non_marker_rows[next_column] != "")
-                ]
-                marker_rows = table.drop(non_empty_non_marker_rows.index)
-                marker_rows_indices = marker_rows.index
-                if (
-                    non_empty_non_marker_rows[current_column]
-                    == non_empty_non_marker_rows[next_column]
-                ).all():
-                    table.loc[marker_rows_indices, current_column] = (
-                        table.loc[marker_rows_indices, current_column]
-                        .str.cat(
-                            table.loc[marker_rows_indices, next_column],
-                            sep="",
-                            na_rep="",
-                        )
-                        .str.strip()
-                    )
-                    table = table.drop(columns=[next_column])
-        return table
+        """
+        Merge the adjacent columns that have the same values in the rows where
+        both are non-empty and differ from the marker, e.g. a "$" column and
+        the column of the amounts. In the other rows, the values of both
+        columns are concatenated. The pairs are taken from left to right,
+        and a merged column is not merged again.
+        """
+        values = table.to_numpy(dtype=object)
+        left, right = values[:, :-1], values[:, 1:]
+        is_compared = (
+            (left != marker) & (right != marker) & (left != "") & (right != "")
+        )
+        can_merge = ((left == right) | ~is_compared).all(axis=0)
+
+        merged_columns = []
+        column = 0
+        while column < len(can_merge):
+            if can_merge[column]:
+                merged_columns.append(column)
+                column += 2
+            else:
+                column += 1
+        if not merged_columns:
+            return table
+
+        to_keep = np.ones(values.shape[1], dtype=bool)
+        to_keep[np.add(merged_columns, 1)] = False
+        for column in merged_columns:
+            rows = ~is_compared[:, column]
+            values[rows, column] = _strip(
+                values[rows, column] + values[rows, column + 1],
+            )
+        return pd.DataFrame(
+            values[:, to_keep],
+            index=table.index,
+            columns=table.columns[to_keep],
+        )
 
     def parse_as_df(self) -> pd.DataFrame:
         table = self._basic_preprocessing(self._html)
@@ -95,3 +100,34 @@ class TableParser:
             dtype=str,
         )
         return table
+
+
+_strip = np.frompyfunc(str.strip, 1, 1)
+
+
+def _read_first_table(html: str) -> pd.DataFrame:
+    """
+    Read the first table of the HTML in the same way as pandas.read_html,
+    from a single lxml parse and without serializing the table again.
+    """
+    parser = etree.HTMLParser(recover=True)
+    root = etree.parse(StringIO(html), parser).getroot()
+    found = False
+    if root is not None:
+        for table in root.iter("table"):
+            if "display:none" in table.get("style", "").replace(" ", ""):
+                continue
+            grid = get_table_grid(table)
+            if not grid.has_text:
+                continue
+            found = True
+            try:
+                return grid.to_dataframe()
+            except EmptyDataError:
+                continue
+    if not found:
+        msg = "No tables found matching regex '.+'"
+        raise ValueError(msg)
+    # Like pandas.read_html, the tables without columns are skipped.
+    msg = "No tables found"
+    raise ValueError(msg)
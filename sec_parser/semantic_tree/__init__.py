@@ -8,19 +8,22 @@ from sec_parser.semantic_tree.nesting_rules import (
     AlwaysNestAsParentRule,
     NestSameTypeDependingOnLevelRule,
 )
-from sec_parser.semantic_tree.render_ import render
+from sec_parser.semantic_tree.render_ import render, render_to_stream
 from sec_parser.semantic_tree.semantic_tree import SemanticTree
 from sec_parser.semantic_tree.tree_builder import TreeBuilder
+from sec_parser.semantic_tree.tree_index import SemanticTreeIndex
 from sec_parser.semantic_tree.tree_node import TreeNode
 
 __all__ = [
     "AbstractNestingRule",
     "NestSameTypeDependingOnLevelRule",
     "SemanticTree",
+    "SemanticTreeIndex",
     "TreeBuilder",
     "TreeNode",
     "AlwaysNestAsParentRule",
     "NestSameTypeDependingOnLevelRule",
     "AlwaysNestAsChildRule",
     "render",
+    "render_to_stream",
 ]
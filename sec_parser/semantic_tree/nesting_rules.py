@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -19,6 +20,13 @@ class AbstractNestingRule(ABC):
 
     In case of conflicts between rules, they should be resolved through
     parameters like exclude_parents and exclude_children.
+
+    Rules that only depend on the types of the elements should also implement
+    `_should_be_nested_under_types`, so that their decisions can be computed
+    once per pair of types when building a tree. It is only used if it is
+    defined by the same class as `_should_be_nested_under`, or by a subclass:
+    a subclass that only overrides `_should_be_nested_under` is evaluated
+    per pair of elements.
     """
 
     def __init__(
@@ -46,6 +54,37 @@ class AbstractNestingRule(ABC):
             return False
         return self._should_be_nested_under(parent, child)
 
+    def should_be_nested_under_types(
+        self,
+        parent_cls: type[AbstractSemanticElement],
+        child_cls: type[AbstractSemanticElement],
+    ) -> bool | None:
+        """
+        Decide whether the elements of the given types should be nested, without
+        looking at the elements themselves. Returns None if the decision depends
+        on the elements, in which case `should_be_nested_under` has to be called.
+        """
+        if not _has_type_level_decisions(type(self)):
+            return None
+        if self._exclude_parents and issubclass(
+            parent_cls,
+            tuple(self._exclude_parents),
+        ):
+            return False
+        if self._exclude_children and issubclass(
+            child_cls,
+            tuple(self._exclude_children),
+        ):
+            return False
+        return self._should_be_nested_under_types(parent_cls, child_cls)
+
+    def _should_be_nested_under_types(
+        self,
+        parent_cls: type[AbstractSemanticElement],  # noqa: ARG002
+        child_cls: type[AbstractSemanticElement],  # noqa: ARG002
+    ) -> bool | None:
+        return None
+
     @abstractmethod
     def _should_be_nested_under(
         self,
@@ -55,6 +94,26 @@ class AbstractNestingRule(ABC):
         raise NotImplementedError  # pragma: no cover
 
 
+def _get_defining_class(cls: type, name: str) -> type:
+    return next(c for c in cls.__mro__ if name in c.__dict__)
+
+
+@functools.cache
+def _has_type_level_decisions(cls: type[AbstractNestingRule]) -> bool:
+    """
+    Check that the type-level decisions of the rule class match its
+    per-element decisions, i.e. that neither `should_be_nested_under` nor
+    `_should_be_nested_under` is overridden below the class that defines
+    `_should_be_nested_under_types`.
+    """
+    if cls.should_be_nested_under is not AbstractNestingRule.should_be_nested_under:
+        return False
+    return issubclass(
+        _get_defining_class(cls, "_should_be_nested_under_types"),
+        _get_defining_class(cls, "_should_be_nested_under"),
+    )
+
+
 class AlwaysNestAsParentRule(AbstractNestingRule):
     def __init__(
         self,
@@ -77,6 +136,16 @@ class AlwaysNestAsParentRule(AbstractNestingRule):
     ) -> bool:
         return isinstance(parent, self._cls) and not isinstance(child, self._cls)
 
+    def _should_be_nested_under_types(
+        self,
+        parent_cls: type[AbstractSemanticElement],
+        child_cls: type[AbstractSemanticElement],
+    ) -> bool | None:
+        return issubclass(parent_cls, self._cls) and not issubclass(
+            child_cls,
+            self._cls,
+        )
+
 
 class AlwaysNestAsChildRule(AbstractNestingRule):
     def __init__(
@@ -100,6 +169,16 @@ class AlwaysNestAsChildRule(AbstractNestingRule):
     ) -> bool:
         return not isinstance(parent, self._cls) and isinstance(child, self._cls)
 
+    def _should_be_nested_under_types(
+        self,
+        parent_cls: type[AbstractSemanticElement],
+        child_cls: type[AbstractSemanticElement],
+    ) -> bool | None:
+        return not issubclass(parent_cls, self._cls) and issubclass(
+            child_cls,
+            self._cls,
+        )
+
 
 class NestSameTypeDependingOnLevelRule(AbstractNestingRule):
     def _should_be_nested_under(
@@ -115,3 +194,63 @@ class NestSameTypeDependingOnLevelRule(AbstractNestingRule):
             # level 1 is the top-most (root) level
             and parent.level < child.level
         )
+
+    def _should_be_nested_under_types(
+        self,
+        parent_cls: type[AbstractSemanticElement],
+        child_cls: type[AbstractSemanticElement],
+    ) -> bool | None:
+        if parent_cls == child_cls and issubclass(parent_cls, AbstractLevelElement):
+            # Depends on the levels of the elements.
+            return None
+        return False
+
+
+class NestingRuleTable:
+    """
+    NestingRuleTable evaluates a list of nesting rules like `any` would, from
+    the decisions of the rules for each pair of parent and child types. The
+    decisions are computed the first time a pair of types is seen; only the
+    rules that depend on the elements themselves are then evaluated per pair
+    of elements.
+    """
+
+    def __init__(self, rules: list[AbstractNestingRule]) -> None:
+        self._rules = rules
+        # Maps each (parent type, child type) pair either to True, or to the
+        # rules that remain to be evaluated, none meaning False.
+        self._table: dict[
+            tuple[type[AbstractSemanticElement], type[AbstractSemanticElement]],
+            bool | tuple[AbstractNestingRule, ...],
+        ] = {}
+
+    def should_be_nested_under(
+        self,
+        parent: AbstractSemanticElement,
+        child: AbstractSemanticElement,
+    ) -> bool:
+        # __class__ is also what isinstance() looks at, e.g. for mocks.
+        key = (parent.__class__, child.__class__)
+        decision = self._table.get(key)
+        if decision is None:
+            decision = self._table[key] = self._compile(*key)
+        if decision is True:
+            return True
+        return any(
+            rule.should_be_nested_under(parent, child)
+            for rule in decision  # type: ignore[union-attr]
+        )
+
+    def _compile(
+        self,
+        parent_cls: type[AbstractSemanticElement],
+        child_cls: type[AbstractSemanticElement],
+    ) -> bool | tuple[AbstractNestingRule, ...]:
+        remaining_rules = []
+        for rule in self._rules:
+            decision = rule.should_be_nested_under_types(parent_cls, child_cls)
+            if decision is True:
+                return True
+            if decision is None:
+                remaining_rules.append(rule)
+        return tuple(remaining_rules)
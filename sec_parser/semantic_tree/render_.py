@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import cast
+import io
+from typing import TYPE_CHECKING, NamedTuple, TextIO, cast
 
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
@@ -8,6 +9,10 @@ from sec_parser.semantic_elements.abstract_semantic_element import (
 from sec_parser.semantic_elements.semantic_elements import IrrelevantElement
 from sec_parser.semantic_tree.semantic_tree import SemanticTree
 from sec_parser.semantic_tree.tree_node import TreeNode
+from sec_parser.utils.traversal import iter_preorder
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
 
 DEFAULT_CHAR_DISPLAY_LIMIT = 65
 
@@ -19,51 +24,114 @@ def render(
     ignored_types: tuple[type[AbstractSemanticElement], ...] | None = None,
     char_display_limit: int | None = None,
     verbose: bool = False,
-    _nodes: list[TreeNode] | None = None,
-    _level: int = 0,
-    _prefix: str = "",
-    _is_root: bool = True,
 ) -> str:
     """
     render function is used to visualize the structure of the semantic tree.
     It is primarily used for debugging purposes.
     """
+    stream = io.StringIO()
+    render_to_stream(
+        tree,
+        stream,
+        pretty=pretty,
+        ignored_types=ignored_types,
+        char_display_limit=char_display_limit,
+        verbose=verbose,
+    )
+    return stream.getvalue()
+
+
+def render_to_stream(
+    tree: list[TreeNode] | TreeNode | SemanticTree | list[AbstractSemanticElement],
+    stream: TextIO,
+    *,
+    pretty: bool | None = True,
+    ignored_types: tuple[type[AbstractSemanticElement], ...] | None = None,
+    char_display_limit: int | None = None,
+    verbose: bool = False,
+    line_limit: int | None = None,
+) -> None:
+    """
+    render_to_stream writes the output of `render` to a text stream, e.g. to
+    sys.stdout, line by line as the tree is traversed. If `line_limit` is
+    given, the traversal stops as soon as that many lines are written.
+    """
+    lines = _iter_lines(
+        _get_root_nodes(tree),
+        pretty=pretty if pretty is not None else True,
+        ignored_types=ignored_types or (IrrelevantElement,),
+        char_display_limit=(
+            char_display_limit
+            if char_display_limit and char_display_limit > 0
+            else DEFAULT_CHAR_DISPLAY_LIMIT
+        ),
+        verbose=verbose,
+    )
+    if line_limit is not None:
+        lines = _limit_lines(lines, line_limit)
+    for i, line in enumerate(lines):
+        if i > 0:
+            stream.write("\n")
+        stream.write(line)
+
+
+def _get_root_nodes(
+    tree: list[TreeNode] | TreeNode | SemanticTree | list[AbstractSemanticElement],
+) -> list[TreeNode]:
     if isinstance(tree, TreeNode):
-        root_nodes = [tree]
-    elif isinstance(tree, SemanticTree):
-        root_nodes = list(tree)
-    elif isinstance(tree, list) and tree:
+        return [tree]
+    if isinstance(tree, SemanticTree):
+        return list(tree)
+    if isinstance(tree, list) and tree:
         if all(isinstance(e, AbstractSemanticElement) for e in tree):
             elements = cast(list[AbstractSemanticElement], tree)
-            root_nodes = [TreeNode(e) for e in elements]
-        elif all(isinstance(e, TreeNode) for e in tree):
-            root_nodes = cast(list[TreeNode], tree)
-        else:
-            msg = "All elements in the tree must be of type AbstractSemanticElement or TreeNode"
-            raise TypeError(msg)
-    else:
-        msg = "Invalid type for 'tree'. Expected TreeNode, SemanticTree, list[AbstractSemanticElement], or list[TreeNode]"
+            return [TreeNode(e) for e in elements]
+        if all(isinstance(e, TreeNode) for e in tree):
+            return cast(list[TreeNode], tree)
+        msg = "All elements in the tree must be of type AbstractSemanticElement or TreeNode"
         raise TypeError(msg)
-    pretty = pretty if pretty is not None else True
-    ignored_types = ignored_types or (IrrelevantElement,)
-    char_display_limit = (
-        char_display_limit
-        if char_display_limit and char_display_limit > 0
-        else DEFAULT_CHAR_DISPLAY_LIMIT
-    )
+    msg = "Invalid type for 'tree'. Expected TreeNode, SemanticTree, list[AbstractSemanticElement], or list[TreeNode]"
+    raise TypeError(msg)
+
 
-    tree_strings = []
-    _nodes = _nodes if _nodes is not None else root_nodes
+class _RenderedNode(NamedTuple):
+    node: TreeNode
+    is_last: bool
+    # The prefix of the line of the node, None for the root nodes.
+    prefix: str | None
 
-    for i, node in enumerate(_nodes):
+
+def _iter_lines(
+    root_nodes: list[TreeNode],
+    *,
+    pretty: bool,
+    ignored_types: tuple[type[AbstractSemanticElement], ...],
+    char_display_limit: int,
+    verbose: bool,
+) -> Iterator[str]:
+    def get_children(item: _RenderedNode) -> list[_RenderedNode]:
+        # The subtrees of the ignored elements are not rendered.
+        if isinstance(item.node.semantic_element, ignored_types):
+            return []
+        # The children of root elements are not indented
+        prefix = ""
+        if item.prefix is not None:
+            prefix = item.prefix + ("│   " if not item.is_last else "    ")
+        children = [
+            _RenderedNode(child, is_last=False, prefix=prefix)
+            for child in item.node.iter_children()
+        ]
+        if children:
+            children[-1] = children[-1]._replace(is_last=True)
+        return children
+
+    roots = [_RenderedNode(node, is_last=False, prefix=None) for node in root_nodes]
+    for (node, is_last, prefix), depth in iter_preorder(roots, get_children):
         element = node.semantic_element
         if isinstance(element, ignored_types):
             continue
 
-        is_last = i == len(_nodes) - 1
-
         indent = "├── " if not is_last else "└── "
-        new_prefix = "│   " if not is_last else "    "
 
         level = ""
         lvl = getattr(node.semantic_element, "level", None)
@@ -80,24 +148,21 @@ def render(
             class_name = f"\033[1;34m{class_name}\033[0m"
 
         # Fix the alignment for root elements
-        line = f"{_prefix}{indent}{class_name}" if not _is_root else f"{class_name}"
+        line = f"{prefix}{indent}{class_name}" if depth > 0 else f"{class_name}"
         if contents:
             line = f"{line}: {contents}"
-        tree_strings.append(line)
-
-        # Recursive call: Always set _is_root to False for non-root elements
-        tree_strings.append(
-            render(
-                root_nodes,
-                pretty=pretty,
-                ignored_types=ignored_types,
-                char_display_limit=char_display_limit,
-                verbose=verbose,
-                _nodes=node.children,
-                _level=_level + 1,
-                _prefix=_prefix + (_prefix if _is_root else new_prefix),
-                _is_root=False,
-            ),
-        )
-
-    return "\n".join(filter(None, tree_strings))
+        yield line
+
+
+def _limit_lines(lines: Iterable[str], line_limit: int) -> Iterator[str]:
+    # A line may span several lines, e.g. if the summary has line breaks.
+    remaining = line_limit
+    for line in lines:
+        if remaining <= 0:
+            return
+        line_count = line.count("\n") + 1
+        if line_count > remaining:
+            yield "\n".join(line.split("\n")[:remaining])
+            return
+        remaining -= line_count
+        yield line
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
+from sec_parser.semantic_tree.tree_index import SemanticTreeIndex
+from sec_parser.semantic_tree.tree_node import walk_nodes
+
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterator
 
@@ -12,8 +16,14 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class SemanticTree:
-    def __init__(self, root_nodes: list[TreeNode]) -> None:
+    def __init__(
+        self,
+        root_nodes: list[TreeNode],
+        *,
+        index: SemanticTreeIndex | None = None,
+    ) -> None:
         self._root_nodes = root_nodes
+        self._index = index
 
     def __iter__(self) -> Iterator[TreeNode]:
         """Iterate over the root nodes of the tree."""
@@ -28,9 +38,33 @@ class SemanticTree:
         Get all nodes in the semantic tree. This includes the root nodes and all
         their descendants.
         """
-        for node in self._root_nodes:
+        for node, _ in walk_nodes(self._root_nodes):
             yield node
-            yield from node.get_descendants()
+
+    def walk(
+        self,
+        *,
+        types: tuple[type[AbstractSemanticElement], ...] | None = None,
+        postorder: bool = False,
+    ) -> Iterator[tuple[TreeNode, int]]:
+        """
+        Iterate over all nodes in the semantic tree together with their depth,
+        where the root nodes are at depth 0, in pre-order or in post-order.
+        If `types` is given, only the nodes of these types of semantic elements
+        are included.
+        """
+        return walk_nodes(self._root_nodes, types=types, postorder=postorder)
+
+    @property
+    def index(self) -> SemanticTreeIndex:
+        """
+        Get the index of the tree, e.g. to look up the node of a top section
+        by its identifier. The index is built on first access, unless it was
+        built along with the tree, and is not updated when the nodes change.
+        """
+        if self._index is None:
+            self._index = SemanticTreeIndex(self._root_nodes)
+        return self._index
 
     def render(
         self,
@@ -67,14 +101,29 @@ class SemanticTree:
         """
         Print the semantic tree as a human-readable string.
 
-        Syntactic sugar for a more convenient usage of `render`.
+        Syntactic sugar for a more convenient usage of `render_to_stream`. With
+        a `line_limit`, only the printed lines are rendered.
         """
-        rendered = self.render(
+        if line_limit is not None and line_limit < 0:
+            # Counting the lines from the end requires the whole rendering.
+            rendered = self.render(
+                pretty=pretty,
+                ignored_types=ignored_types,
+                char_display_limit=char_display_limit,
+                verbose=verbose,
+            )
+            print("\n".join(rendered.split("\n")[:line_limit]))  # noqa: T201
+            return
+
+        from sec_parser.semantic_tree.render_ import render_to_stream
+
+        render_to_stream(
+            self,
+            sys.stdout,
             pretty=pretty,
             ignored_types=ignored_types,
             char_display_limit=char_display_limit,
             verbose=verbose,
+            line_limit=line_limit,
         )
-        if line_limit is not None:
-            rendered = "\n".join(rendered.split("\n")[:line_limit])
-        print(rendered)  # noqa: T201
+        sys.stdout.write("\n")
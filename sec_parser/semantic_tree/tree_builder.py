@@ -7,9 +7,11 @@ from sec_parser.semantic_elements.top_section_start_marker import TopSectionStar
 from sec_parser.semantic_tree.nesting_rules import (
     AbstractNestingRule,
     AlwaysNestAsParentRule,
+    NestingRuleTable,
     NestSameTypeDependingOnLevelRule,
 )
 from sec_parser.semantic_tree.semantic_tree import SemanticTree
+from sec_parser.semantic_tree.tree_index import SemanticTreeIndex
 from sec_parser.semantic_tree.tree_node import TreeNode
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -62,8 +64,18 @@ class TreeBuilder:
             NestSameTypeDependingOnLevelRule(),
         ]
 
-    def build(self, elements: list[AbstractSemanticElement]) -> SemanticTree:
-        rules = self.get_rules()
+    def build(
+        self,
+        elements: list[AbstractSemanticElement],
+        *,
+        build_index: bool = False,
+    ) -> SemanticTree:
+        """
+        Build the semantic tree. If `build_index` is True, the index of the tree
+        is built right away instead of on first access, e.g. before caching the
+        tree to answer lookups.
+        """
+        rules = NestingRuleTable(self.get_rules())
 
         # The 'stack' is a list used to remember the nodes (sections or elements)
         # we're currently looking at as we go through the document.
@@ -86,13 +98,14 @@ class TreeBuilder:
                 root_nodes.append(new_node)
                 stack.append(new_node)
 
-        return SemanticTree(root_nodes)
+        index = SemanticTreeIndex(root_nodes) if build_index else None
+        return SemanticTree(root_nodes, index=index)
 
     def _find_parent_node(
         self,
         new_node: TreeNode,
         stack: list[TreeNode],
-        rules: list[AbstractNestingRule],
+        rules: NestingRuleTable,
     ) -> TreeNode | None:
         while stack:
             potential_parent = stack[-1]
@@ -107,13 +120,9 @@ class TreeBuilder:
         self,
         child_node: TreeNode,
         parent_node: TreeNode,
-        rules: list[AbstractNestingRule],
+        rules: NestingRuleTable,
     ) -> bool:
-        results = tuple(
-            rule.should_be_nested_under(
-                child=child_node.semantic_element,
-                parent=parent_node.semantic_element,
-            )
-            for rule in rules
+        return rules.should_be_nested_under(
+            child=child_node.semantic_element,
+            parent=parent_node.semantic_element,
         )
-        return any(results)
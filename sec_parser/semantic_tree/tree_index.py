@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.semantic_elements.top_section_start_marker import TopSectionStartMarker
+from sec_parser.semantic_tree.tree_node import walk_nodes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from sec_parser.semantic_elements.abstract_semantic_element import (
+        AbstractSemanticElement,
+    )
+    from sec_parser.semantic_tree.tree_node import TreeNode
+
+
+class SemanticTreeIndex:
+    """
+    The SemanticTreeIndex class answers the lookups of a semantic tree without
+    scanning it: the node of a semantic element, the node of a top section by its
+    identifier, and the nodes of a type of semantic element.
+
+    The nodes are numbered in pre-order, i.e. in document order, so that the
+    descendants of a node are the nodes between its position and the end of its
+    subtree. For example, the tables of Part II are a slice of the positions of
+    the tables.
+
+    Note: The index reflects the tree at the time it is built, and is not updated
+    when the nodes are changed afterwards.
+    """
+
+    def __init__(self, root_nodes: Iterable[TreeNode]) -> None:
+        self._nodes: list[TreeNode] = []
+        self._subtree_ends: list[int] = []
+        self._positions: dict[AbstractSemanticElement, int] = {}
+        self._positions_by_type: dict[type[AbstractSemanticElement], list[int]] = {}
+        self._section_positions: dict[str, int] = {}
+        # Positions of the instances of the requested types, including subclasses.
+        self._positions_by_requested_type: dict[
+            type[AbstractSemanticElement],
+            list[int],
+        ] = {}
+
+        # The positions of the ancestors of the current node, whose subtrees
+        # end where a node of the same or a lower depth starts.
+        ancestors: list[int] = []
+        for node, depth in walk_nodes(root_nodes):
+            while len(ancestors) > depth:
+                self._subtree_ends[ancestors.pop()] = len(self._nodes)
+            ancestors.append(self._add_node(node))
+        for position in ancestors:
+            self._subtree_ends[position] = len(self._nodes)
+
+    def _add_node(self, node: TreeNode) -> int:
+        position = len(self._nodes)
+        self._nodes.append(node)
+        self._subtree_ends.append(position + 1)
+        element = node.semantic_element
+        self._positions[element] = position
+        self._positions_by_type.setdefault(element.__class__, []).append(position)
+        if isinstance(element, TopSectionStartMarker):
+            self._section_positions.setdefault(
+                element.section_type.identifier,
+                position,
+            )
+        return position
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> list[TreeNode]:
+        """Get all nodes of the tree in pre-order, i.e. in document order."""
+        return self._nodes.copy()
+
+    def get_node(self, element: AbstractSemanticElement) -> TreeNode | None:
+        """Get the node of the semantic element, if it is part of the tree."""
+        position = self._positions.get(element)
+        return None if position is None else self._nodes[position]
+
+    def get_section_node(self, identifier: str) -> TreeNode | None:
+        """
+        Get the node of the first top section with the given identifier,
+        e.g. "part2item1a", if there is one.
+        """
+        position = self._section_positions.get(identifier)
+        return None if position is None else self._nodes[position]
+
+    def get_subtree_range(self, node: TreeNode) -> range:
+        """
+        Get the positions of the node and of its descendants, i.e. the pre-order
+        index of the node and the end index of its subtree.
+        """
+        position = self._positions.get(node.semantic_element)
+        if position is None or self._nodes[position] is not node:
+            msg = "The node is not part of the indexed tree."
+            raise SecParserValueError(msg)
+        return range(position, self._subtree_ends[position])
+
+    def get_nodes_by_type(
+        self,
+        element_type: type[AbstractSemanticElement],
+        *,
+        under: TreeNode | None = None,
+    ) -> list[TreeNode]:
+        """
+        Get the nodes of the instances of the given type of semantic element, in
+        document order. If `under` is given, only its descendants are included.
+        """
+        positions = self._get_positions_by_type(element_type)
+        start, end = 0, len(positions)
+        if under is not None:
+            subtree = self.get_subtree_range(under)
+            start = bisect_left(positions, subtree.start + 1)
+            end = bisect_left(positions, subtree.stop)
+        return [self._nodes[position] for position in positions[start:end]]
+
+    def _get_positions_by_type(
+        self,
+        element_type: type[AbstractSemanticElement],
+    ) -> list[int]:
+        positions = self._positions_by_requested_type.get(element_type)
+        if positions is None:
+            positions = list(
+                heapq.merge(
+                    *(
+                        type_positions
+                        for cls, type_positions in self._positions_by_type.items()
+                        if issubclass(cls, element_type)
+                    ),
+                ),
+            )
+            self._positions_by_requested_type[element_type] = positions
+        return positions
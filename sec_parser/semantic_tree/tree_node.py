@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sec_parser.utils.traversal import iter_postorder, iter_preorder
+
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable, Iterator
 
@@ -21,6 +23,10 @@ class TreeNode:
     being changed.
     For example, if a parent is removed from a child, the child is automatically
     removed from the parent.
+
+    The children are kept in an insertion-ordered dict, so that adding, removing
+    and looking up a child take constant time, even for a node with thousands
+    of children.
     """
 
     def __init__(
@@ -31,7 +37,8 @@ class TreeNode:
         children: Iterable[TreeNode] | None = None,
     ) -> None:
         self._semantic_element = semantic_element
-        self._children: list[TreeNode] = []
+        # Used as an ordered set, as a child node can only be added once.
+        self._children: dict[TreeNode, None] = {}
         self._parent: TreeNode | None = None
         self.parent = parent  # call 'parent` setter
         if children is not None:
@@ -43,7 +50,14 @@ class TreeNode:
 
     @property
     def children(self: TreeNode) -> list[TreeNode]:
-        return self._children.copy()
+        return list(self._children)
+
+    def iter_children(self: TreeNode) -> Iterator[TreeNode]:
+        """
+        Iterate over the child nodes without copying them, unlike `children`.
+        The children must not be added or removed during the iteration.
+        """
+        return iter(self._children)
 
     @property
     def parent(self: TreeNode) -> TreeNode | None:
@@ -51,35 +65,45 @@ class TreeNode:
 
     @parent.setter
     def parent(self: TreeNode, parent: TreeNode | None) -> None:
+        # A node is a child of its parent, and of no other node.
         if self._parent is not None:
-            self._parent.remove_child(self)
-        if parent is not None:
-            parent.add_child(self)
+            del self._parent._children[self]  # noqa: SLF001
         self._parent = parent
+        if parent is not None:
+            parent._children[self] = None  # noqa: SLF001
 
     def add_child(self: TreeNode, child: TreeNode) -> None:
-        if child not in self._children:
-            self._children.append(child)
-            if child.parent != self:
-                child.parent = self
+        if child._parent is not self:
+            child.parent = self
 
     def add_children(self: TreeNode, children: Iterable[TreeNode]) -> None:
         for child in children:
             self.add_child(child)
 
     def remove_child(self: TreeNode, child: TreeNode) -> None:
-        if child in self._children:
-            self._children.remove(child)
-            if child.parent == self:
-                child.parent = None
+        if child._parent is self:
+            child.parent = None
 
     def has_child(self: TreeNode, child: TreeNode) -> bool:
-        return child in self._children
+        return child._parent is self
 
     def get_descendants(self: TreeNode) -> Iterator[TreeNode]:
-        for child in self._children:
-            yield child
-            yield from child.get_descendants()
+        for node, _ in iter_preorder(self._children, _get_children):
+            yield node
+
+    def walk(
+        self: TreeNode,
+        *,
+        types: tuple[type[AbstractSemanticElement], ...] | None = None,
+        postorder: bool = False,
+    ) -> Iterator[tuple[TreeNode, int]]:
+        """
+        Iterate over the node and its descendants together with their depth
+        relative to the node, in pre-order or in post-order. If `types` is given,
+        only the nodes of these types of semantic elements are included, but the
+        descendants of the other nodes are still traversed.
+        """
+        return walk_nodes([self], types=types, postorder=postorder)
 
     def __repr__(self: TreeNode) -> str:
         return f"TreeNode(parent={self.parent}, children={len(self._children)})"
@@ -92,3 +116,27 @@ class TreeNode:
     def get_source_code(self, *, pretty: bool = False) -> str:
         """get_source_code is a passthrough to the SemanticElement method."""
         return self._semantic_element.get_source_code(pretty=pretty)
+
+
+def _get_children(node: TreeNode) -> Iterator[TreeNode]:
+    return node.iter_children()
+
+
+def walk_nodes(
+    nodes: Iterable[TreeNode],
+    *,
+    types: tuple[type[AbstractSemanticElement], ...] | None = None,
+    postorder: bool = False,
+) -> Iterator[tuple[TreeNode, int]]:
+    """
+    Iterate over the given nodes and their descendants together with their depth,
+    where the given nodes are at depth 0. See `TreeNode.walk`.
+
+    The children are not copied, so they must not be added or removed while
+    the nodes are iterated.
+    """
+    iterate = iter_postorder if postorder else iter_preorder
+    items = iterate(nodes, _get_children)
+    if types is None:
+        return items
+    return (item for item in items if isinstance(item[0].semantic_element, types))
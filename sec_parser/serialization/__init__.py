@@ -0,0 +1,12 @@
+"""
+The serialization subpackage provides a compact binary format
+for storing and shipping parsed documents, i.e. lists of
+semantic elements and semantic trees.
+"""
+
+from sec_parser.serialization.binary_format import dumps, loads
+
+__all__ = [
+    "dumps",
+    "loads",
+]
@@ -0,0 +1,451 @@
+"""
+Compact binary format for lists of semantic elements and semantic trees.
+
+All integers are little-endian. Strings are stored as a u32 byte length
+followed by the UTF-8 encoded string.
+
+Header (7 bytes):
+    4 bytes   magic, b"SECP"
+    u8        format version, currently 1
+    u8        kind: 0 for a list of semantic elements, 1 for a SemanticTree
+    u8        flags: bit 0 is set if the body is compressed with zlib
+
+Body:
+    u32       number of element classes, followed by the "module:qualname"
+              strings of the classes
+    u32       number of top sections, followed by each section as:
+              str identifier, str title, i32 order, i32 level
+    u32       number of root records, followed by the records
+
+Record of a semantic element:
+    u16       index of the element class
+    u8        fields present in the record (see the FIELD_* constants)
+    u32       number of inner elements of a CompositeSemanticElement, which
+              follow the record as nested records
+    str       text
+    str       source code
+    i32       level                  (FIELD_LEVEL)
+    u32       index of the section   (FIELD_SECTION_TYPE)
+    u8        TextStyle flags, one bit per field in declaration order
+                                     (FIELD_STYLE)
+    str       table in Markdown      (FIELD_TABLE_MARKDOWN)
+    i32, i32  approximate table rows and numbers
+                                     (FIELD_TABLE_METRICS)
+    u32, u32, u32
+              table rows, columns and cells
+                                     (FIELD_TABLE_DIMENSIONS)
+    str       error message          (FIELD_ERROR)
+
+The FIELD_PAGE_DATA_CELL flag has no data: it is set for the tables where
+a <td> tag has the text "page".
+
+For a SemanticTree, each record is followed by a u32 number of child nodes,
+whose records follow.
+"""
+
+from __future__ import annotations
+
+import importlib
+import struct
+import zlib
+from dataclasses import astuple, fields
+from typing import TYPE_CHECKING, Any, Union
+
+from sec_parser.exceptions import SecParserError, SecParserValueError
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.semantic_elements.abstract_semantic_element import (
+    AbstractLevelElement,
+    AbstractSemanticElement,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+    get_inner_elements,
+)
+from sec_parser.semantic_elements.highlighted_text_element import (
+    HighlightedTextElement,
+    TextStyle,
+)
+from sec_parser.semantic_elements.semantic_elements import ErrorWhileProcessingElement
+from sec_parser.semantic_elements.table_element.table_element import TableElement
+from sec_parser.semantic_elements.top_section_start_marker import TopSectionStartMarker
+from sec_parser.semantic_elements.top_section_title_types import TopSectionInFiling
+from sec_parser.semantic_tree.semantic_tree import SemanticTree
+from sec_parser.semantic_tree.tree_node import TreeNode
+from sec_parser.utils.bs4_.table_facts import ApproxTableMetrics, TableFacts
+from sec_parser.utils.traversal import iter_preorder
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+MAGIC = b"SECP"
+FORMAT_VERSION = 1
+
+KIND_ELEMENTS = 0
+KIND_TREE = 1
+
+FLAG_ZLIB = 1
+
+FIELD_LEVEL = 1
+FIELD_SECTION_TYPE = 2
+FIELD_STYLE = 4
+FIELD_TABLE_MARKDOWN = 8
+FIELD_TABLE_METRICS = 16
+FIELD_ERROR = 32
+FIELD_PAGE_DATA_CELL = 64
+FIELD_TABLE_DIMENSIONS = 128
+
+_HEADER = struct.Struct("<4sBBB")
+_RECORD = struct.Struct("<HBI")
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_SECTION_NUMBERS = struct.Struct("<ii")
+_TABLE_METRICS = struct.Struct("<ii")
+_TABLE_DIMENSIONS = struct.Struct("<III")
+
+_TEXT_STYLE_FIELDS = tuple(field.name for field in fields(TextStyle))
+
+Serializable = Union[list[AbstractSemanticElement], SemanticTree]
+
+# The class of an element, with its HtmlTag and the other keyword
+# arguments of its constructor.
+_ElementArguments = tuple[type[AbstractSemanticElement], HtmlTag, dict[str, Any]]
+
+
+def dumps(
+    obj: Serializable,
+    *,
+    compress: bool = True,
+    include_table_markdown: bool = True,
+) -> bytes:
+    """
+    Serialize a list of semantic elements or a SemanticTree into the compact
+    binary format described in the module docstring.
+
+    Converting tables to Markdown is relatively slow, so it can be skipped
+    with `include_table_markdown=False`. The Markdown is then computed from
+    the source code when needed after loading.
+    """
+    writer = _Writer(include_table_markdown=include_table_markdown)
+    if isinstance(obj, SemanticTree):
+        kind = KIND_TREE
+        writer.write_nodes(list(obj))
+    else:
+        kind = KIND_ELEMENTS
+        writer.write_elements(obj)
+    body = writer.get_body()
+    flags = 0
+    if compress:
+        body = zlib.compress(body)
+        flags |= FLAG_ZLIB
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, kind, flags) + body
+
+
+def loads(data: bytes) -> Serializable:
+    """
+    Load a list of semantic elements or a SemanticTree serialized by `dumps`.
+
+    The loaded elements are lightweight: their processing logs are empty and
+    their HtmlTag objects are detached from the document, holding only the
+    stored results. Anything else is computed from the source code when needed.
+
+    The elements are created by the constructors of their classes, with the
+    stored fields as keyword arguments, e.g. `level` and `style`.
+    """
+    if len(data) < _HEADER.size:
+        msg = "Data is too short to be in the sec-parser binary format"
+        raise SecParserValueError(msg)
+    magic, version, kind, flags = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        msg = "Data is not in the sec-parser binary format"
+        raise SecParserValueError(msg)
+    if version != FORMAT_VERSION:
+        msg = f"Unsupported format version: {version}"
+        raise SecParserValueError(msg)
+    body = data[_HEADER.size :]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    reader = _Reader(body)
+    if kind == KIND_TREE:
+        return SemanticTree(reader.read_nodes())
+    if kind == KIND_ELEMENTS:
+        return reader.read_elements()
+    msg = f"Unsupported kind: {kind}"
+    raise SecParserValueError(msg)
+
+
+class _Writer:
+    def __init__(self, *, include_table_markdown: bool) -> None:
+        self._include_table_markdown = include_table_markdown
+        self._classes: dict[type[AbstractSemanticElement], int] = {}
+        self._sections: dict[TopSectionInFiling, int] = {}
+        self._records = bytearray()
+
+    def get_body(self) -> bytes:
+        body = bytearray()
+        body += _U32.pack(len(self._classes))
+        for cls in self._classes:
+            _write_str(body, f"{cls.__module__}:{cls.__qualname__}")
+        body += _U32.pack(len(self._sections))
+        for section in self._sections:
+            _write_str(body, section.identifier)
+            _write_str(body, section.title)
+            body += _SECTION_NUMBERS.pack(section.order, section.level)
+        body += self._records
+        return bytes(body)
+
+    def write_elements(self, elements: Iterable[AbstractSemanticElement]) -> None:
+        elements = list(elements)
+        self._records += _U32.pack(len(elements))
+        self._write_elements(elements)
+
+    def write_nodes(self, nodes: list[TreeNode]) -> None:
+        self._records += _U32.pack(len(nodes))
+        # In pre-order, the records of the child nodes directly follow
+        # the number of children of their parent node.
+        for node, _ in iter_preorder(nodes, _get_children):
+            self._write_elements([node.semantic_element])
+            self._records += _U32.pack(len(node.children))
+
+    def _write_elements(self, elements: list[AbstractSemanticElement]) -> None:
+        # In pre-order, the records of the inner elements directly follow
+        # the record of their composite element.
+        for element, _ in iter_preorder(elements, get_inner_elements):
+            self._write_element(element)
+
+    def _write_element(self, element: AbstractSemanticElement) -> None:
+        records = self._records
+        cls_index = self._classes.setdefault(type(element), len(self._classes))
+        field_flags = 0
+        optional = bytearray()
+
+        if isinstance(element, AbstractLevelElement):
+            field_flags |= FIELD_LEVEL
+            optional += _I32.pack(element.level)
+        if isinstance(element, TopSectionStartMarker):
+            field_flags |= FIELD_SECTION_TYPE
+            section = element.section_type
+            optional += _U32.pack(self._sections.setdefault(section, len(self._sections)))
+        if isinstance(element, HighlightedTextElement):
+            field_flags |= FIELD_STYLE
+            style_bits = sum(1 << i for i, v in enumerate(astuple(element.style)) if v)
+            optional += _U8.pack(style_bits)
+        if isinstance(element, TableElement):
+            markdown = (
+                _get_table_markdown(element) if self._include_table_markdown else None
+            )
+            if markdown is not None:
+                field_flags |= FIELD_TABLE_MARKDOWN
+                _write_str(optional, markdown)
+            facts = element.html_tag.get_table_facts()
+            if facts.metrics is not None:
+                field_flags |= FIELD_TABLE_METRICS
+                optional += _TABLE_METRICS.pack(
+                    facts.metrics.rows,
+                    facts.metrics.numbers,
+                )
+            if facts.has_page_data_cell:
+                field_flags |= FIELD_PAGE_DATA_CELL
+            dimensions = (facts.row_count, facts.column_count, facts.cell_count)
+            if any(dimensions):
+                field_flags |= FIELD_TABLE_DIMENSIONS
+                optional += _TABLE_DIMENSIONS.pack(*dimensions)
+        if isinstance(element, ErrorWhileProcessingElement):
+            field_flags |= FIELD_ERROR
+            _write_str(optional, str(element.error))
+
+        inner_elements = (
+            element.inner_elements
+            if isinstance(element, CompositeSemanticElement)
+            else ()
+        )
+        records += _RECORD.pack(cls_index, field_flags, len(inner_elements))
+        _write_str(records, element.text)
+        _write_str(records, element.get_source_code())
+        records += optional
+
+
+class _Reader:
+    def __init__(self, body: bytes) -> None:
+        self._body = memoryview(body)
+        self._offset = 0
+        self._classes = [
+            _resolve_element_class(self._read_str()) for _ in range(self._read_u32())
+        ]
+        self._sections = [self._read_section() for _ in range(self._read_u32())]
+
+    def read_elements(self) -> list[AbstractSemanticElement]:
+        return self._read_elements(self._read_u32())
+
+    def read_nodes(self) -> list[TreeNode]:
+        root_nodes: list[TreeNode] = []
+        # The parent nodes whose children are being read, each with the number
+        # of children left to read, starting with the root nodes.
+        stack: list[tuple[TreeNode | None, int]] = [(None, self._read_u32())]
+        while stack:
+            parent, remaining = stack.pop()
+            if remaining == 0:
+                continue
+            stack.append((parent, remaining - 1))
+            (element,) = self._read_elements(1)
+            node = TreeNode(element, parent=parent)
+            if parent is None:
+                root_nodes.append(node)
+            stack.append((node, self._read_u32()))
+        return root_nodes
+
+    def _read_elements(self, count: int) -> list[AbstractSemanticElement]:
+        elements: list[AbstractSemanticElement] = []
+        # The composite elements whose inner elements are being read, each with
+        # the arguments to create it once all of them are read, the inner
+        # elements read so far and the number of inner elements.
+        stack: list[
+            tuple[_ElementArguments | None, list[AbstractSemanticElement], int]
+        ] = [(None, elements, count)]
+        while stack:
+            arguments, inner_elements, inner_count = stack[-1]
+            if len(inner_elements) == inner_count:
+                stack.pop()
+                if arguments is not None:
+                    cls, html_tag, kwargs = arguments
+                    composite = cls(
+                        html_tag,
+                        inner_elements=tuple(inner_elements),
+                        **kwargs,
+                    )
+                    stack[-1][1].append(composite)
+                continue
+            arguments, element_inner_count = self._read_element()
+            cls, html_tag, kwargs = arguments
+            if issubclass(cls, CompositeSemanticElement):
+                stack.append((arguments, [], element_inner_count))
+            else:
+                inner_elements.append(cls(html_tag, **kwargs))
+        return elements
+
+    def _read_element(self) -> tuple[_ElementArguments, int]:
+        """
+        Read the record of an element, without its inner elements. Returns the
+        arguments of the constructor of its class, and the number of inner
+        elements, which a composite element needs to be created.
+        """
+        cls_index, field_flags, inner_count = _RECORD.unpack_from(
+            self._body,
+            self._offset,
+        )
+        self._offset += _RECORD.size
+        cls = self._classes[cls_index]
+        text = self._read_str()
+        source_code = self._read_str()
+
+        kwargs: dict[str, Any] = {}
+        markdown = None
+        metrics = None
+        if field_flags & FIELD_LEVEL:
+            kwargs["level"] = self._read_i32()
+        if field_flags & FIELD_SECTION_TYPE:
+            kwargs["section_type"] = self._sections[self._read_u32()]
+        if field_flags & FIELD_STYLE:
+            style_bits = self._read_u8()
+            kwargs["style"] = TextStyle(
+                **{
+                    name: bool(style_bits & (1 << i))
+                    for i, name in enumerate(_TEXT_STYLE_FIELDS)
+                },
+            )
+        if field_flags & FIELD_TABLE_MARKDOWN:
+            markdown = self._read_str()
+        if field_flags & FIELD_TABLE_METRICS:
+            rows, numbers = _TABLE_METRICS.unpack_from(self._body, self._offset)
+            self._offset += _TABLE_METRICS.size
+            metrics = ApproxTableMetrics(rows, numbers)
+        dimensions = (0, 0, 0)
+        if field_flags & FIELD_TABLE_DIMENSIONS:
+            dimensions = _TABLE_DIMENSIONS.unpack_from(self._body, self._offset)
+            self._offset += _TABLE_DIMENSIONS.size
+        if field_flags & FIELD_ERROR:
+            kwargs["error"] = SecParserError(self._read_str())
+        html_tag = HtmlTag.create_detached(
+            source_code,
+            text=text,
+            markdown_table=markdown,
+            table_facts=(
+                TableFacts(
+                    metrics=metrics,
+                    has_page_data_cell=bool(field_flags & FIELD_PAGE_DATA_CELL),
+                    row_count=dimensions[0],
+                    column_count=dimensions[1],
+                    cell_count=dimensions[2],
+                )
+                if issubclass(cls, TableElement)
+                else None
+            ),
+        )
+        return (cls, html_tag, kwargs), inner_count
+
+    def _read_section(self) -> TopSectionInFiling:
+        identifier = self._read_str()
+        title = self._read_str()
+        order, level = _SECTION_NUMBERS.unpack_from(self._body, self._offset)
+        self._offset += _SECTION_NUMBERS.size
+        return TopSectionInFiling(
+            identifier=identifier,
+            title=title,
+            order=order,
+            level=level,
+        )
+
+    def _read_u8(self) -> int:
+        (value,) = _U8.unpack_from(self._body, self._offset)
+        self._offset += _U8.size
+        return value
+
+    def _read_u32(self) -> int:
+        (value,) = _U32.unpack_from(self._body, self._offset)
+        self._offset += _U32.size
+        return value
+
+    def _read_i32(self) -> int:
+        (value,) = _I32.unpack_from(self._body, self._offset)
+        self._offset += _I32.size
+        return value
+
+    def _read_str(self) -> str:
+        length = self._read_u32()
+        start = self._offset
+        self._offset += length
+        return str(self._body[start : self._offset], "utf-8", "surrogatepass")
+
+
+def _get_children(node: TreeNode) -> Iterator[TreeNode]:
+    return node.iter_children()
+
+
+def _write_str(buffer: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8", "surrogatepass")
+    buffer += _U32.pack(len(encoded))
+    buffer += encoded
+
+
+def _get_table_markdown(element: TableElement) -> str | None:
+    try:
+        return element.html_tag.table_to_markdown()
+    except Exception:  # noqa: BLE001
+        # The conversion is attempted again, and fails, when it is needed.
+        return None
+
+
+def _resolve_element_class(name: str) -> type[AbstractSemanticElement]:
+    module_name, _, qualname = name.partition(":")
+    try:
+        obj: object = importlib.import_module(module_name)
+    except ImportError as e:
+        msg = f"Cannot import the semantic element class: {name}"
+        raise SecParserValueError(msg) from e
+    for attribute in qualname.split("."):
+        obj = getattr(obj, attribute, None)
+    if not (isinstance(obj, type) and issubclass(obj, AbstractSemanticElement)):
+        msg = f"Not a semantic element class: {name}"
+        raise SecParserValueError(msg)
+    return obj
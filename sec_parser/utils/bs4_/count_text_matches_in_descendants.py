@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import bs4
 
-from sec_parser.utils.bs4_.get_first_deepest_tag import get_first_deepest_tag
-from sec_parser.utils.bs4_.is_unary_tree import is_unary_tree
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+_DEFAULT_INTERESTING_STRING_TYPES = bs4.Tag.DEFAULT_INTERESTING_STRING_TYPES
+
+_UNSET = object()
 
 
 def count_text_matches_in_descendants(
@@ -14,17 +18,90 @@ def count_text_matches_in_descendants(
     *,
     exclude_links: bool | None = None,
 ) -> int:
+    """
+    Count the unique texts of the descendant tags that match the predicate.
+    Descendants that form a unary tree around a link are skipped.
+    """
     exclude_links = exclude_links if exclude_links is not None else False
     unique_texts = set()
-    for child in bs4_tag.descendants:
-        if isinstance(child, bs4.Tag):
-            if (
-                is_unary_tree(child)
-                and (deepest_tag := get_first_deepest_tag(child))
-                and deepest_tag.name == "a"
-            ):
-                continue
-            text = child.get_text().strip()
-            if text and predicate(text):
-                unique_texts.add(text)
+    for text in _iter_descendant_texts(bs4_tag):
+        if text and predicate(text):
+            unique_texts.add(text)
     return len(unique_texts)
+
+
+class _Frame:
+    """The state of a tag whose children are being traversed."""
+
+    __slots__ = (
+        "children",
+        "first_deepest_name",
+        "has_tag_children",
+        "last_child_is_unary_tree",
+        "non_blank_count",
+        "parts",
+        "tag",
+    )
+
+    def __init__(self, tag: bs4.Tag) -> None:
+        self.tag = tag
+        self.children = iter(tag.contents)
+        self.parts: list[str] = []
+        self.non_blank_count = 0
+        self.last_child_is_unary_tree = True
+        self.has_tag_children = False
+        # The name of the first deepest tag of the first non-blank child,
+        # or None if that child is a string.
+        self.first_deepest_name: str | object | None = _UNSET
+
+
+def _iter_descendant_texts(tag: bs4.Tag) -> Iterator[str]:
+    """
+    Yield the stripped text of each descendant tag that is not a unary tree
+    whose first deepest tag is a link. The texts, the unary trees and the
+    first deepest tags (see `is_unary_tree` and `get_first_deepest_tag`) are
+    computed bottom-up, in a single traversal of the descendants.
+    """
+    stack = [_Frame(tag)]
+    while stack:
+        frame = stack[-1]
+        for child in frame.children:
+            if isinstance(child, bs4.Tag):
+                stack.append(_Frame(child))
+                break
+            if type(child) in _DEFAULT_INTERESTING_STRING_TYPES:
+                frame.parts.append(child)
+            if child.strip():
+                frame.non_blank_count += 1
+                frame.last_child_is_unary_tree = True
+                if frame.first_deepest_name is _UNSET:
+                    frame.first_deepest_name = None
+        else:
+            stack.pop()
+            if not stack:
+                return
+            node = frame.tag
+            text = "".join(frame.parts)
+            is_unary_tree = (
+                node.name == "table"
+                or frame.non_blank_count == 0
+                or (frame.non_blank_count == 1 and frame.last_child_is_unary_tree)
+            )
+            first_deepest_name = (
+                frame.first_deepest_name if frame.has_tag_children else node.name
+            )
+
+            parent = stack[-1]
+            parent.parts.append(text)
+            parent.non_blank_count += 1
+            parent.last_child_is_unary_tree = is_unary_tree
+            parent.has_tag_children = True
+            if parent.first_deepest_name is _UNSET:
+                parent.first_deepest_name = first_deepest_name
+
+            if is_unary_tree and first_deepest_name == "a":
+                continue
+            if node.interesting_string_types is not _DEFAULT_INTERESTING_STRING_TYPES:
+                # E.g. <script> tags, whose text consists of other string types.
+                text = node.get_text()
+            yield text.strip()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.utils.style_declarations import STYLE_DECLARATION_CACHE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bs4 import Tag
+
+# Maps the id of a tag to the tag and its effective styles. The tag is kept
+# to make sure the id hasn't been reused by another tag.
+EffectiveStylesTable = dict[int, tuple["Tag", dict[str, str]]]
+
+
+def get_effective_styles(
+    tag: Tag,
+    table: EffectiveStylesTable,
+) -> dict[str, str]:
+    """
+    Return the effective styles of the tag, i.e. the styles set on the tag
+    and the ones it inherits from its ancestors, where the styles of the
+    closer tags take precedence.
+
+    The effective styles are computed top-down, from the closest ancestor
+    already in the table, so that each tag is resolved only once per table.
+    """
+    chain: list[Tag] = []
+    inherited: dict[str, str] = {}
+    node: Tag | None = tag
+    while node is not None:
+        entry = table.get(id(node))
+        if entry is not None and entry[0] is node:
+            inherited = entry[1]
+            break
+        chain.append(node)
+        node = node.parent
+
+    for node in reversed(chain):
+        styles = _parse_style(node)
+        for prop, val in inherited.items():
+            # Only set if not previously set to respect CSS cascading rules
+            styles.setdefault(prop, val)
+        table[id(node)] = (node, styles)
+        inherited = styles
+    return inherited
+
+
+def _parse_style(tag: Tag) -> dict[str, str]:
+    found_styles = tag.attrs.get("style")
+    if found_styles is None:
+        return {}
+    if isinstance(found_styles, list):  # pragma: no cover
+        # this should never happen, can't even construct a
+        # scenario where this would occur
+        msg = "Expected a string, got a list"
+        raise SecParserValueError(msg)
+    return dict(STYLE_DECLARATION_CACHE.get(found_styles))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sec_parser.utils.bs4_.table_grid import TableGrid
+
+
+@dataclass
+class ApproxTableMetrics:
+    rows: int
+    numbers: int
+
+
+@dataclass(frozen=True)
+class TableFacts:
+    """
+    The TableFacts class holds what the table classifiers and summaries need
+    to know about a table, as collected in the single traversal of the table
+    that reads its grid.
+
+    The dimensions count the nested and the hidden <tr>, <td> and <th> tags,
+    and the columns are the most <td> and <th> tags of a <tr> tag.
+    """
+
+    metrics: ApproxTableMetrics | None
+    has_page_data_cell: bool
+    row_count: int
+    column_count: int
+    cell_count: int
+
+
+def get_table_facts(get_grid: Callable[[], TableGrid]) -> TableFacts:
+    """
+    Return the facts collected while reading the table grid. The metrics
+    count the rows whose first <td> tag has text, and the <td> tags whose
+    text contains a digit. They are None if the grid cannot be read, or
+    if a <tr> tag has no <td> tag.
+    """
+    try:
+        grid = get_grid()
+    except Exception as e:  # noqa: BLE001
+        _warn_failure(str(e))
+        return TableFacts(
+            metrics=None,
+            has_page_data_cell=False,
+            row_count=0,
+            column_count=0,
+            cell_count=0,
+        )
+    if grid.has_row_without_data_cell:
+        _warn_failure("Found a <tr> tag without a <td> tag.")
+        metrics = None
+    else:
+        metrics = ApproxTableMetrics(grid.rows_with_text, grid.cells_with_numbers)
+    return TableFacts(
+        metrics=metrics,
+        has_page_data_cell=grid.has_page_data_cell,
+        row_count=grid.row_count,
+        column_count=grid.column_count,
+        cell_count=grid.cell_count,
+    )
+
+
+def _warn_failure(reason: str) -> None:
+    warnings.warn(f"Failed to get table metrics: {reason}", stacklevel=0)
@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+import bs4
+from bs4.element import PreformattedString
+from pandas.io.parsers import TextParser
+
+from sec_parser.utils.bs4_.get_single_table import get_single_table
+from sec_parser.utils.bs4_.table_check_data_cell import is_page_data_cell
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+    import pandas as pd
+
+_DEFAULT_INTERESTING_STRING_TYPES = (bs4.NavigableString, bs4.CData)
+
+# The same normalization as the one applied by pandas.read_html to cell texts.
+_WHITESPACE_PATTERN = re.compile(r"[\r\n]+|\s{2,}")
+
+# pandas.read_html only keeps the tables with at least one such text.
+_TEXT_PATTERN = re.compile(r".+")
+
+_DIGIT_PATTERN = re.compile(r"\d")
+
+_SPLIT_CELL_TEXT = "NaN"
+
+
+class TableCell:
+    """
+    A <td> or <th> cell, with its raw span attributes. Its text is only
+    joined and normalized when it is read.
+    """
+
+    __slots__ = ("_parts", "_text", "colspan", "hidden", "name", "rowspan")
+
+    def __init__(
+        self,
+        name: str,
+        rowspan: str | None,
+        colspan: str | None,
+        parts: list[str] | None = None,
+        *,
+        hidden: bool = False,
+    ) -> None:
+        self.name = name
+        self.rowspan = rowspan
+        self.colspan = colspan
+        # A <td> cell hidden with "display:none", only kept for its colspan.
+        self.hidden = hidden
+        self._parts: list[str] = [] if parts is None else parts
+        self._text: str | None = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            text = "".join(self._parts).strip()
+            self._text = _WHITESPACE_PATTERN.sub(" ", text)
+        return self._text
+
+
+@dataclass
+class TableGrid:
+    """
+    The TableGrid class holds the rows of a table, as read by pandas.read_html
+    from the same table: the rows are split into <thead>, body and <tfoot> rows,
+    the cells have the whitespace-normalized text of their descendants, and
+    the elements hidden with "display:none" are skipped, except for the
+    <td> cells spanning several columns, see `to_dataframe`.
+
+    It also holds the facts that are collected from all <tr>, <td> and <th>
+    tags of the table, hidden or not: the counts of `ApproxTableMetrics`,
+    whether a <td> tag has the text "page", and the dimensions of the table.
+    """
+
+    header_rows: list[list[TableCell]] = field(default_factory=list)
+    body_rows: list[list[TableCell]] = field(default_factory=list)
+    footer_rows: list[list[TableCell]] = field(default_factory=list)
+    has_text: bool = False
+    has_merged_data_cell: bool = False
+
+    rows_with_text: int = 0
+    cells_with_numbers: int = 0
+    has_row_without_data_cell: bool = False
+    has_page_data_cell: bool = False
+    row_count: int = 0
+    column_count: int = 0
+    cell_count: int = 0
+
+    def to_dataframe(self, *, split_merged_data_cells: bool = False) -> pd.DataFrame:
+        """
+        Return the same DataFrame as pandas.read_html for the table.
+
+        With `split_merged_data_cells`, the text of a <td> cell spanning several
+        columns is only kept in its last column, and its other columns are set
+        to NaN, instead of repeating the text in all of them. The other columns
+        of the hidden <td> cells are kept as well, and count as table text.
+        """
+        has_text = self.has_text or (
+            split_merged_data_cells and self.has_merged_data_cell
+        )
+        if not has_text:
+            msg = f"No tables found matching regex {_TEXT_PATTERN.pattern!r}"
+            raise ValueError(msg)
+        header_rows, body_rows = self.header_rows, self.body_rows
+        if not header_rows:
+            header_rows, body_rows = _split_header_rows(
+                body_rows,
+                split_merged_data_cells,
+            )
+        head = _expand_spans(header_rows, split_merged_data_cells)
+        body = _expand_spans(body_rows, split_merged_data_cells)
+        foot = _expand_spans(self.footer_rows, split_merged_data_cells)
+
+        header: int | list[int] | None = None
+        if head:
+            body = head + body
+            if len(head) == 1:
+                header = 0
+            else:
+                header = [i for i, row in enumerate(head) if any(row)]
+        body += foot
+
+        # Fill out the rows that are shorter than the others.
+        width = max((len(row) for row in body), default=0)
+        for row in body:
+            row.extend([""] * (width - len(row)))
+
+        with TextParser(body, header=header, skiprows=0, thousands=",") as parser:
+            return parser.read()
+
+
+def _get_span(value: str | None) -> int:
+    return int(value or 1)
+
+
+def _is_merged(colspan: str | None) -> bool:
+    try:
+        return colspan is not None and int(colspan) > 1
+    except ValueError:
+        return False
+
+
+def _split_header_rows(
+    rows: list[list[TableCell]],
+    split_merged_data_cells: bool,  # noqa: FBT001
+) -> tuple[list[list[TableCell]], list[list[TableCell]]]:
+    """
+    Like pandas.read_html, treat the top rows of <th> cells as the header.
+    The hidden cells only count when their other columns are kept.
+    """
+    count = 0
+    for cells in rows:
+        if not all(
+            cell.name == "th"
+            for cell in cells
+            if split_merged_data_cells or not cell.hidden
+        ):
+            break
+        count += 1
+    return rows[:count], rows[count:]
+
+
+def _split_merged_data_cells(cells: list[TableCell]) -> Iterator[TableCell]:
+    for cell in cells:
+        if cell.name == "td" and cell.colspan is not None:
+            split_cell = TableCell("td", None, None, [_SPLIT_CELL_TEXT])
+            for _ in range(int(cell.colspan) - 1):
+                yield split_cell
+            if not cell.hidden:
+                yield TableCell(cell.name, cell.rowspan, None, [cell.text])
+        elif not cell.hidden:
+            yield cell
+
+
+def _skip_hidden_cells(cells: list[TableCell]) -> Iterator[TableCell]:
+    return (cell for cell in cells if not cell.hidden)
+
+
+def _expand_spans(
+    rows: list[list[TableCell]],
+    split_merged_data_cells: bool,  # noqa: FBT001
+) -> list[list[str]]:
+    """
+    Return the texts of the rows, with the texts of the cells spanning
+    several rows or columns copied to all of them, as pandas.read_html does.
+    """
+    all_texts: list[list[str]] = []
+    # The cells spanning the next rows: (column, text, remaining rows).
+    remainder: list[tuple[int, str, int]] = []
+    for cells in rows:
+        texts: list[str] = []
+        next_remainder = []
+        index = 0
+        for cell in (
+            _split_merged_data_cells(cells)
+            if split_merged_data_cells
+            else _skip_hidden_cells(cells)
+        ):
+            while remainder and remainder[0][0] <= index:
+                prev_index, prev_text, prev_rowspan = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+                index += 1
+
+            rowspan = _get_span(cell.rowspan)
+            for _ in range(_get_span(cell.colspan)):
+                texts.append(cell.text)
+                if rowspan > 1:
+                    next_remainder.append((index, cell.text, rowspan - 1))
+                index += 1
+
+        for prev_index, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+        all_texts.append(texts)
+        remainder = next_remainder
+
+    # Rows that only exist because of the rowspan of the previous rows.
+    while remainder:
+        texts = []
+        next_remainder = []
+        for prev_index, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+        all_texts.append(texts)
+        remainder = next_remainder
+    return all_texts
+
+
+class _OpenElement:
+    __slots__ = (
+        "cell_count",
+        "cells",
+        "first_data_cell",
+        "has_digit",
+        "has_text",
+        "hidden",
+        "is_tr",
+        "name",
+        "rows",
+        "strings",
+    )
+
+    def __init__(self, name: str, *, hidden: bool) -> None:
+        self.name = name
+        self.hidden = hidden
+        self.is_tr = False
+        # The direct cells of a visible <tr> or <thead>.
+        self.cells: list[TableCell] | None = None
+        # The rows collected by a visible <thead>.
+        self.rows: list[list[TableCell]] | None = None
+        # The first <td> tag of a <tr> tag, and the metrics of a <td> tag.
+        self.first_data_cell: _OpenElement | None = None
+        self.has_text = False
+        self.has_digit = False
+        # The strings of a <td> tag, as included by bs4.Tag.text.
+        self.strings: list[str] | None = None
+        # The number of <td> and <th> tags of a <tr> tag.
+        self.cell_count = 0
+
+
+# Shared by the elements that are not part of the table structure.
+_VISIBLE_ELEMENT = _OpenElement("", hidden=False)
+_HIDDEN_ELEMENT = _OpenElement("", hidden=True)
+
+_TABLE_STRUCTURE_NAMES = frozenset(("br", "tbody", "td", "tfoot", "th", "thead", "tr"))
+
+
+class TableGridBuilder:
+    """
+    The TableGridBuilder class builds a TableGrid from the start and end events
+    of the elements of a table, and from its strings, in document order,
+    so that both backends can feed it from a single traversal of the table.
+    """
+
+    def __init__(self) -> None:
+        self._grid = TableGrid()
+        self._stack: list[_OpenElement] = []
+        self._theads: list[_OpenElement] = []
+        self._tbody_rows: list[list[TableCell]] = []
+        self._root_rows: list[list[TableCell]] = []
+        self._tfoot_rows: list[list[TableCell]] = []
+        self._tbody_depth = 0
+        self._tfoot_depth = 0
+        self._open_cells: list[TableCell] = []
+        self._open_trs: list[_OpenElement] = []
+        self._open_data_cells: list[_OpenElement] = []
+
+    def start(self, name: str, get_attribute: Callable[[str], str | None]) -> None:
+        stack = self._stack
+        if not stack:
+            stack.append(_OpenElement(name, hidden=False))
+            return
+        parent = stack[-1]
+        hidden = parent.hidden or _is_hidden(name, get_attribute("style"))
+        if name not in _TABLE_STRUCTURE_NAMES:
+            stack.append(_HIDDEN_ELEMENT if hidden else _VISIBLE_ELEMENT)
+            return
+        element = _OpenElement(name, hidden=hidden)
+        stack.append(element)
+
+        if name == "tr":
+            element.is_tr = True
+            self._open_trs.append(element)
+            self._grid.row_count += 1
+        elif name in ("td", "th"):
+            self._grid.cell_count += 1
+            if parent.is_tr:
+                parent.cell_count += 1
+            if name == "td":
+                self._start_data_cell(element, parent, get_attribute("colspan"))
+        if hidden:
+            return
+
+        if name in ("td", "th"):
+            if parent.cells is not None:
+                cell = TableCell(
+                    name,
+                    get_attribute("rowspan"),
+                    get_attribute("colspan"),
+                )
+                parent.cells.append(cell)
+                self._open_cells.append(cell)
+        elif name == "tr":
+            element.cells = []
+            if parent.rows is not None:
+                parent.rows.append(element.cells)
+            if self._tbody_depth:
+                self._tbody_rows.append(element.cells)
+            if parent is stack[0]:
+                self._root_rows.append(element.cells)
+            if self._tfoot_depth:
+                self._tfoot_rows.append(element.cells)
+        elif name == "thead":
+            element.cells = []
+            element.rows = []
+            self._theads.append(element)
+        elif name == "tbody":
+            self._tbody_depth += 1
+        elif name == "tfoot":
+            self._tfoot_depth += 1
+
+    def _start_data_cell(
+        self,
+        element: _OpenElement,
+        parent: _OpenElement,
+        colspan: str | None,
+    ) -> None:
+        element.strings = []
+        if _is_merged(colspan):
+            self._grid.has_merged_data_cell = True
+            if element.hidden and not parent.hidden and parent.cells is not None:
+                # The other columns of a hidden merged cell are kept
+                # when splitting merged cells, see `to_dataframe`.
+                parent.cells.append(TableCell("td", None, colspan, hidden=True))
+        for tr in self._open_trs:
+            if tr.first_data_cell is None:
+                tr.first_data_cell = element
+        self._open_data_cells.append(element)
+
+    def end(self) -> None:
+        element = self._stack.pop()
+        if element is _VISIBLE_ELEMENT or element is _HIDDEN_ELEMENT:
+            return
+        name = element.name
+        grid = self._grid
+        if element.is_tr:
+            self._open_trs.pop()
+            grid.column_count = max(grid.column_count, element.cell_count)
+            if element.first_data_cell is None:
+                grid.has_row_without_data_cell = True
+            elif element.first_data_cell.has_text:
+                grid.rows_with_text += 1
+        elif name == "td":
+            self._open_data_cells.pop()
+            if element.has_text:
+                if element.has_digit:
+                    grid.cells_with_numbers += 1
+                elif not grid.has_page_data_cell:
+                    text = "".join(element.strings).strip()  # type: ignore[arg-type]
+                    grid.has_page_data_cell = is_page_data_cell(text)
+        parent = self._stack[-1] if self._stack else None
+        if name == "br" and parent is not None and not parent.hidden:
+            # pandas.read_html prepends a line break to the tail of <br> tags,
+            # which is kept even if the <br> tag itself is hidden.
+            for cell in self._open_cells:
+                cell._parts.append("\n")  # noqa: SLF001
+        if element.hidden:
+            return
+
+        if name in ("td", "th"):
+            if parent is not None and parent.cells is not None:
+                self._open_cells.pop()
+        elif name == "thead":
+            if element.cells:
+                element.rows.append(element.cells)  # type: ignore[union-attr]
+        elif name == "tbody":
+            self._tbody_depth -= 1
+        elif name == "tfoot":
+            self._tfoot_depth -= 1
+
+    def add_string(self, string: str, *, is_text: bool, is_interesting: bool) -> None:
+        """
+        Add a string to the enclosing cells. The cell texts consist of all
+        `is_text` strings, i.e. all strings except comments and similar nodes,
+        and the metrics only take the `is_interesting` ones into account,
+        i.e. the strings included by bs4.Tag.text.
+        """
+        if is_interesting and self._open_data_cells:
+            has_text = not string.isspace() and string != ""
+            has_digit = _DIGIT_PATTERN.search(string) is not None
+            for data_cell in self._open_data_cells:
+                data_cell.strings.append(string)  # type: ignore[union-attr]
+                data_cell.has_text = data_cell.has_text or has_text
+                data_cell.has_digit = data_cell.has_digit or has_digit
+        if not is_text:
+            return
+        if not self._grid.has_text and _TEXT_PATTERN.search(string):
+            self._grid.has_text = True
+        if self._stack[-1].hidden:
+            return
+        for cell in self._open_cells:
+            cell._parts.append(string)  # noqa: SLF001
+
+    def build(self) -> TableGrid:
+        grid = self._grid
+        grid.header_rows = [row for thead in self._theads for row in thead.rows or ()]
+        grid.body_rows = self._tbody_rows + self._root_rows
+        grid.footer_rows = self._tfoot_rows
+        return grid
+
+
+def _is_hidden(name: str, style: str | None) -> bool:
+    return name == "style" or (
+        style is not None and "display:none" in style.replace(" ", "")
+    )
+
+
+def get_table_grid(bs4_tag: bs4.Tag) -> TableGrid:
+    """
+    Read the rows of the table in a single traversal of the tag,
+    without modifying it.
+    """
+    table = get_single_table(bs4_tag)
+    builder = TableGridBuilder()
+    builder.start(table.name, table.get)
+    stack = [iter(table.contents)]
+    while stack:
+        for child in stack[-1]:
+            if isinstance(child, bs4.Tag):
+                builder.start(child.name, child.get)
+                stack.append(iter(child.contents))
+                break
+            builder.add_string(
+                child,
+                is_text=not isinstance(child, PreformattedString),
+                is_interesting=type(child) in _DEFAULT_INTERESTING_STRING_TYPES,
+            )
+        else:
+            stack.pop()
+            builder.end()
+    return builder.build()
@@ -1,32 +1,31 @@
 import re
-from io import StringIO
 
 import bs4
 import pandas as pd
+from pandas.errors import EmptyDataError
 
-from sec_parser.utils.bs4_.get_single_table import get_single_table
+from sec_parser.utils.bs4_.table_grid import TableGrid, get_table_grid
 
 
 class TableToMarkdown:
     def __init__(self, tag: bs4.Tag) -> None:
         self._tag = tag
-        self._soup = bs4.BeautifulSoup("", features="lxml")
 
     def convert(self) -> str:
-        tag = get_single_table(self._tag)
-        unmerged = self._unmerge_cells(tag)
-        pandas_table = pd.read_html(StringIO(str(unmerged)), flavor="lxml")[0]
-        return self._to_markdown_table(pandas_table)
+        return self.convert_grid(get_table_grid(self._tag))
 
-    def _unmerge_cells(self, bs4_tag: bs4.Tag) -> bs4.Tag:
-        for td in bs4_tag.find_all("td"):
-            if td.has_attr("colspan"):
-                for _ in range(int(td["colspan"]) - 1):
-                    new_td = self._soup.new_tag("td")
-                    new_td.string = "NaN"
-                    td.insert_before(new_td)
-                td["colspan"] = 1
-        return bs4_tag
+    @classmethod
+    def convert_grid(cls, grid: TableGrid) -> str:
+        # The text of a data cell spanning several columns is only
+        # kept in its last column, the other ones are left empty.
+        try:
+            pandas_table = grid.to_dataframe(split_merged_data_cells=True)
+        except EmptyDataError:
+            # pandas.read_html skips the tables without columns, so there
+            # is no first table to convert.
+            msg = "list index out of range"
+            raise IndexError(msg) from None
+        return cls._to_markdown_table(pandas_table)
 
     @staticmethod
     def _to_markdown_table(pandas_table: pd.DataFrame) -> str:
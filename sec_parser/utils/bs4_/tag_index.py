@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import bs4
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+
+class TagIndexEntry(NamedTuple):
+    """The position and the structural facts of an indexed tag."""
+
+    name: str
+
+    # The descendants of the tag are numbered from `start + 1` to `end - 1`.
+    start: int
+    end: int
+
+    has_tag_children: bool
+    is_unary_tree: bool
+
+
+class TagIndex:
+    """
+    The TagIndex class is a structural index of the tags of a document.
+
+    The tags and the non-whitespace strings are numbered in document order
+    while traversing a tree once, so that the descendants of a tag are the
+    ones numbered between its start and its end. Queries about the
+    descendants of a tag are then answered by binary search in the numbers
+    of the tags with a given name, instead of traversing the descendants.
+
+    The index is filled by `index_document`, which the HTML tag parsers call
+    once per parsed document, and assumes that the indexed trees are not
+    modified afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Any, tuple[Any, TagIndexEntry]] = {}
+        self._starts: dict[str, list[int]] = {}
+        self._ends: dict[str, list[int]] = {}
+        self._text_positions: list[int] = []
+        self._size = 0
+
+    def get_entry(self, key: Any, node: Any) -> TagIndexEntry | None:  # noqa: ANN401
+        """
+        Return the entry of the node stored under the key, or None if the
+        node is not indexed. The node is compared by identity, so that ids
+        can be used as keys for nodes that are expensive to hash.
+        """
+        found = self._entries.get(key)
+        if found is None or found[0] is not node:
+            return None
+        return found[1]
+
+    def start_tag(self, name: str) -> tuple[int, int]:
+        """
+        Assign the next number to a tag, before its descendants. Returns the
+        start of the tag and the slot of its end, to be passed to `end_tag`.
+        """
+        start = self._size
+        self._size += 1
+        starts = self._starts.get(name)
+        if starts is None:
+            starts = self._starts[name] = []
+            self._ends[name] = []
+        starts.append(start)
+        self._ends[name].append(start)
+        return start, len(starts) - 1
+
+    def add_text(self) -> None:
+        """Assign the next number to a non-whitespace string."""
+        self._text_positions.append(self._size)
+        self._size += 1
+
+    def end_tag(
+        self,
+        key: Any,  # noqa: ANN401
+        node: Any,  # noqa: ANN401
+        name: str,
+        start_and_slot: tuple[int, int],
+        *,
+        has_tag_children: bool,
+        is_unary_tree: bool,
+    ) -> None:
+        """Store the entry of a tag once its descendants are numbered."""
+        start, slot = start_and_slot
+        self._ends[name][slot] = self._size
+        self._entries[key] = (
+            node,
+            TagIndexEntry(
+                name=name,
+                start=start,
+                end=self._size,
+                has_tag_children=has_tag_children,
+                is_unary_tree=is_unary_tree,
+            ),
+        )
+
+    def count_tags(self, entry: TagIndexEntry, name: str) -> int:
+        """Count the descendant tags with the specified name."""
+        starts = self._starts.get(name)
+        if not starts:
+            return 0
+        return bisect_left(starts, entry.end) - bisect_right(starts, entry.start)
+
+    def has_text_outside_tags(
+        self,
+        entry: TagIndexEntry,
+        tag_names: tuple[str, ...],
+    ) -> bool:
+        """
+        Check if the tag contains a non-whitespace string that is not enclosed
+        by a tag with one of the specified names, the tag itself included.
+        """
+        if entry.name in tag_names:
+            return False
+        text_count = self._count_texts(entry.start, entry.end)
+        if not text_count:
+            return False
+
+        spans: list[tuple[int, int]] = []
+        for name in set(tag_names):
+            starts = self._starts.get(name)
+            if not starts:
+                continue
+            first = bisect_right(starts, entry.start)
+            last = bisect_left(starts, entry.end)
+            spans.extend(zip(starts[first:last], self._ends[name][first:last]))
+        spans.sort()
+
+        enclosed_count = 0
+        current_end = entry.start
+        for start, end in spans:
+            if start < current_end:
+                # Nested in the previous span.
+                continue
+            enclosed_count += self._count_texts(start, end)
+            current_end = end
+        return enclosed_count < text_count
+
+    def _count_texts(self, start: int, end: int) -> int:
+        positions = self._text_positions
+        return bisect_left(positions, end) - bisect_right(positions, start)
+
+
+def get_tag_index_entry(tag: bs4.Tag, index: TagIndex) -> TagIndexEntry:
+    """
+    Return the index entry of the tag. The tags that are not part of a parsed
+    document, e.g. the tags created by the processing steps, are indexed on
+    the first query, together with the rest of their tree.
+    """
+    # Tags are keyed by id, as hashing a bs4.Tag serializes it.
+    entry = index.get_entry(id(tag), tag)
+    if entry is None:
+        index_document(tag, index)
+        entry = index.get_entry(id(tag), tag)
+    return entry  # type: ignore[return-value]
+
+
+def index_document(tag: bs4.Tag, index: TagIndex) -> None:
+    """Index the whole tree that the tag belongs to, from its root."""
+    root = tag
+    while root.parent is not None:
+        root = root.parent
+    index_tree(root, index)
+
+
+def index_tree(tag: bs4.Tag, index: TagIndex) -> None:
+    """Index the tag and its descendants in a single traversal."""
+    # For each open tag: its start, the number of its non-whitespace
+    # children, whether its last child is a unary tree or a string, and
+    # whether it has tag children.
+    root_frame = [index.start_tag(tag.name), 0, True, False]
+    stack: list[tuple[bs4.Tag, Iterator[bs4.PageElement], list]] = [
+        (tag, iter(tag.contents), root_frame),
+    ]
+    while stack:
+        node, children, frame = stack[-1]
+        for child in children:
+            if isinstance(child, bs4.Tag):
+                frame[1] += 1
+                frame[3] = True
+                child_frame = [index.start_tag(child.name), 0, True, False]
+                stack.append((child, iter(child.contents), child_frame))
+                break
+            if child.strip():
+                index.add_text()
+                frame[1] += 1
+                frame[2] = True
+        else:
+            stack.pop()
+            start_and_slot, child_count, last_child_is_unary, has_tag_children = frame
+            is_unary_tree = node.name == "table" or child_count == 0 or (
+                child_count == 1 and last_child_is_unary
+            )
+            index.end_tag(
+                id(node),
+                node,
+                node.name,
+                start_and_slot,
+                has_tag_children=has_tag_children,
+                is_unary_tree=is_unary_tree,
+            )
+            if stack:
+                stack[-1][2][2] = is_unary_tree
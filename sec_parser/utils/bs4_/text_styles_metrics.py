@@ -3,13 +3,18 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from sec_parser.exceptions import SecParserValueError
+from sec_parser.utils.bs4_.effective_styles import get_effective_styles
 
 if TYPE_CHECKING:  # pragma: no cover
     from bs4 import Tag
 
+    from sec_parser.utils.bs4_.effective_styles import EffectiveStylesTable
 
-def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
+
+def compute_text_styles_metrics(
+    tag: Tag,
+    effective_styles_table: EffectiveStylesTable | None = None,
+) -> dict[tuple[str, str], float]:
     """
     Compute the percentage distribution of various CSS styles within the
     text content of a given HTML tag and its descendants.
@@ -27,7 +32,12 @@ def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
 
     Each dictionary entry corresponds to a unique style, (property, value)
     and the percentage of text it affects.
+
+    The effective styles of the tags are stored in `effective_styles_table`,
+    which can be shared by all the tags of a document so that each tag is
+    resolved only once.
     """
+    table = {} if effective_styles_table is None else effective_styles_table
     total_chars: int = 0
     style_metrics: dict[tuple[str, str], float] = defaultdict(float)
 
@@ -38,9 +48,7 @@ def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
             continue
 
         total_chars += char_count
-        parent = text_node.find_parent()
-
-        effective_styles: dict[str, str] = _compute_effective_style(parent)
+        effective_styles = get_effective_styles(text_node.parent, table)
 
         for prop, val in effective_styles.items():
             style_metrics[(prop, val)] += char_count
@@ -51,30 +59,3 @@ def compute_text_styles_metrics(tag: Tag) -> dict[tuple[str, str], float]:
         )
 
     return style_metrics
-
-
-def _compute_effective_style(tag: Tag) -> dict[str, str]:
-    """
-    Aggregate the effective styles for a given tag by
-    traversing up the parent hierarchy.
-    """
-    effective_styles: dict[str, str] = {}
-    found_tag: Tag | None = tag
-    while found_tag:
-        if "style" in found_tag.attrs:
-            found_styles = found_tag["style"]
-            if isinstance(found_styles, list):  # pragma: no cover
-                # this should never happen, can't even construct a
-                # scenario where this would occur
-                msg = "Expected a string, got a list"
-                raise SecParserValueError(msg)
-            styles = found_styles.split(";")
-            for style in styles:
-                if ":" in style:
-                    prop, val = style.split(":", 1)
-                    prop = prop.strip()
-                    val = val.strip()
-                    # Only set if not previously set to respect CSS cascading rules
-                    effective_styles.setdefault(prop, val)
-        found_tag = found_tag.find_parent()
-    return effective_styles
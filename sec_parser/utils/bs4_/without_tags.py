@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 import copy
-from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 import bs4
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Collection, Iterable, Iterator
+
 
 def without_tags(tag: bs4.Tag, names: Iterable[str]) -> bs4.Tag:
     """
@@ -17,3 +22,45 @@ def without_tags(tag: bs4.Tag, names: Iterable[str]) -> bs4.Tag:
         for descendant in tag_copy.find_all(name=name):
             descendant.decompose()
     return tag_copy
+
+
+def iter_without_tags(
+    tag: bs4.Tag,
+    names: Collection[str],
+) -> Iterator[bs4.PageElement]:
+    """
+    Iterate over the tag and its descendants in document order, like
+    bs4.Tag.self_and_descendants does, but skip the descendant tags with
+    the specified names, together with their descendants. This allows to
+    read a tag as if the output of `without_tags` was used, without copying it.
+    """
+    yield tag
+    stack = [iter(tag.contents)]
+    while stack:
+        for child in stack[-1]:
+            if isinstance(child, bs4.Tag):
+                if child.name in names:
+                    continue
+                yield child
+                stack.append(iter(child.contents))
+                break
+            yield child
+        else:
+            stack.pop()
+
+
+def get_text_without_tags(tag: bs4.Tag, names: Collection[str]) -> str:
+    """
+    Return the same text as `without_tags(tag, names).text`,
+    without copying the tag.
+    """
+    types = tag.interesting_string_types
+    return "".join(
+        node
+        for node in iter_without_tags(tag, names)
+        if isinstance(node, bs4.NavigableString)
+        and (
+            types is None
+            or (type(node) is types if isinstance(types, type) else type(node) in types)
+        )
+    )
@@ -0,0 +1,19 @@
+from lxml import etree
+
+
+def contains_tag(
+    element: etree._Element,
+    name: str,
+    *,
+    include_self: bool = False,
+) -> bool:
+    """
+    `contains_tag` method checks if the current HTML tag contains a descendant tag
+    with the specified name. For example, calling contains_tag("b") on an
+    element representing "<div><p><b>text</b></p></div>" would
+    return True, as there is a 'b' tag within the descendants of the 'div' tag.
+    """
+    if include_self and element.tag == name:
+        return True
+
+    return next(element.iterdescendants(name), None) is not None
@@ -0,0 +1,15 @@
+from lxml import etree
+
+
+def count_tags(element: etree._Element, name: str) -> int:
+    """
+    `count_tags` method counts the number of descendant tags with the specified name
+    within the current HTML tag. For example, calling count_tags("b") on an
+    element representing "<div><p><b>text</b></p><b>more text</b></div>"
+    would return 2, as there are two 'b' tags within the descendants of the 'div' tag.
+    """
+    count = 0
+    if element.tag == name:
+        count += 1
+    count += sum(1 for _ in element.iterdescendants(name))
+    return count
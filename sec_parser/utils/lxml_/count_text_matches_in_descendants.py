@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from lxml import etree
+
+from sec_parser.utils.lxml_.get_text import get_text
+from sec_parser.utils.lxml_.string_nodes import (
+    STRING_CONTAINERS,
+    get_node_string,
+    get_string_container,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+_WALK_EVENTS = ("start", "end", "comment", "pi")
+
+_UNSET = object()
+
+
+def count_text_matches_in_descendants(
+    element: etree._Element,
+    predicate: Callable[[str], bool],
+    *,
+    exclude_links: bool | None = None,
+) -> int:
+    """
+    Count the unique texts of the descendant elements that match the predicate.
+    Descendants that form a unary tree around a link are skipped.
+    """
+    exclude_links = exclude_links if exclude_links is not None else False
+    unique_texts = set()
+    for text in _iter_descendant_texts(element):
+        if text and predicate(text):
+            unique_texts.add(text)
+    return len(unique_texts)
+
+
+class _Frame:
+    """The state of an element whose children are being traversed."""
+
+    __slots__ = (
+        "first_deepest_name",
+        "has_tag_children",
+        "last_child_is_unary_tree",
+        "non_blank_count",
+        "parts",
+    )
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self.non_blank_count = 0
+        self.last_child_is_unary_tree = True
+        self.has_tag_children = False
+        # The name of the first deepest tag of the first non-blank child,
+        # or None if that child is a string.
+        self.first_deepest_name: str | object | None = _UNSET
+
+    def add_string(self, string: str, *, is_text: bool) -> None:
+        if is_text:
+            self.parts.append(string)
+        if string.strip():
+            self.non_blank_count += 1
+            self.last_child_is_unary_tree = True
+            if self.first_deepest_name is _UNSET:
+                self.first_deepest_name = None
+
+
+def _iter_descendant_texts(element: etree._Element) -> Iterator[str]:
+    """
+    Yield the stripped text of each descendant element that is not a unary
+    tree whose first deepest tag is a link. The texts, the unary trees and the
+    first deepest tags (see `is_unary_tree` and `get_first_deepest_tag`) are
+    computed bottom-up, in a single traversal of the descendants.
+
+    Like in `get_text`, the strings enclosed by <script>, <style> and similar
+    tags are excluded from the texts of the elements that enclose these tags.
+    """
+    # The innermost string container enclosing the strings of each open element.
+    containers = [get_string_container(element.getparent())]
+    stack: list[_Frame] = []
+    for event, node in etree.iterwalk(element, events=_WALK_EVENTS):
+        if event == "start":
+            tag = node.tag
+            containers.append(tag if tag in STRING_CONTAINERS else containers[-1])
+            frame = _Frame()
+            stack.append(frame)
+            if node.text:
+                frame.add_string(node.text, is_text=containers[-1] is None)
+            continue
+        if event == "end":
+            containers.pop()
+            frame = stack.pop()
+            if node is element:
+                break
+            text = "".join(frame.parts)
+            is_unary_tree = (
+                node.tag == "table"
+                or frame.non_blank_count == 0
+                or (frame.non_blank_count == 1 and frame.last_child_is_unary_tree)
+            )
+            first_deepest_name = (
+                frame.first_deepest_name if frame.has_tag_children else node.tag
+            )
+
+            parent = stack[-1]
+            parent.parts.append(text)
+            parent.non_blank_count += 1
+            parent.last_child_is_unary_tree = is_unary_tree
+            parent.has_tag_children = True
+            if parent.first_deepest_name is _UNSET:
+                parent.first_deepest_name = first_deepest_name
+
+            if not (is_unary_tree and first_deepest_name == "a"):
+                if node.tag in STRING_CONTAINERS:
+                    # Their text consists of strings that are excluded above.
+                    text = get_text(node)
+                yield text.strip()
+        else:
+            # Comments and processing instructions are not part of the text.
+            stack[-1].add_string(get_node_string(node), is_text=False)
+        if node.tail:
+            stack[-1].add_string(node.tail, is_text=containers[-1] is None)
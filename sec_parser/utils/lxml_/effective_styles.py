@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sec_parser.utils.style_declarations import STYLE_DECLARATION_CACHE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lxml import etree
+
+# Maps an element to its effective styles.
+EffectiveStylesTable = dict["etree._Element", dict[str, str]]  # noqa: SLF001
+
+
+def get_effective_styles(
+    element: etree._Element | None,
+    table: EffectiveStylesTable,
+) -> dict[str, str]:
+    """
+    Return the effective styles of the element, i.e. the styles set on the
+    element and the ones it inherits from its ancestors, where the styles of
+    the closer elements take precedence.
+
+    The effective styles are computed top-down, from the closest ancestor
+    already in the table, so that each element is resolved only once per table.
+    """
+    chain: list[etree._Element] = []
+    inherited: dict[str, str] = {}
+    while element is not None:
+        found = table.get(element)
+        if found is not None:
+            inherited = found
+            break
+        chain.append(element)
+        element = element.getparent()
+
+    for node in reversed(chain):
+        styles = _parse_style(node)
+        for prop, val in inherited.items():
+            # Only set if not previously set to respect CSS cascading rules
+            styles.setdefault(prop, val)
+        table[node] = styles
+        inherited = styles
+    return inherited
+
+
+def _parse_style(element: etree._Element) -> dict[str, str]:
+    found_styles = element.get("style")
+    if found_styles is None:
+        return {}
+    return dict(STYLE_DECLARATION_CACHE.get(found_styles))
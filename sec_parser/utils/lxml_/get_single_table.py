@@ -0,0 +1,20 @@
+from lxml import etree
+
+from sec_parser.utils.bs4_.get_single_table import (
+    MultipleTablesFoundError,
+    NoTableFoundError,
+)
+
+
+def get_single_table(element: etree._Element) -> etree._Element:
+    if element.tag == "table":
+        return element
+    tables = element.iterdescendants("table")
+    table = next(tables, None)
+    if table is None:
+        msg = "No <table> tag found in the provided html."
+        raise NoTableFoundError(msg)
+    if next(tables, None) is not None:
+        msg = "Multiple <table> tags found in the provided html."
+        raise MultipleTablesFoundError(msg)
+    return table
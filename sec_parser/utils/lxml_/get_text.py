@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import bs4
+
+from sec_parser.utils.lxml_.string_nodes import (
+    STRING_CONTAINERS,
+    get_string_container,
+    iter_strings,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lxml import etree
+
+_DEFAULT_INTERESTING_STRING_TYPES = (bs4.NavigableString, bs4.CData)
+
+
+def get_text(element: etree._Element) -> str:
+    """
+    `get_text` returns the same text as bs4.Tag.text: the concatenation of all
+    strings within the element, excluding comments, processing instructions and
+    the contents of <script>, <style> and similar tags.
+    """
+    if (
+        get_string_container(element) is None
+        and next(element.iter(*STRING_CONTAINERS), None) is None
+    ):
+        # Fast path: lxml skips comments and processing instructions on its own.
+        return "".join(element.itertext())
+
+    if element.tag in STRING_CONTAINERS:
+        interesting_types: tuple[type[bs4.NavigableString], ...] = (
+            STRING_CONTAINERS[element.tag],
+        )
+    else:
+        interesting_types = _DEFAULT_INTERESTING_STRING_TYPES
+    return "".join(
+        string
+        for string, _, string_type in iter_strings(element)
+        if string_type in interesting_types
+    )
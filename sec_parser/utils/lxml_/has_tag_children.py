@@ -0,0 +1,5 @@
+from lxml import etree
+
+
+def has_tag_children(element: etree._Element) -> bool:
+    return next(element.iterchildren(etree.Element), None) is not None
@@ -0,0 +1,34 @@
+from lxml import etree
+
+from sec_parser.utils.lxml_.string_nodes import (
+    get_node_string,
+    is_element,
+    iter_child_nodes,
+)
+
+
+def has_text_outside_tags(
+    element: etree._Element,
+    tag_names: tuple[str, ...],
+) -> bool:
+    """
+    `has_text_outside_tags` function checks if the given
+    element has any text outside the specified tags.
+    For example, calling has_text_outside_tags(element, ("b",))
+    on an element representing "<div><p><b>text</b>extra text</p></div>"
+    would return True, as there is text outside the 'b'
+    tag within the descendants of the 'div' tag.
+
+    Like in the BeautifulSoup4 implementation, comments count as text.
+    """
+    if element.tag in tag_names:
+        return False
+    stack = [element]
+    while stack:
+        for child in iter_child_nodes(stack.pop()):
+            if is_element(child):
+                if child.tag not in tag_names:
+                    stack.append(child)
+            elif any(not c.isspace() for c in get_node_string(child)):
+                return True
+    return False
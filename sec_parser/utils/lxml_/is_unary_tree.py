@@ -0,0 +1,32 @@
+from lxml import etree
+
+from sec_parser.utils.lxml_.string_nodes import (
+    is_blank_string,
+    is_element,
+    iter_child_nodes,
+)
+
+
+def is_unary_tree(element: etree._Element) -> bool:
+    """
+    `is_unary_tree` determines if an lxml element forms a unary tree.
+    In a unary tree, each node has at most one child.
+
+    Unary trees can contain string leaves. However, if a non-leaf node
+    contains a non-empty string, the tree is not considered unary.
+
+    Additionally, if the some tag is a 'table', the function will return True
+    regardless of its children. This is because in the context of this application,
+    'table' tags are always considered unary.
+    """
+    while element.tag != "table":
+        children = [c for c in iter_child_nodes(element) if not is_blank_string(c)]
+        if len(children) == 0:
+            return True
+        if len(children) > 1:
+            return False
+        child = children[0]
+        if not is_element(child):
+            return True
+        element = child
+    return True
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from bs4.builder import HTMLTreeBuilder
+from lxml import etree
+
+from sec_parser.utils.lxml_.string_nodes import is_element
+
+ASCII_SPACES = str.maketrans(dict.fromkeys("\x20\x0a\x09\x0c\x0d"))
+PRESERVE_WHITESPACE_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+
+
+def normalize_whitespace(root: etree._Element) -> None:
+    """
+    Collapse whitespace-only strings in the same way as BeautifulSoup4 does
+    while building its tree: a string consisting only of ASCII whitespace is
+    replaced by a single newline (if it contains one) or a single space,
+    unless it is located inside a <pre> or <textarea> tag.
+
+    The tree is modified in place.
+    """
+    stack = [(root, False)]
+    while stack:
+        node, preserve = stack.pop()
+        preserve = preserve or node.tag in PRESERVE_WHITESPACE_TAGS
+        if not preserve:
+            if node.tag is etree.Comment:
+                # BeautifulSoup4 turns even empty comments into a single space.
+                if _is_blank(node.text or ""):
+                    node.text = collapse_whitespace(node.text or "")
+            elif is_element(node) and node.text and _is_blank(node.text):
+                node.text = collapse_whitespace(node.text)
+        for child in node:
+            if not preserve and child.tail and _is_blank(child.tail):
+                child.tail = collapse_whitespace(child.tail)
+            stack.append((child, preserve))
+
+
+def collapse_whitespace(text: str) -> str:
+    if not _is_blank(text):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _is_blank(text: str) -> bool:
+    return not text.translate(ASCII_SPACES)
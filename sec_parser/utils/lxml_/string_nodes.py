@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+import bs4
+from bs4.builder import HTMLTreeBuilder
+from lxml import etree
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+# A child node, as seen by BeautifulSoup4: either a string or an lxml node.
+# Comments and processing instructions are lxml nodes, but BeautifulSoup4
+# treats them as strings.
+ChildNode = Union[str, etree._Element]  # noqa: SLF001
+
+# Strings inside these tags are not treated as regular text by BeautifulSoup4,
+# e.g. the contents of <script> tags are excluded from the text of a tag.
+STRING_CONTAINERS: dict[str, type[bs4.NavigableString]] = dict(
+    HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS,
+)
+
+_WALK_EVENTS = ("start", "end", "comment", "pi")
+
+
+def is_element(node: ChildNode) -> bool:
+    """Return False for strings, comments and processing instructions."""
+    return not isinstance(node, str) and isinstance(node.tag, str)
+
+
+def get_node_string(node: ChildNode) -> str:
+    """
+    Return the string that BeautifulSoup4 stores for a text node, a comment
+    or a processing instruction node.
+    """
+    if isinstance(node, str):
+        return node
+    if node.tag is etree.ProcessingInstruction:
+        return f"{node.target} {node.text or ''}"
+    return node.text or ""
+
+
+def get_string_class(node: etree._Element) -> type[bs4.NavigableString]:
+    """Return the bs4 class of a comment or a processing instruction node."""
+    if node.tag is etree.ProcessingInstruction:
+        return bs4.ProcessingInstruction
+    return bs4.Comment
+
+
+def is_blank_string(node: ChildNode) -> bool:
+    """
+    Return True for strings, comments and processing instructions that
+    only consist of whitespace, e.g. the ones ignored by HtmlTag.get_children.
+    """
+    return not is_element(node) and get_node_string(node).strip() == ""
+
+
+def get_string_container(element: etree._Element | None) -> str | None:
+    """
+    Return the name of the innermost <script>, <style>, <template>, <rt> or <rp>
+    tag that encloses strings placed directly inside `element`.
+    """
+    while element is not None:
+        if element.tag in STRING_CONTAINERS:
+            return element.tag
+        element = element.getparent()
+    return None
+
+
+def iter_child_nodes(element: etree._Element) -> Iterator[ChildNode]:
+    """
+    Iterate over the direct children of the element in the same way as
+    bs4.Tag.children does: text and tails are yielded as separate strings.
+    """
+    if element.text:
+        yield element.text
+    for child in element:
+        yield child
+        if child.tail:
+            yield child.tail
+
+
+def iter_strings(
+    element: etree._Element,
+) -> Iterator[tuple[str, etree._Element, type[bs4.NavigableString]]]:
+    """
+    Iterate over all strings within the element in document order, in the same
+    way as bs4.Tag.descendants does, and yield them together with their parent
+    element and the bs4 class that BeautifulSoup4 would use for them.
+    """
+    containers = [get_string_container(element.getparent())]
+    for event, node in etree.iterwalk(element, events=_WALK_EVENTS):
+        if event == "start":
+            tag = node.tag
+            containers.append(tag if tag in STRING_CONTAINERS else containers[-1])
+            if node.text:
+                yield node.text, node, get_text_class(containers[-1])
+            continue
+        if event == "end":
+            containers.pop()
+            if node is element:
+                break
+        else:
+            yield get_node_string(node), node.getparent(), get_string_class(node)
+        if node.tail:
+            yield node.tail, node.getparent(), get_text_class(containers[-1])
+
+
+def get_text_class(container: str | None) -> type[bs4.NavigableString]:
+    """Return the bs4 class of a text node enclosed by the given string container."""
+    return STRING_CONTAINERS.get(container, bs4.NavigableString)  # type: ignore[arg-type]
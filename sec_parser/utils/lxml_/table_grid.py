@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from lxml import etree
+
+from sec_parser.utils.bs4_.table_grid import TableGrid, TableGridBuilder
+from sec_parser.utils.lxml_.get_single_table import get_single_table
+from sec_parser.utils.lxml_.string_nodes import (
+    STRING_CONTAINERS,
+    get_node_string,
+    get_string_container,
+)
+
+_WALK_EVENTS = ("start", "end", "comment", "pi")
+
+
+def get_table_grid(element: etree._Element) -> TableGrid:
+    """
+    Read the rows of the table in a single traversal of the element,
+    without modifying it.
+    """
+    table = get_single_table(element)
+    builder = TableGridBuilder()
+    # The innermost string container enclosing the strings of each open element.
+    containers = [get_string_container(table.getparent())]
+    for event, node in etree.iterwalk(table, events=_WALK_EVENTS):
+        if event == "start":
+            tag = node.tag
+            containers.append(tag if tag in STRING_CONTAINERS else containers[-1])
+            builder.start(tag, node.get)
+            if node.text:
+                builder.add_string(
+                    node.text,
+                    is_text=True,
+                    is_interesting=containers[-1] is None,
+                )
+            continue
+        if event == "end":
+            containers.pop()
+            builder.end()
+            if node is table:
+                break
+        else:
+            # Comments and processing instructions are not part of the text.
+            builder.add_string(
+                get_node_string(node),
+                is_text=False,
+                is_interesting=False,
+            )
+        if node.tail:
+            builder.add_string(
+                node.tail,
+                is_text=True,
+                is_interesting=containers[-1] is None,
+            )
+    return builder.build()
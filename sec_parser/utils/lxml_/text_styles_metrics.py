@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from sec_parser.utils.lxml_.effective_styles import get_effective_styles
+from sec_parser.utils.lxml_.string_nodes import iter_strings
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lxml import etree
+
+    from sec_parser.utils.lxml_.effective_styles import EffectiveStylesTable
+
+
+def compute_text_styles_metrics(
+    element: etree._Element,
+    effective_styles_table: EffectiveStylesTable | None = None,
+) -> dict[tuple[str, str], float]:
+    """
+    Compute the percentage distribution of various CSS styles within the
+    text content of a given lxml element and its descendants.
+
+    The result is identical to the one of the BeautifulSoup4 implementation,
+    including the order of the keys. The effective styles of the elements are
+    stored in `effective_styles_table`, which can be shared by all the elements
+    of a document so that each element is resolved only once.
+    """
+    table = {} if effective_styles_table is None else effective_styles_table
+    total_chars: int = 0
+    style_metrics: dict[tuple[str, str], float] = defaultdict(float)
+
+    for string, parent, _ in iter_strings(element):
+        char_count: int = len(string.strip())
+        if char_count == 0:
+            continue
+
+        total_chars += char_count
+        effective_styles = get_effective_styles(parent, table)
+
+        for prop, val in effective_styles.items():
+            style_metrics[(prop, val)] += char_count
+
+    for key in style_metrics:
+        style_metrics[key] = (
+            (style_metrics[key] / total_chars) * 100 if total_chars else 0
+        )
+
+    return style_metrics
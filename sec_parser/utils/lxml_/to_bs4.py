@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import bs4
+from lxml import etree
+
+from sec_parser.utils.lxml_.string_nodes import (
+    STRING_CONTAINERS,
+    get_node_string,
+    get_string_class,
+    get_string_container,
+    get_text_class,
+)
+
+_WALK_EVENTS = ("start", "end", "comment", "pi")
+
+
+def to_bs4(element: etree._Element) -> bs4.Tag:
+    """
+    `to_bs4` converts the lxml element into an equivalent, detached
+    bs4.Tag. It is used for the rarely needed operations that are
+    not implemented natively on top of lxml.
+    """
+    soup = bs4.BeautifulSoup("", features="lxml")
+    root: bs4.Tag | None = None
+    tags: list[bs4.Tag] = []
+    containers = [get_string_container(element.getparent())]
+    for event, node in etree.iterwalk(element, events=_WALK_EVENTS):
+        if event == "start":
+            tag = soup.new_tag(node.tag, attrs=dict(node.attrib))
+            if tags:
+                tags[-1].append(tag)
+            else:
+                root = tag
+            tags.append(tag)
+            name = node.tag
+            containers.append(name if name in STRING_CONTAINERS else containers[-1])
+            if node.text:
+                tag.append(get_text_class(containers[-1])(node.text))
+            continue
+        if event == "end":
+            tags.pop()
+            containers.pop()
+            if node is element:
+                break
+        else:
+            string_class = get_string_class(node)
+            tags[-1].append(string_class(get_node_string(node)))
+        if node.tail:
+            tags[-1].append(get_text_class(containers[-1])(node.tail))
+    if root is None:  # pragma: no cover
+        msg = "Expected the root element to be converted."
+        raise ValueError(msg)
+    return root
+
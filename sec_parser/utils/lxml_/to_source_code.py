@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import re
+
+from bs4.builder import HTMLTreeBuilder
+from bs4.formatter import HTMLFormatter
+from lxml import etree
+
+from sec_parser.utils.lxml_.string_nodes import get_node_string
+
+# BeautifulSoup4 always declares UTF-8 when it renders <meta> tags to a string.
+OUTPUT_ENCODING = "utf-8"
+
+_CDATA_CONTAINING_TAGS = frozenset(HTMLFormatter.REGISTRY["minimal"].cdata_containing_tags)
+_VOID_ELEMENT_TAGS = frozenset(HTMLTreeBuilder.empty_element_tags)
+_CDATA_LIST_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+_UNIVERSAL_CDATA_LIST_ATTRIBUTES = frozenset(_CDATA_LIST_ATTRIBUTES.get("*", ()))
+_NON_WHITESPACE_PATTERN = re.compile(r"\S+")
+_CHARSET_PATTERN = re.compile(r"((^|;)\s*charset=)([^;]*)", re.MULTILINE)
+_WALK_EVENTS = ("start", "end", "comment", "pi")
+
+
+def to_source_code(element: etree._Element) -> str:
+    """
+    `to_source_code` renders the element to HTML exactly like str(bs4.Tag) does
+    with the default "minimal" formatter: attributes are sorted, multi-valued
+    attributes such as "class" are normalized, void elements are rendered as
+    <br/> and the contents of <script> and <style> tags are not escaped.
+    """
+    parts: list[str] = []
+    for event, node in etree.iterwalk(element, events=_WALK_EVENTS):
+        if event == "start":
+            parts.append(_render_start_tag(node))
+            if node.text:
+                parts.append(_escape_text(node.text, node))
+            continue
+        if event == "end":
+            if not _is_void_element(node):
+                parts.append(f"</{node.tag}>")
+            if node is element:
+                break
+        elif node.tag is etree.Comment:
+            parts.append(f"<!--{get_node_string(node)}-->")
+        else:
+            parts.append(f"<?{get_node_string(node)}>")
+        if node.tail:
+            parts.append(_escape_text(node.tail, node.getparent()))
+    return "".join(parts)
+
+
+def _is_void_element(element: etree._Element) -> bool:
+    return element.tag in _VOID_ELEMENT_TAGS and not element.text and not len(element)
+
+
+def _render_start_tag(element: etree._Element) -> str:
+    name = element.tag
+    closing_slash = "/" if _is_void_element(element) else ""
+    if not element.attrib:
+        return f"<{name}{closing_slash}>"
+    attrs = _get_attribute_values(element)
+    rendered = " ".join(
+        f"{key}={_quote_attribute_value(_escape(attrs[key]))}" for key in sorted(attrs)
+    )
+    return f"<{name} {rendered}{closing_slash}>"
+
+
+def _get_attribute_values(element: etree._Element) -> dict[str, str]:
+    attrs = dict(element.attrib)
+    tag_specific = _CDATA_LIST_ATTRIBUTES.get(element.tag, ())
+    for key, value in attrs.items():
+        if key in _UNIVERSAL_CDATA_LIST_ATTRIBUTES or key in tag_specific:
+            attrs[key] = " ".join(_NON_WHITESPACE_PATTERN.findall(value))
+    if element.tag == "meta":
+        _substitute_meta_charset(attrs)
+    return attrs
+
+
+def _substitute_meta_charset(attrs: dict[str, str]) -> None:
+    if "charset" in attrs:
+        attrs["charset"] = OUTPUT_ENCODING
+        return
+    http_equiv = attrs.get("http-equiv")
+    if http_equiv is not None and http_equiv.lower() == "content-type":
+        content = attrs.get("content")
+        if content is not None:
+            attrs["content"] = _CHARSET_PATTERN.sub(
+                lambda match: match.group(1) + OUTPUT_ENCODING,
+                content,
+            )
+
+
+def _quote_attribute_value(value: str) -> str:
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return '"{}"'.format(value.replace('"', "&quot;"))
+
+
+def _escape_text(text: str, parent: etree._Element | None) -> str:
+    if parent is not None and parent.tag in _CDATA_CONTAINING_TAGS:
+        return text
+    return _escape(text)
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
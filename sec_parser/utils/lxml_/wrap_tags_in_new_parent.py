@@ -0,0 +1,32 @@
+from collections.abc import Iterable
+
+from lxml import etree
+
+
+def wrap_tags_in_new_parent(
+    parent_tag_name: str,
+    elements: Iterable[etree._Element],
+) -> etree._Element:
+    """
+    Move the elements into a new, detached parent element.
+
+    Like in BeautifulSoup4, the text that follows each element
+    stays where it was in the original tree.
+    """
+    new_element = etree.Element(parent_tag_name)
+    for element in elements:
+        tail, element.tail = element.tail, None
+        if tail:
+            _append_text_before(element, tail)
+        new_element.append(element)
+    return new_element
+
+
+def _append_text_before(element: etree._Element, text: str) -> None:
+    previous = element.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + text
+        return
+    parent = element.getparent()
+    if parent is not None:
+        parent.text = (parent.text or "") + text
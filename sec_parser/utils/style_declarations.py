@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from sec_parser.exceptions import SecParserValueError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
+DEFAULT_MAX_SIZE = 4096
+
+
+class StyleDeclarationCache:
+    """
+    The StyleDeclarationCache class is a thread-safe cache of parsed inline
+    `style` attributes, mapping each raw style string to its declarations.
+
+    Documents of the same filing agent reuse a small set of style strings,
+    so the cache is shared by all documents of the process. Once it holds
+    `max_size` style strings, the least recently used ones are evicted.
+    """
+
+    def __init__(self, *, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size < 0:
+            msg = f"max_size must be equal or greater than 0, got {max_size}"
+            raise SecParserValueError(msg)
+        self._max_size = max_size
+        self._declarations: OrderedDict[str, Mapping[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of the lookups that were hits, or None before any lookup."""
+        total = self._hits + self._misses
+        return self._hits / total if total else None
+
+    def __len__(self) -> int:
+        return len(self._declarations)
+
+    def get(self, style: str) -> Mapping[str, str]:
+        """
+        Return the declarations of the style string as a read-only mapping
+        from property to value, parsing the string if it is not cached.
+        """
+        with self._lock:
+            declarations = self._declarations.get(style)
+            if declarations is not None:
+                self._declarations.move_to_end(style)
+                self._hits += 1
+                return declarations
+            self._misses += 1
+
+        declarations = MappingProxyType(parse_style_declarations(style))
+        with self._lock:
+            self._declarations[style] = declarations
+            while len(self._declarations) > self._max_size:
+                self._declarations.popitem(last=False)
+        return declarations
+
+    def clear(self) -> None:
+        """Remove all the cached style strings and reset the statistics."""
+        with self._lock:
+            self._declarations.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def parse_style_declarations(style: str) -> dict[str, str]:
+    """
+    Parse an inline `style` attribute into a mapping from property to value.
+    If a property is declared more than once, the first declaration is kept.
+    """
+    declarations: dict[str, str] = {}
+    for declaration in style.split(";"):
+        if ":" in declaration:
+            prop, val = declaration.split(":", 1)
+            declarations.setdefault(prop.strip(), val.strip())
+    return declarations
+
+
+# Shared by all the documents parsed in the process.
+STYLE_DECLARATION_CACHE = StyleDeclarationCache()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+T = TypeVar("T")
+
+_END = object()
+
+
+def iter_preorder(
+    roots: Iterable[T],
+    get_children: Callable[[T], Iterable[T]],
+) -> Iterator[tuple[T, int]]:
+    """
+    Iterate over the nodes of a forest in pre-order, i.e. each node before its
+    children, together with their depth, where the roots are at depth 0.
+
+    The nodes are traversed with an explicit stack instead of recursion, so that
+    deeply nested nodes neither exceed the recursion limit nor slow down the
+    iteration. The children of a node are only requested once the node has been
+    yielded, so they reflect the changes made to the node in the meantime.
+    """
+    stack = [iter(roots)]
+    while stack:
+        node = next(stack[-1], _END)
+        if node is _END:
+            stack.pop()
+            continue
+        yield node, len(stack) - 1  # type: ignore[misc]
+        stack.append(iter(get_children(node)))  # type: ignore[arg-type]
+
+
+def iter_postorder(
+    roots: Iterable[T],
+    get_children: Callable[[T], Iterable[T]],
+) -> Iterator[tuple[T, int]]:
+    """
+    Iterate over the nodes of a forest in post-order, i.e. each node after its
+    children, together with their depth, where the roots are at depth 0.
+
+    Like `iter_preorder`, the nodes are traversed with an explicit stack, and
+    the children of a node are requested when the node is first reached.
+    """
+    stack: list[tuple[object, Iterator[T]]] = [(_END, iter(roots))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, _END)
+        if child is _END:
+            stack.pop()
+            if stack:
+                yield node, len(stack) - 1  # type: ignore[misc]
+            continue
+        stack.append((child, iter(get_children(child))))  # type: ignore[arg-type]
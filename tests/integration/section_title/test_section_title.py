@@ -8,6 +8,7 @@ from sec_parser.processing_engine.core import (
     AbstractSemanticElementParser,
     Edgar10QParser,
 )
+from sec_parser.processing_engine.html_tag_parser import LxmlHtmlTagParser
 
 CURRENT_DIR = Path(__file__).resolve().parent
 
@@ -23,3 +24,13 @@ def test_bold_titles(
 
     parser = Edgar10QParser(get_steps)
     check(parser, html_path, request)
+
+
+@pytest.mark.parametrize("html_path", list((CURRENT_DIR / "data").glob("*.html")))
+def test_bold_titles_with_lxml_backend(
+    html_path: Path,
+    check: Callable[[AbstractSemanticElementParser, Path, pytest.FixtureRequest], None],
+    request: pytest.FixtureRequest,
+):
+    parser = Edgar10QParser(html_tag_parser=LxmlHtmlTagParser())
+    check(parser, html_path, request)
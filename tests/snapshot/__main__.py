@@ -5,7 +5,11 @@ import sys
 import click
 import rich.traceback
 
-from tests.snapshot.manage_snapshots import VerificationFailedError, manage_snapshots
+from tests.snapshot.manage_snapshots import (
+    HTML_TAG_PARSERS,
+    VerificationFailedError,
+    manage_snapshots,
+)
 from tests.utils import DEFAULT_VALIDATION_DATA_DIR
 
 rich.traceback.install()
@@ -60,6 +64,12 @@ def update(
 @click.option("--accession_number", multiple=True, help="Filter by report IDs")
 @click.option("--yaml_path", help="Path to YAML filter file")
 @click.option("--quiet", is_flag=True, help="Print less output")
+@click.option(
+    "--html_tag_parser",
+    default="bs4",
+    type=click.Choice(list(HTML_TAG_PARSERS)),
+    help="HTML tag parser backend used to parse the documents.",
+)
 def verify(
     data_dir: str,
     document_type: list[str],
@@ -67,6 +77,7 @@ def verify(
     accession_number: list[str],
     yaml_path: str,
     quiet: bool,
+    html_tag_parser: str,
 ) -> None:
     """
     Verify the integrity and correctness of the end-to-end dataset snapshot.
@@ -85,6 +96,7 @@ def verify(
             accession_number,
             yaml_path,
             verbose=not quiet,
+            html_tag_parser=html_tag_parser,
         )
     except VerificationFailedError as e:
         print(e)
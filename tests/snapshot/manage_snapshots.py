@@ -14,6 +14,10 @@ from rich.panel import Panel
 from rich.table import Table
 
 from sec_parser import Edgar10QParser
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+)
 from tests.snapshot._overwrite_file import OverwriteResult, overwrite_with_change_track
 from tests.utils import load_yaml_filter, traverse_repository_for_filings
 
@@ -21,6 +25,10 @@ if TYPE_CHECKING:
     from tests.types import Report
 
 AVAILABLE_ACTIONS = ["update", "verify"]
+HTML_TAG_PARSERS = {
+    "bs4": HtmlTagParser,
+    "lxml": LxmlHtmlTagParser,
+}
 ALLOWED_MICROSECONDS_PER_CHAR = 1.2
 DEFAULT_YAML_FILTER_PATH = Path(__file__).parent / "selected-filings.yaml"
 
@@ -103,10 +111,14 @@ def manage_snapshots(
     yaml_path_str: str | None,
     *,
     verbose: bool = True,
+    html_tag_parser: str = "bs4",
 ) -> None:
     if action not in AVAILABLE_ACTIONS:
         msg = f"Invalid action. Available actions are: {AVAILABLE_ACTIONS}"
         raise ValueError(msg)
+    if html_tag_parser not in HTML_TAG_PARSERS:
+        msg = f"Invalid HTML tag parser. Available parsers are: {list(HTML_TAG_PARSERS)}"
+        raise ValueError(msg)
 
     yaml_path = Path(yaml_path_str) if yaml_path_str else None
     if (
@@ -162,7 +174,9 @@ def manage_snapshots(
             html_content = f.read()
 
         execution_time_start = time.perf_counter()
-        elements = Edgar10QParser().parse(
+        elements = Edgar10QParser(
+            html_tag_parser=HTML_TAG_PARSERS[html_tag_parser](),
+        ).parse(
             html_content,
             include_irrelevant_elements=True,
         )
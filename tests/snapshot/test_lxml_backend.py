@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+from sec_parser import Edgar10QParser
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+)
+from tests.snapshot.test_selected_filings import DEFAULT_YAML
+from tests.utils import load_yaml_filter, traverse_repository_for_filings
+
+SELECTED_ACCESSION_NUMBERS = load_yaml_filter(DEFAULT_YAML).get(
+    "accession_numbers",
+    [],
+)
+SELECTED_REPORTS = [
+    report
+    for report in traverse_repository_for_filings()
+    if report.accession_number in SELECTED_ACCESSION_NUMBERS
+]
+
+
+@pytest.mark.parametrize(
+    "report",
+    SELECTED_REPORTS,
+    ids=[report.identifier for report in SELECTED_REPORTS],
+)
+def test_lxml_backend_matches_bs4_backend(report):
+    # Arrange
+    html = report.primary_doc_html_path.read_text()
+
+    # Act
+    expected = Edgar10QParser(html_tag_parser=HtmlTagParser()).parse(
+        html,
+        include_irrelevant_elements=True,
+    )
+    actual = Edgar10QParser(html_tag_parser=LxmlHtmlTagParser()).parse(
+        html,
+        include_irrelevant_elements=True,
+    )
+
+    # Assert
+    assert [
+        e.to_dict(include_previews=True, include_contents=True) for e in actual
+    ] == [e.to_dict(include_previews=True, include_contents=True) for e in expected]
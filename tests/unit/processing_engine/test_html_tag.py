@@ -1,8 +1,16 @@
+import pickle
+
 import bs4
 import pytest
 from bs4 import NavigableString
 
 from sec_parser.processing_engine.html_tag import EmptyNavigableStringError, HtmlTag
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+)
+from sec_parser.utils.bs4_.table_facts import ApproxTableMetrics
+from sec_parser.utils.bs4_.without_tags import without_tags
 
 
 def test_init_with_non_empty_navigable_string():
@@ -53,6 +61,35 @@ def test_without_tags():
     assert actual == "<div>\n <p>\n  Text\n  a paragraph\n </p>\n</div>\n"
 
 
+def test_without_tags_does_not_copy_the_tag():
+    # Arrange
+    soup = bs4.BeautifulSoup(
+        "<div><p>Text <b>inside</b> a paragraph</p><b>bold</b></div>",
+        "html.parser",
+    )
+    html_tag = HtmlTag(soup.find("div"))
+    expected = HtmlTag(without_tags(soup.find("div"), ["b"]))
+
+    # Act
+    without_b_tag = html_tag.without_tags(["b"])
+    actual_children = without_b_tag.get_children()
+
+    # Assert
+    assert without_b_tag.text == expected.text
+    assert without_b_tag.get_source_code() == expected.get_source_code()
+    assert without_b_tag.get_source_code(pretty=True) == expected.get_source_code(
+        pretty=True,
+    )
+    assert [child.get_source_code() for child in actual_children] == [
+        child.get_source_code() for child in expected.get_children()
+    ]
+    assert actual_children[0].parent is without_b_tag
+    assert without_b_tag._filtered_copy is None
+    assert str(soup) == (
+        "<div><p>Text <b>inside</b> a paragraph</p><b>bold</b></div>"
+    ), "Expected the original tag to be left unchanged"
+
+
 @pytest.mark.parametrize(
     ("name", "tag_string", "expected"),
     values := [
@@ -158,3 +195,94 @@ def test_wrap_tags_in_new_parent():
     assert p_tag2.parent.name == "span"
     assert new_parent.parent.name == "span"
     assert new_parent.parent.name == "span"
+
+
+@pytest.mark.parametrize("html_tag_parser", [HtmlTagParser(), LxmlHtmlTagParser()])
+def test_pickle(html_tag_parser):
+    # Arrange
+    html = """<div style="font-weight:bold"><p>Styled <i>text</i></p><td nowrap>cell</td></div>"""
+    div = html_tag_parser.parse(html)[0]
+    p = div.get_children()[0]
+    # The effective styles depend on the ancestors, which are not pickled.
+    p.get_text_styles_metrics()
+
+    # Act
+    unpickled = pickle.loads(pickle.dumps(p))
+
+    # Assert
+    assert type(unpickled) is HtmlTag
+    assert unpickled.parent is None
+    assert unpickled.get_source_code() == p.get_source_code()
+    assert unpickled.text == p.text
+    assert unpickled.get_text_styles_metrics() == p.get_text_styles_metrics()
+    assert unpickled.get_approx_table_metrics() is None
+    assert unpickled.count_tags("i") == 1
+    assert [c.text for c in unpickled.get_children()] == ["Styled", "text"]
+
+
+def test_pickle_only_cached_results():
+    # Arrange
+    html = """<div><p>Some <i>text</i></p></div>"""
+    p = HtmlTagParser().parse(html)[0].get_children()[0]
+    _ = p.text
+
+    # Act
+    state = p.__getstate__()
+
+    # Assert
+    assert set(state) == {"_source_code", "_text", "_parser_backend"}
+
+
+def test_to_detached():
+    # Arrange
+    html = """<div style="font-weight:bold"><p>Styled <i>text</i></p></div>"""
+    p = HtmlTagParser().parse(html)[0].get_children()[0]
+
+    # Act
+    detached = p.to_detached()
+
+    # Assert
+    assert "_bs4" not in vars(detached)
+    assert detached.parent is None
+    assert detached.text == p.text
+    assert detached.to_dict() == p.to_dict()
+    assert detached.get_source_code() == p.get_source_code()
+    assert detached.count_tags("i") == 1
+
+
+@pytest.mark.parametrize(
+    "html_tag_parser",
+    [HtmlTagParser(), HtmlTagParser("html.parser"), LxmlHtmlTagParser()],
+)
+def test_detached_tree_is_parsed_like_the_document(html_tag_parser):
+    # Arrange
+    # Unlike "html.parser", lxml doesn't treat <wbr> as a void element.
+    html = "<div><wbr><b>bold</b> text</wbr></div>"
+    div = html_tag_parser.parse(html)[0]
+
+    # Act
+    detached = pickle.loads(pickle.dumps(div))
+
+    # Assert
+    assert [c.get_source_code() for c in detached.get_children()] == [
+        c.get_source_code() for c in div.get_children()
+    ]
+    assert detached.without_tags(["b"]).text == div.without_tags(["b"]).text
+
+
+@pytest.mark.parametrize("html_tag_parser", [HtmlTagParser(), LxmlHtmlTagParser()])
+def test_get_table_facts(html_tag_parser):
+    # Arrange
+    html = "<table><tr><td>Item</td><td>Page</td></tr><tr><td>1A</td><td>12</td></tr></table>"
+    tag = html_tag_parser.parse(html)[0]
+
+    # Act
+    facts = tag.get_table_facts()
+
+    # Assert
+    assert tag.get_table_facts() is facts
+    assert tag.is_table_of_content() is True
+    assert facts.metrics == ApproxTableMetrics(rows=2, numbers=2)
+    assert (facts.row_count, facts.column_count, facts.cell_count) == (2, 2, 4)
+    assert tag.get_approx_table_metrics() is facts.metrics
+    assert pickle.loads(pickle.dumps(tag)).get_table_facts() == facts
@@ -1,6 +1,14 @@
+import gc
+import io
+import weakref
+
 import pytest
 
-from sec_parser.processing_engine import HtmlTagParser
+from sec_parser.processing_engine import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+    StreamingHtmlTagParser,
+)
 
 from sec_parser.exceptions import SecParserValueError
 
@@ -20,3 +28,168 @@ def test_parse_no_html(html_string):
     # Act and Assert
     with pytest.raises(SecParserValueError):
         parser.parse(html_string)
+
+
+@pytest.mark.parametrize(
+    "html_string",
+    [
+        "",
+        "<html></html>",
+        "<html><body></body></html>",
+    ],
+)
+def test_streaming_parse_no_html(html_string):
+    # Arrange
+    parser = StreamingHtmlTagParser()
+
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        parser.parse(html_string)
+
+
+STREAMING_HTML = """<?xml version="1.0" encoding="utf-8"?>
+<html><head><title>Title</title></head>
+<body style="font-size:10pt">
+    <div><b>Bold — text</b></div>
+    loose text
+    <script>if (a<b) { document.write("<p>x</p>"); }</script>
+    <!-- comment -->
+    <table><tr><td>1</td><td colspan="2">2</td></tr></table>
+    <p>last &amp; final<br>line</p>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, None])
+@pytest.mark.parametrize("source_type", [str, bytes, io.StringIO, io.BytesIO])
+def test_streaming_parse_matches_html_tag_parser(chunk_size, source_type):
+    # Arrange
+    expected = HtmlTagParser().parse(STREAMING_HTML)
+    if source_type is str:
+        source = STREAMING_HTML
+    elif source_type is io.StringIO:
+        source = io.StringIO(STREAMING_HTML)
+    else:
+        source = STREAMING_HTML.encode("utf-8")
+        if source_type is io.BytesIO:
+            source = io.BytesIO(source)
+    parser = StreamingHtmlTagParser(chunk_size=chunk_size)
+
+    # Act
+    actual = list(parser.iter_parse(source))
+
+    # Assert
+    assert [tag.get_source_code() for tag in actual] == [
+        tag.get_source_code() for tag in expected
+    ]
+    # The emitted tags inherit the styles of their ancestors.
+    assert [tag.get_text_styles_metrics() for tag in actual] == [
+        tag.get_text_styles_metrics() for tag in expected
+    ]
+
+
+def test_streaming_parse_emits_tags_before_the_end_of_the_document():
+    # Arrange
+    chunks = [
+        "<html><body><div>first</div>",
+        "<div>second</div>",
+        "<div>third</div>",
+    ]
+
+    class Source:
+        def read(self, _):
+            if not chunks:
+                return ""
+            return chunks.pop(0)
+
+    parser = StreamingHtmlTagParser(chunk_size=1)
+
+    # Act
+    first = next(parser.iter_parse(Source()))
+
+    # Assert
+    assert first.text == "first"
+    assert chunks == ["<div>third</div>"]
+
+
+def test_streaming_parse_releases_emitted_tags():
+    # Arrange
+    html = "<html><body>" + "".join(f"<div><p>{i}</p></div>" for i in range(5)) + "</body></html>"
+    parser = StreamingHtmlTagParser(chunk_size=1)
+    references = []
+    released_while_parsing = []
+
+    # Act
+    for tag in parser.iter_parse(html):
+        gc.collect()
+        released_while_parsing.append([reference() is None for reference in references])
+        references.append(weakref.ref(tag._bs4))
+        del tag
+
+    # Assert
+    assert released_while_parsing == [[True] * i for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [HtmlTagParser(), StreamingHtmlTagParser(chunk_size=1)],
+    ids=["html_tag_parser", "streaming"],
+)
+def test_parse_indexes_the_document_once(parser):
+    # Arrange
+    html = "<html><body><div><p><b>a</b></p></div><p><b>b</b><i>c</i></p></body></html>"
+    tags = parser.parse(html)
+    sizes = [tag._tag_index._size for tag in tags]
+
+    # Act
+    for tag in tags:
+        for descendant in [tag, *tag.get_children(), tag.parent]:
+            descendant.contains_tag("b")
+            descendant.is_unary_tree()
+
+    # Assert
+    assert [tag._tag_index._size for tag in tags] == sizes
+
+
+@pytest.mark.parametrize(
+    "html_string",
+    [
+        "",
+        "<html></html>",
+        "<html><body></body></html>",
+    ],
+)
+def test_lxml_parse_no_html(html_string):
+    # Arrange
+    parser = LxmlHtmlTagParser()
+
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        parser.parse(html_string)
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        STREAMING_HTML,
+        STREAMING_HTML.encode("utf-8"),
+        "<p>no html tag</p>  text",
+        "<!-- only a comment -->",
+        "<html><head><title>No body</title></head></html>",
+        '<table><tr><td nowrap>1</td><td nowrap="nowrap">2</td></tr></table><hr noshade>',
+        '<table><tr><td nowrap>1</td><td NOWRAP>2</td></tr></table>',
+        "<div><pre>  keep \n </pre>\n\t<textarea> </textarea> <!----> </div>",
+    ],
+)
+def test_lxml_parse_matches_html_tag_parser(html):
+    # Arrange
+    expected = HtmlTagParser().parse(html)
+
+    # Act
+    actual = LxmlHtmlTagParser().parse(html)
+
+    # Assert
+    assert [tag.get_source_code() for tag in actual] == [
+        tag.get_source_code() for tag in expected
+    ]
+    assert [tag.text for tag in actual] == [tag.text for tag in expected]
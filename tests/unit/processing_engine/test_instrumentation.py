@@ -0,0 +1,140 @@
+import bs4
+import pytest
+
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_engine.html_tag import (
+    HtmlTag,
+    get_tracked_cache_access_counts,
+    track_cache_accesses,
+)
+from sec_parser.processing_engine.instrumentation import (
+    CheckStats,
+    Instrumentation,
+    InstrumentationCallback,
+    StepStats,
+)
+
+HTML = """
+    <div><b>Item 1. Financial Statements</b></div>
+    <p>Some text.</p>
+    <div><p>First paragraph.</p><p>Second paragraph.</p></div>
+    <table><tr><td>Revenue</td><td>10</td></tr><tr><td>Cost</td><td>5</td></tr></table>
+"""
+
+
+class RecordingCallback(InstrumentationCallback):
+    def __init__(self):
+        self.step_names = []
+        self.parse_stats = []
+
+    def on_step_end(self, stats):
+        self.step_names.append(stats.name)
+
+    def on_parse_end(self, stats):
+        self.parse_stats.append(stats)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_instrumented_parse(lazy):
+    # Arrange
+    callback = RecordingCallback()
+    instrumentation = Instrumentation([callback])
+    parser = Edgar10QParser(instrumentation=instrumentation)
+    expected = [e.to_dict() for e in Edgar10QParser().parse(HTML)]
+
+    # Act
+    if lazy:
+        elements = list(parser.iter_parse(HTML))
+    else:
+        elements = parser.parse(HTML)
+
+    # Assert
+    assert [e.to_dict() for e in elements] == expected
+    stats = instrumentation.last_stats
+    assert callback.parse_stats == [stats]
+    assert callback.step_names == [s.name for s in stats.steps]
+    assert stats.wall_time > 0
+    assert stats.cache_hits + stats.cache_misses > 0
+
+    extractor_step = stats.steps[0]
+    assert extractor_step.name == "FusedElementwiseProcessingStep"
+    assert extractor_step.elements_in == 4
+    assert extractor_step.elements_out == 4
+    assert extractor_step.transformations[
+        ("NotYetClassifiedElement", "CompositeSemanticElement")
+    ] == 1
+    assert extractor_step.transformations[
+        ("NotYetClassifiedElement", "TableElement")
+    ] == 1
+
+    inner_step = extractor_step.inner_steps[0]
+    assert inner_step.name == "IndividualSemanticElementExtractor"
+    assert inner_step.elements_in == 5
+    assert inner_step.transformations == {
+        ("NotYetClassifiedElement", "CompositeSemanticElement"): 1,
+    }
+
+    text_step = stats.steps[3]
+    assert [s.name for s in text_step.inner_steps] == [
+        "TextClassifier",
+        "HighlightedTextClassifier",
+        "SupplementaryTextClassifier",
+    ]
+    assert text_step.transformations[
+        ("NotYetClassifiedElement", "TextElement")
+    ] == 2
+
+    merger_step = stats.steps[-1]
+    assert merger_step.name == "TextElementMerger"
+    assert merger_step.elements_in == 4
+    assert merger_step.transformations == {}
+
+    assert [c.name for c in stats.checks] == [
+        "TableCheck",
+        "XbrlTagCheck",
+        "ImageCheck",
+        "TopSectionTitleCheck",
+    ]
+    assert stats.checks[0].calls == 3
+    assert stats.checks[0].results == {None: 2, True: 1}
+
+
+def test_instrumented_parse_keeps_processing_logs():
+    # Arrange
+    parser = Edgar10QParser(instrumentation=Instrumentation())
+
+    # Act
+    elements = parser.parse(HTML, unwrap_elements=False)
+
+    # Assert
+    expected = Edgar10QParser().parse(HTML, unwrap_elements=False)
+    assert [e.processing_log.get_items() for e in elements] == [
+        e.processing_log.get_items() for e in expected
+    ]
+
+
+def test_cache_access_counts():
+    # Arrange
+    tag = HtmlTag(bs4.BeautifulSoup("<p>text</p>", "lxml").p)
+    tag.get_source_code()
+
+    # Act
+    with track_cache_accesses() as counts:
+        _ = tag.text
+        with track_cache_accesses() as nested_counts:
+            _ = tag.text
+        tag.count_tags("b")
+        tag.get_source_code()
+        tracked_counts = get_tracked_cache_access_counts()
+
+    # Assert
+    assert nested_counts is counts
+    assert counts == [2, 2]
+    assert tracked_counts == (2, 2)
+    assert get_tracked_cache_access_counts() == (0, 0)
+
+
+def test_cache_hit_rate():
+    # Act and Assert
+    assert StepStats(name="step").cache_hit_rate is None
+    assert CheckStats(name="check", cache_hits=3, cache_misses=1).cache_hit_rate == 0.75
@@ -0,0 +1,130 @@
+import bs4
+import pytest
+from lxml import etree
+
+from sec_parser.processing_engine.html_tag import EmptyNavigableStringError, HtmlTag
+from sec_parser.processing_engine.html_tag_parser import (
+    HtmlTagParser,
+    LxmlHtmlTagParser,
+)
+from sec_parser.processing_engine.lxml_html_tag import LxmlHtmlTag
+
+HTML = """
+<html><body style="font-family:Times">
+<div class=" a  b " title='say "hi"'><span style="font-weight:bold">Item 1.</span>
+    <span style="font-weight: bold; font-size:10pt">&#160;Business</span>
+</div>
+<p>Text <b>bold</b> &amp; <i>italic</i> &lt;tag&gt;<br>more<!-- note --></p>
+<div><script>var x = 1 < 2 && 3 > 2;</script><style>.a{}</style><span>visible</span></div>
+<div><a href="#toc">Table of Contents</a></div>
+<table><tr><td nowrap>Item</td><td></td><td>Page</td></tr>
+<tr><td>1A.</td><td><p style="text-align:center">Risk Factors</p></td><td>12</td></tr></table>
+<div><table><tr><th>no data cell</th></tr></table></div>
+<div><pre>  pre
+  formatted </pre> <img src="x.png" alt="x"/></div>
+<ix:nonnumeric name="us-gaap:Foo"><div><span>Tagged</span></div></ix:nonnumeric>
+<ruby>漢<rt>kan</rt></ruby><template><p>hidden</p></template>
+plain trailing text
+</body></html>
+"""
+
+
+def _all_tags(tags):
+    for tag in tags:
+        yield tag
+        if tag.has_tag_children():
+            yield from _all_tags(tag.get_children())
+
+
+def _describe(tag):
+    metrics = tag.get_approx_table_metrics()
+    try:
+        is_table_of_content = tag.is_table_of_content()
+    except Exception as e:  # noqa: BLE001
+        is_table_of_content = type(e).__name__
+    return {
+        "name": tag.name,
+        "text": tag.text,
+        "source_code": tag.get_source_code(),
+        "pretty_source_code": tag.get_source_code(pretty=True),
+        "dict": tag.to_dict(),
+        "has_tag_children": tag.has_tag_children(),
+        "contains_tag": [tag.contains_tag(n, include_self=True) for n in ("b", "table")],
+        "count_tags": [tag.count_tags(n) for n in ("span", "td")],
+        "has_text_outside_tags": [tag.has_text_outside_tags(["b"]), tag.has_text_outside_tags("span")],
+        "is_unary_tree": tag.is_unary_tree(),
+        "contains_words": tag.contains_words(),
+        "text_styles_metrics": list(tag.get_text_styles_metrics().items()),
+        "approx_table_metrics": metrics and (metrics.rows, metrics.numbers),
+        "is_table_of_content": is_table_of_content,
+        "count_text_matches": tag.count_text_matches_in_descendants(lambda s: "e" in s),
+        "without_tags": tag.without_tags(["b", "span"]).get_source_code(),
+    }
+
+
+@pytest.mark.filterwarnings("ignore:Failed to get table metrics")
+def test_lxml_html_tag_matches_html_tag():
+    # Arrange
+    expected_tags = list(_all_tags(HtmlTagParser().parse(HTML)))
+
+    # Act
+    actual_tags = list(_all_tags(LxmlHtmlTagParser().parse(HTML)))
+
+    # Assert
+    assert all(isinstance(tag, LxmlHtmlTag) for tag in actual_tags)
+    assert [_describe(t) for t in actual_tags] == [_describe(t) for t in expected_tags]
+
+
+def test_table_to_markdown():
+    # Arrange
+    expected = next(t for t in HtmlTagParser().parse(HTML) if t.name == "table")
+
+    # Act
+    actual = next(t for t in LxmlHtmlTagParser().parse(HTML) if t.name == "table")
+
+    # Assert
+    assert actual.table_to_markdown() == expected.table_to_markdown()
+
+
+def test_wrap_tags_in_new_parent():
+    # Arrange
+    html = "<div>first</div> tail <p>second</p><span>third</span>"
+    expected_tags = HtmlTagParser().parse(html)
+    actual_tags = LxmlHtmlTagParser().parse(html)
+    body = actual_tags[0]._element.getparent()
+
+    # Act
+    expected = HtmlTag.wrap_tags_in_new_parent("div", expected_tags[::2])
+    actual = HtmlTag.wrap_tags_in_new_parent("div", actual_tags[::2])
+
+    # Assert
+    assert isinstance(actual, LxmlHtmlTag)
+    assert actual.get_source_code() == expected.get_source_code()
+    assert actual.text == expected.text
+    assert etree.tostring(body, encoding=str) == "<body> tail <span>third</span></body>"
+
+
+def test_init_with_comment():
+    # Arrange
+    comment = etree.Comment(" note ")
+
+    # Act
+    html_tag = LxmlHtmlTag(comment)
+
+    # Assert
+    assert html_tag.name == "span"
+    assert html_tag.text == "note"
+    assert html_tag.get_source_code() == "<span> note </span>"
+    assert html_tag.parent is None
+
+
+def test_init_with_empty_string():
+    # Act & Assert
+    with pytest.raises(EmptyNavigableStringError):
+        LxmlHtmlTag(" \n ")
+
+
+def test_init_with_unsupported_type():
+    # Act & Assert
+    with pytest.raises(TypeError):
+        LxmlHtmlTag(bs4.Tag(name="div"))
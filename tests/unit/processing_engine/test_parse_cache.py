@@ -0,0 +1,171 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.core import Edgar10KParser, Edgar10QParser
+from sec_parser.processing_engine.parse_cache import ParseCache, get_fingerprint
+from sec_parser.processing_engine.types import ParsingOptions
+from sec_parser.processing_steps.text_classifier import TextClassifier
+from sec_parser.semantic_elements.semantic_elements import (
+    NotYetClassifiedElement,
+    TextElement,
+)
+
+HTML = "<div><b>Item 1. Financial Statements</b></div><p>Some text.</p>"
+
+
+def test_parse_with_cache(tmp_path):
+    # Arrange
+    parser = Edgar10QParser(parse_cache=ParseCache(tmp_path))
+    expected = [e.to_dict(include_previews=True) for e in Edgar10QParser().parse(HTML)]
+
+    # Act
+    first = parser.parse(HTML)
+    files = list(tmp_path.iterdir())
+    second = parser.parse(HTML)
+
+    # Assert
+    assert len(files) == 1
+    assert [e.to_dict(include_previews=True) for e in first] == expected
+    assert [e.to_dict(include_previews=True) for e in second] == expected
+    assert [e.text for e in second] == [e.text for e in first]
+
+
+def test_parse_with_cache_hit_does_not_parse(tmp_path):
+    # Arrange
+    Edgar10QParser(parse_cache=ParseCache(tmp_path)).parse(HTML)
+
+    def get_steps():
+        msg = "Should not be called"
+        raise AssertionError(msg)
+
+    parser = Edgar10QParser(parse_cache=ParseCache(tmp_path))
+    parser._fingerprint = Edgar10QParser().get_fingerprint()
+    parser._get_steps = get_steps
+
+    # Act
+    elements = parser.parse(HTML)
+
+    # Assert
+    assert [type(e) for e in elements] == [
+        type(e) for e in Edgar10QParser().parse(HTML)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("parser", "parse_kwargs"),
+    [
+        (Edgar10KParser(), {}),
+        (Edgar10QParser(), {"unwrap_elements": False}),
+        (Edgar10QParser(parsing_options=ParsingOptions(html_integrity_checks=True)), {}),
+        (
+            Edgar10QParser(
+                lambda: [TextClassifier(types_to_process={NotYetClassifiedElement})],
+            ),
+            {},
+        ),
+    ],
+)
+def test_cache_key_depends_on_configuration(tmp_path, parser, parse_kwargs):
+    # Arrange
+    cache = ParseCache(tmp_path)
+    Edgar10QParser(parse_cache=cache).parse(HTML)
+    parser._parse_cache = cache
+
+    # Act
+    parser.parse(HTML, **parse_kwargs)
+
+    # Assert
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_get_fingerprint_is_deterministic():
+    # Arrange
+    steps = [
+        TextClassifier(types_to_process={NotYetClassifiedElement, TextElement}),
+    ]
+    same_steps = [
+        TextClassifier(types_to_process={TextElement, NotYetClassifiedElement}),
+    ]
+    other_steps = [TextClassifier(types_to_process={TextElement})]
+
+    # Act and Assert
+    assert get_fingerprint(steps) == get_fingerprint(same_steps)
+    assert get_fingerprint(steps) != get_fingerprint(other_steps)
+    assert Edgar10QParser().get_fingerprint() == Edgar10QParser().get_fingerprint()
+    assert Edgar10QParser().get_fingerprint() != Edgar10KParser().get_fingerprint()
+
+
+def test_evict_least_recently_used(tmp_path):
+    # Arrange
+    elements = Edgar10QParser().parse(HTML)
+    cache = ParseCache(tmp_path)
+    cache.set("a", elements)
+    size = os.path.getsize(tmp_path / "a.pickle")
+    cache = ParseCache(tmp_path, max_size=2 * size)
+    cache.set("b", elements)
+    os.utime(tmp_path / "a.pickle", (0, 0))
+    os.utime(tmp_path / "b.pickle", (1, 1))
+    cache.get("a")
+
+    # Act
+    cache.set("c", elements)
+
+    # Assert
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_set_scans_directory_only_on_eviction(tmp_path):
+    # Arrange
+    elements = Edgar10QParser().parse(HTML)
+    cache = ParseCache(tmp_path)
+    cache.set("a", elements)
+    size = os.path.getsize(tmp_path / "a.pickle")
+    cache = ParseCache(tmp_path, max_size=3 * size)
+    cache.set("a", elements)
+
+    # Act
+    with patch.object(ParseCache, "evict", wraps=cache.evict) as mock_evict:
+        cache.set("a", elements)
+        cache.set("b", elements)
+        cache.set("c", elements)
+        mock_evict.assert_not_called()
+        cache.set("d", elements)
+
+    # Assert
+    mock_evict.assert_called_once()
+    assert sorted(p.name for p in tmp_path.glob("*.pickle")) == [
+        "b.pickle",
+        "c.pickle",
+        "d.pickle",
+    ]
+
+
+def test_get_missing_key(tmp_path):
+    # Arrange
+    cache = ParseCache(tmp_path / "missing")
+
+    # Act and Assert
+    assert cache.get("key") is None
+
+
+def test_clear(tmp_path):
+    # Arrange
+    cache = ParseCache(tmp_path)
+    cache.set("key", Edgar10QParser().parse(HTML))
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert cache.get("key") is None
+
+
+def test_invalid_max_size(tmp_path):
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        ParseCache(tmp_path, max_size=-1)
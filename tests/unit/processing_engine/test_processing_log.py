@@ -0,0 +1,119 @@
+import pytest
+
+from sec_parser.processing_engine.processing_log import (
+    LogItem,
+    ProcessingLog,
+    ProcessingLogLevel,
+)
+
+
+def test_copy_shares_items():
+    # Arrange
+    log = ProcessingLog()
+    log.add_item(message="first", log_origin="a")
+
+    # Act
+    copy1 = log.copy()
+    copy1.add_item(message="second", log_origin="b")
+    log.add_item(message="original", log_origin="c")
+    copy2 = copy1.copy()
+    copy2.add_item(message="third", log_origin="d")
+    copy1.add_item(message="fourth", log_origin="e")
+
+    # Assert
+    assert log.get_items() == (
+        LogItem("a", "first"),
+        LogItem("c", "original"),
+    )
+    assert copy1.get_items() == (
+        LogItem("a", "first"),
+        LogItem("b", "second"),
+        LogItem("e", "fourth"),
+    )
+    assert copy2.get_items() == (
+        LogItem("a", "first"),
+        LogItem("b", "second"),
+        LogItem("d", "third"),
+    )
+    assert copy1._log == [LogItem("b", "second"), LogItem("e", "fourth")]
+
+
+def test_copy_of_copy_without_new_items():
+    # Arrange
+    log = ProcessingLog()
+    log.add_item(message="first", log_origin="a")
+
+    # Act
+    copy = log.copy().copy().copy()
+    copy.add_item(message="second", log_origin="b")
+
+    # Assert
+    assert copy._parent is log
+    assert copy.get_items() == (LogItem("a", "first"), LogItem("b", "second"))
+    assert ProcessingLog().copy().get_items() == ()
+
+
+def test_long_chain_of_copies():
+    # Arrange
+    log = ProcessingLog()
+
+    # Act
+    for i in range(5000):
+        log.add_item(message=str(i), log_origin="a")
+        log = log.copy()
+
+    # Assert
+    assert [item.payload for item in log.get_items()] == [
+        str(i) for i in range(5000)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("level", "expected"),
+    [
+        (ProcessingLogLevel.OFF, ()),
+        (ProcessingLogLevel.SUMMARY, (LogItem("a", "summary"),)),
+        (
+            ProcessingLogLevel.FULL,
+            (LogItem("a", "summary"), LogItem("b", "detail")),
+        ),
+    ],
+)
+def test_levels(level, expected):
+    # Arrange
+    log = ProcessingLog.create(level)
+
+    # Act
+    log.add_item(message="summary", log_origin="a", is_summary=True)
+    log.copy().add_item(message="ignored", log_origin="c")
+    log.add_item(message=lambda: "detail", log_origin="b")
+
+    # Assert
+    assert log.get_items() == expected
+    assert log.copy().level is level
+
+
+def test_disabled_log_does_not_build_messages():
+    # Arrange
+    log = ProcessingLog.create(ProcessingLogLevel.OFF)
+
+    def message():
+        msg = "Should not be called"
+        raise AssertionError(msg)
+
+    # Act
+    log.add_item(message=message, log_origin="a", is_summary=True)
+
+    # Assert
+    assert log.copy() is log
+    assert ProcessingLog.create(ProcessingLogLevel.OFF) is log
+
+
+def test_disabled_log_level_cannot_be_changed():
+    # Arrange
+    log = ProcessingLog.create(ProcessingLogLevel.OFF)
+
+    # Act and Assert
+    with pytest.raises(AttributeError):
+        log.level = ProcessingLogLevel.FULL  # type: ignore[misc]
+    assert ProcessingLog.create(ProcessingLogLevel.OFF).level is ProcessingLogLevel.OFF
@@ -1,13 +1,23 @@
+import io
 from unittest.mock import patch
 
 import pytest
 
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine import LxmlHtmlTagParser, StreamingHtmlTagParser
 from sec_parser.processing_engine.core import Edgar10QParser
-from sec_parser.processing_engine.processing_log import LogItem
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.processing_log import LogItem, ProcessingLogLevel
+from sec_parser.processing_engine.types import ParsingOptions
+from sec_parser.processing_steps.highlighted_text_classifier import (
+    HighlightedTextClassifier,
+)
 from sec_parser.semantic_elements.composite_semantic_element import (
     CompositeSemanticElement,
 )
+from sec_parser.semantic_elements.semantic_elements import TextElement
 from sec_parser.semantic_elements.title_element import TitleElement
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
 from tests.unit._utils import assert_elements
 
 
@@ -83,3 +93,379 @@ def test_transformation_history(name, html_str, expected_processing_log):
         len(processed_elements) == 1
     )  # For simplicity, while crafting `html_str` make sure it always returns single element.
     assert processing_log == expected_processing_log
+
+
+@pytest.mark.parametrize("source_type", [str, io.StringIO, io.BytesIO])
+@pytest.mark.parametrize(
+    "html_tag_parser",
+    [None, StreamingHtmlTagParser(chunk_size=1)],
+    ids=["default", "streaming"],
+)
+def test_iter_parse_matches_parse(html_tag_parser, source_type):
+    # Arrange
+    html_str = """
+        <div><b>Part I</b></div>
+        <div><b>Item 1. Financial Statements</b></div>
+        <p>Some text.</p>
+        <ix:nonnumeric><div><b>Inner title</b></div><p>Inner text.</p></ix:nonnumeric>
+        <table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr></table>
+    """
+    expected_elements = Edgar10QParser().parse(html_str)
+    if source_type is io.BytesIO:
+        source = io.BytesIO(html_str.encode("utf-8"))
+    else:
+        source = source_type(html_str)
+
+    # Act
+    actual_elements = list(
+        Edgar10QParser(html_tag_parser=html_tag_parser).iter_parse(source),
+    )
+
+    # Assert
+    assert [e.to_dict(include_previews=True) for e in actual_elements] == [
+        e.to_dict(include_previews=True) for e in expected_elements
+    ]
+
+
+PARSE_MANY_HTMLS = [
+    "<div><b>Item 1. Financial Statements</b></div><p>First document.</p>",
+    "<p>Second document.</p>",
+    "<table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr></table>",
+]
+
+
+def get_text_only_steps():
+    return [
+        step
+        for step in Edgar10QParser().get_default_steps()
+        if type(step).__name__ in {"IndividualSemanticElementExtractor", "TextClassifier"}
+    ]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("html_tag_parser", [None, LxmlHtmlTagParser()], ids=["default", "lxml"])
+@pytest.mark.parametrize(("workers", "chunksize"), [(1, 1), (2, 1), (2, 2)])
+def test_parse_many_matches_parse(workers, chunksize, html_tag_parser, ordered):
+    # Arrange
+    parser = Edgar10QParser(html_tag_parser=html_tag_parser)
+    expected = [
+        [e.to_dict(include_previews=True) for e in parser.parse(html)]
+        for html in PARSE_MANY_HTMLS
+    ]
+
+    # Act
+    results = list(
+        parser.parse_many(
+            PARSE_MANY_HTMLS,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+        ),
+    )
+
+    # Assert
+    if ordered:
+        assert [index for index, _ in results] == [0, 1, 2]
+    actual = sorted(
+        (index, [e.to_dict(include_previews=True) for e in elements])
+        for index, elements in results
+    )
+    assert actual == list(enumerate(expected))
+
+
+def test_parse_many_reads_paths_in_workers(tmp_path):
+    # Arrange
+    paths = []
+    for i, html in enumerate(PARSE_MANY_HTMLS):
+        path = tmp_path / f"{i}.html"
+        path.write_text(html, encoding="utf-8")
+        paths.append(path)
+
+    # Act
+    results = list(Edgar10QParser().parse_many(paths, workers=2))
+
+    # Assert
+    assert [[e.text for e in elements] for _, elements in results] == [
+        ["Item 1. Financial Statements", "First document."],
+        ["Second document."],
+        ["Revenue$1,000"],
+    ]
+
+
+def test_parse_many_with_custom_get_steps():
+    # Arrange
+    parser = Edgar10QParser(get_text_only_steps)
+
+    # Act
+    results = list(parser.parse_many(PARSE_MANY_HTMLS[:2], workers=2))
+
+    # Assert
+    assert [[type(e) for e in elements] for _, elements in results] == [
+        [TextElement, TextElement],
+        [TextElement],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("workers", "chunksize"),
+    [(0, 1), (1, 0)],
+)
+def test_parse_many_invalid_arguments(workers, chunksize):
+    # Arrange
+    parser = Edgar10QParser()
+
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        parser.parse_many(PARSE_MANY_HTMLS, workers=workers, chunksize=chunksize)
+
+
+@pytest.mark.parametrize("unwrap_elements", [True, False])
+@pytest.mark.parametrize("html_tag_parser", [None, LxmlHtmlTagParser()], ids=["default", "lxml"])
+def test_parse_with_detached_html_tags(html_tag_parser, unwrap_elements):
+    # Arrange
+    html_str = """
+        <div><b>Item 1. Financial Statements</b></div>
+        <ix:nonnumeric><div><b>Inner title</b></div><p>Inner text.</p></ix:nonnumeric>
+        <table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr></table>
+    """
+    expected = Edgar10QParser(html_tag_parser=html_tag_parser).parse(
+        html_str,
+        unwrap_elements=unwrap_elements,
+    )
+    parser = Edgar10QParser(
+        html_tag_parser=html_tag_parser,
+        parsing_options=ParsingOptions(detach_html_tags=True),
+    )
+
+    # Act
+    actual = parser.parse(html_str, unwrap_elements=unwrap_elements)
+    iter_actual = list(parser.iter_parse(html_str, unwrap_elements=unwrap_elements))
+
+    # Assert
+    for elements in (actual, iter_actual):
+        assert [e.to_dict(include_previews=True) for e in elements] == [
+            e.to_dict(include_previews=True) for e in expected
+        ]
+        tags = [
+            e.html_tag
+            for e in CompositeSemanticElement.unwrap_elements(
+                elements,
+                include_containers=True,
+            )
+        ]
+        assert all(type(tag) is HtmlTag for tag in tags)
+        assert all("_bs4" not in vars(tag) for tag in tags)
+        assert all(tag.parent is None for tag in tags)
+
+
+@pytest.mark.parametrize("level", list(ProcessingLogLevel))
+def test_parse_with_processing_log_level(level):
+    # Arrange
+    html_str = """
+        <div><b>Item 1. Financial Statements</b></div>
+        <ix:nonnumeric><div><b>Inner title</b></div><p>Inner text.</p></ix:nonnumeric>
+        <p>Some text.</p>
+        <p>More text.</p>
+    """
+    expected = Edgar10QParser().parse(html_str)
+    parser = Edgar10QParser(
+        parsing_options=ParsingOptions(processing_log_level=level),
+    )
+
+    # Act
+    actual = parser.parse(html_str)
+    iter_actual = list(parser.iter_parse(html_str))
+
+    # Assert
+    for elements in (actual, iter_actual):
+        assert [e.to_dict(include_previews=True) for e in elements] == [
+            e.to_dict(include_previews=True) for e in expected
+        ]
+        for element, expected_element in zip(elements, expected):
+            items = element.processing_log.get_items()
+            expected_items = expected_element.processing_log.get_items()
+            if level is ProcessingLogLevel.OFF:
+                assert items == ()
+            elif level is ProcessingLogLevel.SUMMARY:
+                assert items == tuple(i for i in expected_items if isinstance(i.payload, dict))
+            else:
+                assert items == expected_items
+
+
+SECTIONS_HTML = """
+    <p>Introduction.</p>
+    <div><b>Part I</b></div>
+    <div><b>Item 1. Financial Statements</b></div>
+    <p>Item 1 text.</p>
+    <table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr></table>
+    <div><b>Item 2. Management's Discussion and Analysis</b></div>
+    <p>Item 2 text.</p>
+    <div><b>Part II</b></div>
+    <div><b>Item 1A. Risk Factors</b></div>
+    <p>Risk factors text.</p>
+"""
+
+
+@pytest.mark.parametrize(
+    ("section_identifiers", "expected_texts"),
+    [
+        (
+            {"part1item2"},
+            ["Item 2. Management's Discussion and Analysis", "Item 2 text."],
+        ),
+        (
+            {"part1item1", "part2item1a"},
+            [
+                "Item 1. Financial Statements",
+                "Item 1 text.Revenue$1,000",
+                "Item 1A. Risk Factors",
+                "Risk factors text.",
+            ],
+        ),
+        (
+            {"part2"},
+            ["Part II", "Item 1A. Risk Factors", "Risk factors text."],
+        ),
+        (
+            {"part1item3"},
+            [],
+        ),
+    ],
+)
+def test_parse_sections(section_identifiers, expected_texts):
+    # Arrange
+    full = Edgar10QParser().parse(SECTIONS_HTML)
+    expected = [
+        e.to_dict(include_previews=True) for e in full if e.text in expected_texts
+    ]
+
+    # Act
+    actual = Edgar10QParser().parse_sections(SECTIONS_HTML, section_identifiers)
+
+    # Assert
+    assert [e.text for e in actual] == expected_texts
+    assert [e.to_dict(include_previews=True) for e in actual] == expected
+
+
+PAGE_BREAK_HTML = "<p>Acme Corp</p><p>Page {}</p>"
+
+SECTIONS_WITH_PAGE_BREAKS_HTML = (
+    "<p>Introduction.</p>"
+    + PAGE_BREAK_HTML.format(1)
+    + "<div><b>Part I</b></div>"
+    + "<div><b>Item 1. Financial Statements</b></div>"
+    + "<p>Item 1 text.</p>"
+    + PAGE_BREAK_HTML.format(2)
+    + "<div><b>Item 2. Management's Discussion and Analysis</b></div>"
+    + "<p>Item 2 text.</p>"
+    + PAGE_BREAK_HTML.format(3)
+    + "<div><b>Part II</b></div>"
+    + PAGE_BREAK_HTML.format(4)
+    + "<div><b>Item 1A. Risk Factors</b></div>"
+    + '<p style="font-weight:bold">Market risks</p>'
+    + "<p>Risk factors text.</p>"
+    + PAGE_BREAK_HTML.format(5)
+    + '<p style="font-style:italic">Other risks</p>'
+    + "<p>Other text.</p>"
+    + PAGE_BREAK_HTML.format(6)
+)
+
+
+def get_section(elements, section_identifier):
+    start = next(
+        i
+        for i, e in enumerate(elements)
+        if isinstance(e, TopSectionTitle)
+        and e.section_type.identifier == section_identifier
+    )
+    end = next(
+        (
+            i
+            for i, e in enumerate(elements[start + 1 :], start + 1)
+            if isinstance(e, TopSectionTitle) and e.level <= elements[start].level
+        ),
+        len(elements),
+    )
+    return elements[start:end]
+
+
+@pytest.mark.parametrize(
+    "section_identifier",
+    ["part1", "part1item1", "part1item2", "part2", "part2item1a"],
+)
+def test_parse_sections_matches_parse(section_identifier):
+    # Arrange
+    full = Edgar10QParser().parse(SECTIONS_WITH_PAGE_BREAKS_HTML)
+    expected = [
+        e.to_dict(include_previews=True)
+        for e in get_section(full, section_identifier)
+    ]
+
+    # Act
+    actual = Edgar10QParser().parse_sections(
+        SECTIONS_WITH_PAGE_BREAKS_HTML,
+        {section_identifier},
+    )
+
+    # Assert
+    assert [e.to_dict(include_previews=True) for e in actual] == expected
+
+
+def test_parse_sections_title_levels_are_relative_to_sections():
+    # Arrange
+    html = SECTIONS_WITH_PAGE_BREAKS_HTML.replace(
+        "<p>Item 1 text.</p>",
+        '<p style="font-style:italic">Overview</p><p>Item 1 text.</p>',
+    )
+    full = get_section(Edgar10QParser().parse(html), "part2item1a")
+
+    # Act
+    actual = Edgar10QParser().parse_sections(html, {"part2item1a"})
+
+    # Assert
+    assert [e.text for e in actual] == [e.text for e in full]
+    assert [(e.text, e.level) for e in full if isinstance(e, TitleElement)] == [
+        ("Market risks", 1),
+        ("Other risks", 0),
+    ]
+    assert [(e.text, e.level) for e in actual if isinstance(e, TitleElement)] == [
+        ("Market risks", 0),
+        ("Other risks", 1),
+    ]
+
+
+def test_parse_sections_classifies_only_the_sections():
+    # Arrange
+    processed_texts = []
+    process_element = HighlightedTextClassifier._process_element
+
+    def record_element(self, element, context):
+        processed_texts.append(element.text)
+        return process_element(self, element, context)
+
+    # Act
+    with patch.object(
+        HighlightedTextClassifier,
+        "_process_element",
+        record_element,
+    ):
+        actual = Edgar10QParser().parse_sections(
+            SECTIONS_WITH_PAGE_BREAKS_HTML,
+            {"part1item2"},
+        )
+
+    # Assert
+    assert [e.text for e in actual] == [
+        "Item 2. Management's Discussion and Analysis",
+        "Item 2 text.",
+    ]
+    assert processed_texts == ["Item 2 text.", "Acme Corp", "Page 3"]
+
+
+def test_parse_sections_without_top_section_manager():
+    # Arrange
+    parser = Edgar10QParser(get_text_only_steps)
+
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        parser.parse_sections(SECTIONS_HTML, {"part1item1"})
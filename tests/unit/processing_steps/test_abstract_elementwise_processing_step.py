@@ -9,6 +9,9 @@ from sec_parser.exceptions import SecParserError, SecParserValueError
 from sec_parser.processing_engine.processing_log import LogItemOrigin
 from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
     MODULE_LOGGER_NAME,
+    PROCESS,
+    RECURSE,
+    SKIP,
     AbstractElementwiseProcessingStep,
     ElementProcessingContext,
     ErrorWhileProcessingElement,
@@ -16,6 +19,9 @@ from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processin
 from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
 
 
 class MockSemanticElement(AbstractSemanticElement):
@@ -26,6 +32,10 @@ class AnotherMockSemanticElement(AbstractSemanticElement):
     pass
 
 
+class MockSemanticElementSubclass(MockSemanticElement):
+    pass
+
+
 class ProcessingStep(AbstractElementwiseProcessingStep):
     def __init__(
         self,
@@ -145,3 +155,117 @@ def test_error_while_processing_element_with_no_error():
             error=None,
             log_origin=Mock(spec=LogItemOrigin),
         )
+
+
+def test_process_iter_processes_elements_lazily():
+    # Arrange
+    elements = [MockSemanticElement(Mock()) for _ in range(3)]
+    step = ProcessingStep()
+
+    # Act
+    iterator = step.process_iter(iter(elements))
+    first = next(iterator)
+
+    # Assert
+    assert first is elements[0]
+    assert step.seen_elements == [elements[0]]
+    assert list(iterator) == elements[1:]
+    assert step.seen_elements == elements
+
+
+@pytest.mark.parametrize(
+    ("types_to_process", "types_to_exclude", "expected"),
+    [
+        (
+            None,
+            None,
+            {
+                MockSemanticElement: PROCESS,
+                MockSemanticElementSubclass: PROCESS,
+                AnotherMockSemanticElement: PROCESS,
+                CompositeSemanticElement: RECURSE,
+                ErrorWhileProcessingElement: SKIP,
+            },
+        ),
+        (
+            {MockSemanticElement},
+            None,
+            {
+                MockSemanticElement: PROCESS,
+                MockSemanticElementSubclass: PROCESS,
+                AnotherMockSemanticElement: SKIP,
+                CompositeSemanticElement: RECURSE,
+            },
+        ),
+        (
+            None,
+            {MockSemanticElementSubclass, CompositeSemanticElement},
+            {
+                MockSemanticElement: PROCESS,
+                MockSemanticElementSubclass: SKIP,
+                CompositeSemanticElement: SKIP,
+            },
+        ),
+    ],
+)
+def test_get_decision(types_to_process, types_to_exclude, expected):
+    # Arrange
+    step = ProcessingStep(
+        types_to_process=types_to_process,
+        types_to_exclude=types_to_exclude,
+    )
+
+    # Act
+    actual = {cls: step._get_decision(cls) for cls in expected}
+
+    # Assert
+    assert actual == expected
+    assert step._decisions == expected
+
+
+def test_process_composite_element():
+    # Arrange
+    inner1 = MockSemanticElement(Mock())
+    inner2 = AnotherMockSemanticElement(Mock())
+    composite = CompositeSemanticElement(Mock(), inner_elements=(inner1, inner2))
+    element = MockSemanticElement(Mock())
+    step = ProcessingStep(types_to_process={MockSemanticElement})
+
+    # Act
+    processed_elements = step.process([composite, element])
+
+    # Assert
+    assert step.seen_elements == [inner1, element]
+    assert processed_elements == [composite, element]
+    assert composite.inner_elements == (inner1, inner2)
+
+
+class ReplacingStep(AbstractElementwiseProcessingStep):
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        _: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        return AnotherMockSemanticElement.create_from_element(
+            element,
+            log_origin=self.__class__.__name__,
+        )
+
+
+def test_process_deeply_nested_composite_elements():
+    # Arrange
+    inner = MockSemanticElement(Mock())
+    composite = CompositeSemanticElement(Mock(), inner_elements=(inner,))
+    composites = [composite]
+    for _ in range(5000):
+        composite = CompositeSemanticElement(Mock(), inner_elements=(composite,))
+        composites.append(composite)
+    step = ReplacingStep(types_to_process={MockSemanticElement})
+
+    # Act
+    processed_elements = step.process([composite])
+
+    # Assert
+    assert processed_elements == [composite]
+    assert isinstance(composites[0].inner_elements[0], AnotherMockSemanticElement)
+    assert all(c.inner_elements == (p,) for p, c in zip(composites, composites[1:]))
@@ -38,3 +38,17 @@ def test_process_already_processed_raises_error():
         match="This Step instance has already processed a document",
     ):
         step.process(elements)
+
+
+def test_process_iter_already_processed_raises_error():
+    # Arrange
+    elements: list[AbstractSemanticElement] = [DummyElement(Mock()) for _ in range(5)]
+    step = DummyProcessingStep()
+
+    # Act
+    actual = list(step.process_iter(iter(elements)))
+
+    # Assert
+    assert actual == elements
+    with pytest.raises(AlreadyProcessedError):
+        step.process(elements)
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import pytest
+
+from sec_parser.exceptions import SecParserError, SecParserValueError
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_steps.abstract_classes.abstract_elementwise_processing_step import (
+    AbstractElementwiseProcessingStep,
+    ElementProcessingContext,
+)
+from sec_parser.processing_steps.abstract_classes.abstract_processing_step import (
+    AlreadyProcessedError,
+)
+from sec_parser.processing_steps.fused_elementwise_processing_step import (
+    FusedElementwiseProcessingStep,
+    fuse_elementwise_steps,
+    is_fusable,
+)
+from sec_parser.processing_steps.highlighted_text_classifier import (
+    HighlightedTextClassifier,
+)
+from sec_parser.processing_steps.image_classifier import ImageClassifier
+from sec_parser.processing_steps.page_number_classifier import PageNumberClassifier
+from sec_parser.processing_steps.text_classifier import TextClassifier
+from sec_parser.semantic_elements.abstract_semantic_element import (
+    AbstractSemanticElement,
+)
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+from sec_parser.semantic_elements.semantic_elements import (
+    ErrorWhileProcessingElement,
+    NotYetClassifiedElement,
+    TextElement,
+)
+from tests.unit.processing_steps._utils import parse_initial_semantic_elements
+
+
+class RecordingStep(AbstractElementwiseProcessingStep):
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
+    def __init__(
+        self,
+        log: list[tuple[str, str]],
+        name: str,
+        *,
+        types_to_process: set[type[AbstractSemanticElement]] | None = None,
+    ) -> None:
+        super().__init__(types_to_process=types_to_process)
+        self._log = log
+        self._name = name
+
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        _: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        self._log.append((self._name, element.text))
+        return element
+
+
+class ErrorRaisingStep(AbstractElementwiseProcessingStep):
+    _HAS_CROSS_ELEMENT_DEPENDENCIES = False
+
+    def _process_element(
+        self,
+        element: AbstractSemanticElement,
+        _: ElementProcessingContext,
+    ) -> AbstractSemanticElement:
+        raise SecParserError
+
+
+class FrozenCompositeElement(CompositeSemanticElement):
+    @property
+    def inner_elements(self) -> tuple[AbstractSemanticElement, ...]:
+        return self._inner_elements
+
+    @inner_elements.setter
+    def inner_elements(self, elements: tuple[AbstractSemanticElement, ...]) -> None:
+        if self._inner_elements:
+            msg = "inner_elements cannot be replaced."
+            raise SecParserValueError(msg)
+        self._inner_elements = elements
+
+
+class CustomTraversalStep(RecordingStep):
+    def _process(
+        self,
+        elements: list[AbstractSemanticElement],
+    ) -> list[AbstractSemanticElement]:
+        return elements
+
+
+def test_fuse_default_steps():
+    # Arrange
+    steps = Edgar10QParser().get_default_steps()
+
+    # Act
+    fused_steps = fuse_elementwise_steps(steps)
+
+    # Assert
+    assert [type(s).__name__ for s in fused_steps] == [
+        "FusedElementwiseProcessingStep",
+        "TopSectionManagerFor10Q",
+        "IntroductorySectionElementClassifier",
+        "FusedElementwiseProcessingStep",
+        "PageHeaderClassifier",
+        "PageNumberClassifier",
+        "TitleClassifier",
+        "TextElementMerger",
+    ]
+    assert [type(s).__name__ for s in fused_steps[0].steps] == [
+        "IndividualSemanticElementExtractor",
+        "ImageClassifier",
+        "EmptyElementClassifier",
+        "TableClassifier",
+        "TableOfContentsClassifier",
+    ]
+    assert [type(s).__name__ for s in fused_steps[3].steps] == [
+        "TextClassifier",
+        "HighlightedTextClassifier",
+        "SupplementaryTextClassifier",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("step", "expected"),
+    [
+        (TextClassifier(), True),
+        (PageNumberClassifier(), False),
+        (CustomTraversalStep([], "custom"), False),
+    ],
+)
+def test_is_fusable(step, expected):
+    # Act and Assert
+    assert is_fusable(step) is expected
+
+
+def test_fused_steps_process_elements_in_the_same_order():
+    # Arrange
+    html = """
+        <p>first</p>
+        <composite><p>inner1</p><p>inner2</p></composite>
+        <p>last</p>
+    """
+    sequential_log: list[tuple[str, str]] = []
+    fused_log: list[tuple[str, str]] = []
+
+    def get_steps(log):
+        return [
+            RecordingStep(log, "a"),
+            RecordingStep(log, "b", types_to_process={NotYetClassifiedElement}),
+        ]
+
+    elements = parse_initial_semantic_elements(html)
+    for step in get_steps(sequential_log):
+        elements = step.process(elements)
+
+    # Act
+    fused = FusedElementwiseProcessingStep(get_steps(fused_log))
+    fused.process(parse_initial_semantic_elements(html))
+
+    # Assert
+    for name in ("a", "b"):
+        assert [text for n, text in fused_log if n == name] == [
+            text for n, text in sequential_log if n == name
+        ]
+    assert fused_log[:2] == [("a", "first"), ("b", "first")]
+
+
+@pytest.mark.parametrize("use_iter", [False, True])
+def test_fused_steps_match_sequential_steps(use_iter):
+    # Arrange
+    html = """
+        <p>Some text</p>
+        <p><b>Bold text</b></p>
+        <composite><p>inner</p><p><b>inner bold</b></p></composite>
+        <p>    </p>
+    """
+
+    def get_steps():
+        return [
+            ImageClassifier(types_to_process={NotYetClassifiedElement}),
+            TextClassifier(types_to_process={NotYetClassifiedElement}),
+            HighlightedTextClassifier(types_to_process={TextElement}),
+        ]
+
+    expected = parse_initial_semantic_elements(html)
+    for step in get_steps():
+        expected = step.process(expected)
+    fused = FusedElementwiseProcessingStep(get_steps())
+    elements = parse_initial_semantic_elements(html)
+
+    # Act
+    if use_iter:
+        actual = list(fused.process_iter(elements))
+    else:
+        actual = fused.process(elements)
+
+    # Assert
+    def dump(elements):
+        return [
+            (
+                e.to_dict(include_previews=True),
+                [i.origin for i in e.processing_log.get_items()],
+                dump(getattr(e, "inner_elements", ())),
+            )
+            for e in elements
+        ]
+
+    assert dump(actual) == dump(expected)
+
+
+def test_fused_steps_handle_errors():
+    # Arrange
+    log: list[tuple[str, str]] = []
+    fused = FusedElementwiseProcessingStep(
+        [ErrorRaisingStep(), RecordingStep(log, "after")],
+    )
+
+    # Act
+    elements = fused.process(parse_initial_semantic_elements("<p>text</p>"))
+
+    # Assert
+    assert isinstance(elements[0], ErrorWhileProcessingElement)
+    assert log == []
+
+
+def test_fused_steps_handle_errors_in_composite_elements():
+    # Arrange
+    log: list[tuple[str, str]] = []
+    composite = parse_initial_semantic_elements(
+        "<composite><p>a</p><p>b</p></composite>",
+    )[0]
+    elements = [
+        FrozenCompositeElement.create_from_element(
+            composite,
+            log_origin="test",
+            inner_elements=list(composite.inner_elements),
+        ),
+    ]
+    fused = FusedElementwiseProcessingStep(
+        [RecordingStep(log, "a"), RecordingStep(log, "b")],
+    )
+
+    # Act
+    elements = fused.process(elements)
+
+    # Assert
+    assert isinstance(elements[0], ErrorWhileProcessingElement)
+    assert elements[0].processing_log.get_items()[-1].origin == "RecordingStep"
+    assert log == [("a", "a"), ("b", "a"), ("a", "b"), ("b", "b")]
+
+
+def test_fused_steps_are_marked_as_processed():
+    # Arrange
+    step = RecordingStep([], "a")
+    fused = FusedElementwiseProcessingStep([step, RecordingStep([], "b")])
+    fused.process(parse_initial_semantic_elements("<p>text</p>"))
+
+    # Act and Assert
+    with pytest.raises(AlreadyProcessedError):
+        step.process(parse_initial_semantic_elements("<p>text</p>"))
+
+
+def test_fuse_non_fusable_step():
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        FusedElementwiseProcessingStep([TextClassifier(), PageNumberClassifier()])
@@ -84,3 +84,18 @@ def test_unwrap_elements_nested_composite():
 
     # Assert
     assert result == [composite_outer, composite_inner, elem1, elem2]
+
+
+def test_unwrap_elements_deeply_nested_composite():
+    # Arrange
+    elem = MockElement(Mock())
+    composite = MockCompositeElement(Mock(), [elem])
+    for _ in range(5000):
+        composite = MockCompositeElement(Mock(), [composite, MockElement(Mock())])
+
+    # Act
+    result = MockCompositeElement.unwrap_elements([composite])
+
+    # Assert
+    assert len(result) == 5001
+    assert result[0] is elem
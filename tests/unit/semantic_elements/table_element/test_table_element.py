@@ -7,6 +7,7 @@ import pytest
 from sec_parser.processing_engine.html_tag import HtmlTag
 from sec_parser.semantic_elements.table_element.table_element import TableElement
 from sec_parser.utils.bs4_.approx_table_metrics import ApproxTableMetrics
+from sec_parser.utils.bs4_.table_facts import TableFacts
 
 
 @pytest.mark.parametrize(
@@ -40,9 +41,12 @@ def test_table_element_get_summary(test_case):
     expected_summary = test_case["expected_summary"]
     mock_html_tag = Mock()
     mock_html_tag.text = text
-    mock_html_tag.get_approx_table_metrics.return_value = ApproxTableMetrics(
-        rows,
-        numbers,
+    mock_html_tag.get_table_facts.return_value = TableFacts(
+        metrics=ApproxTableMetrics(rows, numbers),
+        has_page_data_cell=False,
+        row_count=0,
+        column_count=0,
+        cell_count=0,
     )
     table_element = TableElement(mock_html_tag)
 
@@ -56,8 +60,12 @@ def test_table_element_get_summary(test_case):
 def test_to_dict():
     # Arrange
     mock_html_tag = Mock(spec=HtmlTag)
-    mock_html_tag.get_approx_table_metrics.return_value = ApproxTableMetrics(
-        5, 6
+    mock_html_tag.get_table_facts.return_value = TableFacts(
+        metrics=ApproxTableMetrics(5, 6),
+        has_page_data_cell=False,
+        row_count=0,
+        column_count=0,
+        cell_count=0,
     )
     mock_html_tag.to_dict.return_value = (
         {}
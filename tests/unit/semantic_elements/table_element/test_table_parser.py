@@ -54,8 +54,23 @@ def test_parse_as_df(name, html_input, expected_output):
         (
             "invalid input",
             "<p>not a table</p>",
+            ValueError("No tables found matching regex '.+'"),
+        ),
+        (
+            "no text",
+            "<table><tr><td></td></tr></table>",
+            ValueError("No tables found matching regex '.+'"),
+        ),
+        (
+            "no columns",
+            "<table><tr><td>&#160;</td></tr></table>",
             ValueError("No tables found"),
         ),
+        (
+            "hidden table",
+            '<table style="display:none"><tr><td>a</td></tr></table>',
+            ValueError("No tables found matching regex '.+'"),
+        ),
     ],
     ids=[t[0] for t in error_tests],
 )
@@ -66,4 +81,50 @@ def test_parse_as_df_error(name, html_input, expected_error):
     # Act & Assert
     with pytest.raises(type(expected_error)) as result_error:
         parser.parse_as_df()
-    assert str(expected_error) in str(result_error.value)
+    assert str(result_error.value) == str(expected_error)
+
+
+def test_remove_blank_columns():
+    # Arrange
+    df = pd.DataFrame(
+        {"1": ["a", "", "c"], "2": ["a", "b", ""], "3": ["x", "y", "z"]},
+        dtype=object,
+    )
+
+    # Act
+    result = TableParser._remove_blank_columns(df)
+
+    # Assert
+    assert result.to_dict("list") == {"2": ["a", "b", ""], "3": ["x", "y", "z"]}
+
+
+@pytest.mark.parametrize(
+    ("name", "data", "expected"),
+    tests := [
+        (
+            "currency column",
+            {"1": ["$", "$", ""], "2": ["1", "2", ""], "3": ["3", "", "5"]},
+            {"1": ["$1", "$2", ""], "3": ["3", "", "5"]},
+        ),
+        (
+            "merged column is not merged again",
+            {"1": ["$"], "2": ["1"], "3": ["1"]},
+            {"1": ["$1"], "3": ["1"]},
+        ),
+        (
+            "different values",
+            {"1": ["$", "1"], "2": ["2", "3"]},
+            {"1": ["$", "1"], "2": ["2", "3"]},
+        ),
+    ],
+    ids=[t[0] for t in tests],
+)
+def test_merge_columns_by_marker(name, data, expected):
+    # Arrange
+    df = pd.DataFrame(data, dtype=object)
+
+    # Act
+    result = TableParser._merge_columns_by_marker(df, "$")
+
+    # Assert
+    assert result.to_dict("list") == expected
@@ -0,0 +1,104 @@
+import itertools
+
+import bs4
+
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.semantic_elements.semantic_elements import TextElement
+from sec_parser.semantic_elements.title_element import TitleElement
+from sec_parser.semantic_elements.top_section_start_marker import TopSectionStartMarker
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+from sec_parser.semantic_elements.top_section_title_types import (
+    InvalidTopSectionInFiling,
+)
+from sec_parser.semantic_tree.nesting_rules import (
+    AbstractNestingRule,
+    AlwaysNestAsChildRule,
+    AlwaysNestAsParentRule,
+    NestingRuleTable,
+    NestSameTypeDependingOnLevelRule,
+)
+from sec_parser.semantic_tree.tree_builder import TreeBuilder
+
+
+def html_tag(tag_name: str, text: str) -> HtmlTag:
+    tag = bs4.Tag(name=tag_name)
+    tag.string = text
+    return HtmlTag(tag)
+
+
+class LevelDependentRule(AbstractNestingRule):
+    def _should_be_nested_under(self, parent, child) -> bool:
+        return getattr(parent, "level", 0) < getattr(child, "level", 0)
+
+
+class NestUnderPartTitleRule(AlwaysNestAsParentRule):
+    """Overrides the per-element decision of a rule with type-level decisions."""
+
+    def _should_be_nested_under(self, parent, child) -> bool:
+        return super()._should_be_nested_under(parent, child) and (
+            parent.text.startswith("part")
+        )
+
+
+def test_nesting_rule_table_matches_rules():
+    # Arrange
+    elements = [
+        TopSectionTitle(
+            html_tag("p", "part"),
+            level=1,
+            section_type=InvalidTopSectionInFiling,
+        ),
+        TopSectionTitle(
+            html_tag("p", "item"),
+            level=2,
+            section_type=InvalidTopSectionInFiling,
+        ),
+        TitleElement(html_tag("p", "title"), level=0),
+        TitleElement(html_tag("p", "subtitle"), level=1),
+        TextElement(html_tag("p", "text")),
+    ]
+    rule_lists = [
+        TreeBuilder.get_default_rules(),
+        [AlwaysNestAsChildRule(TextElement, exclude_parents={TopSectionStartMarker})],
+        [LevelDependentRule(exclude_children={TextElement})],
+        [NestSameTypeDependingOnLevelRule(), AlwaysNestAsParentRule(TitleElement)],
+        [NestUnderPartTitleRule(TopSectionTitle)],
+        [],
+    ]
+
+    for rules in rule_lists:
+        table = NestingRuleTable(rules)
+        for parent, child in itertools.product(elements, repeat=2):
+            # Act
+            actual = table.should_be_nested_under(parent, child)
+
+            # Assert
+            expected = any(rule.should_be_nested_under(parent, child) for rule in rules)
+            assert actual == expected, f"{rules}: {parent} -> {child}"
+
+
+def test_nesting_rule_table_with_overridden_element_decision():
+    # Arrange
+    part = TopSectionTitle(
+        html_tag("p", "part"),
+        level=1,
+        section_type=InvalidTopSectionInFiling,
+    )
+    item = TopSectionTitle(
+        html_tag("p", "item"),
+        level=2,
+        section_type=InvalidTopSectionInFiling,
+    )
+    text = TextElement(html_tag("p", "text"))
+    rule = NestUnderPartTitleRule(TopSectionTitle)
+    table = NestingRuleTable([rule])
+
+    # Act
+    decision = rule.should_be_nested_under_types(TopSectionTitle, TextElement)
+    nested_under_part = table.should_be_nested_under(part, text)
+    nested_under_item = table.should_be_nested_under(item, text)
+
+    # Assert
+    assert decision is None
+    assert nested_under_part is True
+    assert nested_under_item is False
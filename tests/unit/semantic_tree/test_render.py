@@ -1,5 +1,6 @@
 # test_semantic_tree.py
 
+import io
 from typing import Callable
 
 import bs4
@@ -11,7 +12,7 @@ from sec_parser.semantic_elements.abstract_semantic_element import (
     AbstractSemanticElement,
 )
 from sec_parser.semantic_elements.semantic_elements import IrrelevantElement
-from sec_parser.semantic_tree.render_ import render
+from sec_parser.semantic_tree.render_ import render, render_to_stream
 from sec_parser.semantic_tree.semantic_tree import SemanticTree
 from sec_parser.semantic_tree.tree_node import TreeNode
 
@@ -101,6 +102,36 @@ def test_render_with_pretty_and_verbose_option():
     )
 
 
+@pytest.mark.parametrize("line_limit", [0, 1, 3, 6, 10, -2])
+def test_print_with_line_limit(capsys, line_limit):
+    # Arrange
+    tree = get_tree()
+    lines = render(tree, pretty=False).split("\n")
+
+    # Act
+    tree.print(pretty=False, line_limit=line_limit)
+
+    # Assert
+    assert capsys.readouterr().out == "\n".join(lines[:line_limit]) + "\n"
+
+
+def test_render_to_stream_deep_tree():
+    # Arrange
+    nodes = [new_node("p", f"Node {i}") for i in range(1200)]
+    for parent, child in zip(nodes, nodes[1:]):
+        parent.add_child(child)
+    stream = io.StringIO()
+
+    # Act
+    render_to_stream(nodes[0], stream, pretty=False, line_limit=3)
+    full = render(nodes[0], pretty=False)
+
+    # Assert
+    assert stream.getvalue() == "Element: Node 0\n└── Element: Node 1\n    └── Element: Node 2"
+    assert full.startswith(stream.getvalue())
+    assert full.count("\n") == len(nodes) - 1
+
+
 def new_element(name, text):
     tag = bs4.Tag(name=name)
     tag.string = text
@@ -0,0 +1,95 @@
+import bs4
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.semantic_elements.semantic_elements import TextElement
+from sec_parser.semantic_elements.table_element.table_element import TableElement
+from sec_parser.semantic_elements.table_element.table_of_contents_element import (
+    TableOfContentsElement,
+)
+from sec_parser.semantic_elements.top_section_title import TopSectionTitle
+from sec_parser.semantic_elements.top_section_title_types import TopSectionInFiling
+from sec_parser.semantic_tree.tree_builder import TreeBuilder
+from sec_parser.semantic_tree.tree_node import TreeNode
+
+
+def html_tag(text: str) -> HtmlTag:
+    tag = bs4.Tag(name="p")
+    tag.string = text
+    return HtmlTag(tag)
+
+
+def section(identifier: str, level: int) -> TopSectionTitle:
+    section_type = TopSectionInFiling(identifier, identifier, order=0, level=level)
+    return TopSectionTitle(
+        html_tag(identifier),
+        level=level,
+        section_type=section_type,
+    )
+
+
+@pytest.fixture
+def elements():
+    return [
+        TableOfContentsElement(html_tag("contents")),
+        section("part1", 1),
+        section("part1item1", 2),
+        TextElement(html_tag("text1")),
+        TableElement(html_tag("table1")),
+        section("part2", 1),
+        TableElement(html_tag("table2")),
+        section("part2item1a", 2),
+        TableElement(html_tag("table3")),
+        TextElement(html_tag("text2")),
+    ]
+
+
+def test_index(elements):
+    # Arrange
+    tree = TreeBuilder().build(elements, build_index=True)
+
+    # Act
+    index = tree.index
+
+    # Assert
+    assert [node.semantic_element for node in index.nodes] == elements
+    assert [node.text for node in index.nodes] == [node.text for node in tree.nodes]
+    assert index.get_node(elements[4]).semantic_element is elements[4]
+    assert index.get_node(TextElement(html_tag("text1"))) is None
+    assert index.get_section_node("part2").text == "part2"
+    assert index.get_section_node("part3") is None
+
+
+def test_get_nodes_by_type(elements):
+    # Arrange
+    index = TreeBuilder().build(elements).index
+    part2 = index.get_section_node("part2")
+
+    # Act
+    tables = index.get_nodes_by_type(TableElement)
+    tables_under_part2 = index.get_nodes_by_type(TableElement, under=part2)
+    texts_under_item = index.get_nodes_by_type(
+        TextElement,
+        under=index.get_section_node("part1item1"),
+    )
+
+    # Assert
+    assert [n.text for n in tables] == ["contents", "table1", "table2", "table3"]
+    assert [n.text for n in tables_under_part2] == ["table2", "table3"]
+    assert [n.text for n in texts_under_item] == ["text1"]
+    assert index.get_nodes_by_type(TableOfContentsElement, under=part2) == []
+
+
+def test_get_subtree_range(elements):
+    # Arrange
+    index = TreeBuilder().build(elements).index
+
+    # Act
+    part1 = index.get_subtree_range(index.get_section_node("part1"))
+    part2 = index.get_subtree_range(index.get_section_node("part2"))
+
+    # Assert
+    assert (part1, part2) == (range(1, 5), range(5, 10))
+    with pytest.raises(SecParserValueError):
+        index.get_subtree_range(TreeNode(elements[0]))
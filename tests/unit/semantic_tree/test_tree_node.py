@@ -98,6 +98,26 @@ def test_remove_parent(mock_element):
     assert not parent.has_child(child)
 
 
+def test_children_keep_their_order(mock_element):
+    # Arrange
+    parent = TreeNode(mock_element)
+    children = [TreeNode(mock_element, parent=parent) for _ in range(4)]
+    new_parent = TreeNode(mock_element)
+
+    # Act
+    parent.add_child(children[0])
+    children[1].parent = new_parent
+    parent.remove_child(children[3])
+    actual = parent.children
+    actual.clear()
+
+    # Assert
+    assert parent.children == [children[0], children[2]]
+    assert new_parent.children == [children[1]]
+    assert children[3].parent is None
+    assert list(parent.iter_children()) == [children[0], children[2]]
+
+
 def test_repr(mock_element):
     # Arrange
     parent = TreeNode(mock_element)
@@ -215,3 +235,28 @@ def test_tree_node_get_source_code(test_case):
     # Assert
     assert result == expected_result
     mock_semantic_element.get_source_code.assert_called_once_with(pretty=pretty)
+
+
+class OtherMockSemanticElement(AbstractSemanticElement):
+    pass
+
+
+def test_walk():
+    # Arrange
+    root = TreeNode(element("root"))
+    child1 = TreeNode(element("child1"), parent=root)
+    grandchild = TreeNode(element("grandchild"), parent=child1)
+    child2 = TreeNode(
+        OtherMockSemanticElement(element("child2").html_tag),
+        parent=root,
+    )
+
+    # Act
+    preorder = list(root.walk())
+    postorder = list(root.walk(postorder=True))
+    filtered = list(root.walk(types=(OtherMockSemanticElement,)))
+
+    # Assert
+    assert preorder == [(root, 0), (child1, 1), (grandchild, 2), (child2, 1)]
+    assert postorder == [(grandchild, 2), (child1, 1), (child2, 1), (root, 0)]
+    assert filtered == [(child2, 1)]
@@ -0,0 +1,187 @@
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.processing_engine.core import Edgar10QParser
+from sec_parser.processing_engine.html_tag import HtmlTag
+from sec_parser.processing_engine.processing_log import ProcessingLog
+from sec_parser.semantic_elements.composite_semantic_element import (
+    CompositeSemanticElement,
+)
+from sec_parser.semantic_elements.semantic_elements import (
+    ErrorWhileProcessingElement,
+    TextElement,
+)
+from sec_parser.semantic_elements.table_element.table_element import TableElement
+from sec_parser.semantic_tree.semantic_tree import SemanticTree
+from sec_parser.semantic_tree.tree_builder import TreeBuilder
+from sec_parser.semantic_tree.tree_node import TreeNode
+from sec_parser.serialization import dumps, loads
+
+HTML = """
+    <div><b>Part I</b></div>
+    <div><b>Item 1. Financial Statements</b></div>
+    <p><b>Bold title</b></p>
+    <p>Some text with unicode: — €.</p>
+    <ix:nonnumeric><div><b>Inner title</b></div><p>Inner text.</p></ix:nonnumeric>
+    <table><tr><td>Revenue</td><td>$</td><td>1,000</td></tr>
+    <tr><td>Costs</td><td>$</td><td>500</td></tr></table>
+"""
+
+
+class InitializedTextElement(TextElement):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.initialized = True
+
+
+def _to_dicts(elements):
+    return [
+        e.to_dict(include_previews=True, include_contents=True) for e in elements
+    ]
+
+
+@pytest.mark.parametrize("compress", [True, False])
+@pytest.mark.parametrize("unwrap_elements", [True, False])
+def test_elements_roundtrip(compress, unwrap_elements):
+    # Arrange
+    elements = Edgar10QParser().parse(HTML, unwrap_elements=unwrap_elements)
+
+    # Act
+    loaded = loads(dumps(elements, compress=compress))
+
+    # Assert
+    assert [type(e) for e in loaded] == [type(e) for e in elements]
+    assert _to_dicts(loaded) == _to_dicts(elements)
+    assert [e.get_source_code() for e in loaded] == [
+        e.get_source_code() for e in elements
+    ]
+    assert all(isinstance(e.processing_log, ProcessingLog) for e in loaded)
+
+
+def test_loaded_elements_are_created_by_their_constructors():
+    # Arrange
+    elements = [
+        InitializedTextElement.create_from_element(e, log_origin="test")
+        if isinstance(e, TextElement)
+        else e
+        for e in Edgar10QParser().parse(HTML)
+    ]
+
+    # Act
+    loaded = loads(dumps(elements))
+
+    # Assert
+    assert any(isinstance(e, InitializedTextElement) for e in loaded)
+    assert all(
+        e.initialized for e in loaded if isinstance(e, InitializedTextElement)
+    )
+    assert [sorted(vars(e)) for e in loaded] == [sorted(vars(e)) for e in elements]
+
+
+def test_composite_elements_roundtrip():
+    # Arrange
+    elements = Edgar10QParser().parse(HTML, unwrap_elements=False)
+    composites = [e for e in elements if isinstance(e, CompositeSemanticElement)]
+
+    # Act
+    loaded = loads(dumps(elements))
+
+    # Assert
+    loaded_composites = [e for e in loaded if isinstance(e, CompositeSemanticElement)]
+    assert len(loaded_composites) == len(composites) > 0
+    assert [_to_dicts(e.inner_elements) for e in loaded_composites] == [
+        _to_dicts(e.inner_elements) for e in composites
+    ]
+
+
+@pytest.mark.parametrize("include_table_markdown", [True, False])
+def test_table_roundtrip(include_table_markdown):
+    # Arrange
+    elements = Edgar10QParser().parse(HTML)
+    table = next(e for e in elements if isinstance(e, TableElement))
+    expected_source_code = table.get_source_code()
+
+    # Act
+    loaded = loads(dumps(elements, include_table_markdown=include_table_markdown))
+
+    # Assert
+    loaded_table = next(e for e in loaded if isinstance(e, TableElement))
+    assert table.get_source_code() == expected_source_code
+    assert loaded_table.html_tag.get_table_facts() == table.html_tag.get_table_facts()
+    assert loaded_table.table_to_markdown() == table.table_to_markdown()
+
+
+def test_error_element_roundtrip():
+    # Arrange
+    element = ErrorWhileProcessingElement(
+        HtmlTag.create_detached("<p>text</p>"),
+        error=SecParserValueError("Something went wrong"),
+    )
+
+    # Act
+    (loaded,) = loads(dumps([element]))
+
+    # Assert
+    assert type(loaded) is ErrorWhileProcessingElement
+    assert str(loaded.error) == "Something went wrong"
+    assert loaded.text == "text"
+
+
+def test_tree_roundtrip():
+    # Arrange
+    tree = TreeBuilder().build(Edgar10QParser().parse(HTML))
+
+    # Act
+    loaded = loads(dumps(tree))
+
+    # Assert
+    assert loaded.render() == tree.render()
+    assert [n.text for n in loaded.nodes] == [n.text for n in tree.nodes]
+    assert all(
+        child.parent is node for node in loaded.nodes for child in node.children
+    )
+
+
+def test_deep_roundtrip():
+    # Arrange
+    composite = TextElement(HtmlTag.create_detached("<p>Innermost</p>"))
+    for i in range(3000):
+        composite = CompositeSemanticElement(
+            HtmlTag.create_detached(f"<div>Composite {i}</div>"),
+            (composite, TextElement(HtmlTag.create_detached(f"<p>Text {i}</p>"))),
+        )
+    nodes = [
+        TreeNode(TextElement(HtmlTag.create_detached(f"<p>Node {i}</p>")))
+        for i in range(3000)
+    ]
+    for parent, child in zip(nodes, nodes[1:]):
+        parent.add_child(child)
+    tree = SemanticTree([nodes[0], TreeNode(composite)])
+
+    # Act
+    (loaded_composite,) = loads(dumps([composite]))
+    loaded_tree = loads(dumps(tree))
+
+    # Assert
+    assert [e.text for e in CompositeSemanticElement.unwrap_elements([loaded_composite])] == [
+        e.text for e in CompositeSemanticElement.unwrap_elements([composite])
+    ]
+    assert [(n.text, d) for n, d in loaded_tree.walk()] == [
+        (n.text, d) for n, d in tree.walk()
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"NOPE\x01\x00\x00",
+        b"SECP\x02\x00\x00",
+        b"SECP\x01\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
+        b"SECP\x01\x00\x00\x01\x00\x00\x00\x0ebuiltins:float",
+    ],
+)
+def test_loads_invalid_data(data):
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        loads(data)
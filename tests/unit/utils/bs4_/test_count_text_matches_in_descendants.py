@@ -0,0 +1,33 @@
+import bs4
+import pytest
+
+from sec_parser.utils.bs4_.count_text_matches_in_descendants import (
+    count_text_matches_in_descendants,
+)
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        ("<div><p>Item 1</p><p>Item 2</p><p>Other</p></div>", 2),
+        ("<div><p>Item 1</p><p> Item 1 </p></div>", 1),
+        ("<div><p><b><i>Item 1</i></b></p></div>", 1),
+        ("<div><a>Item 1</a><p><span><a>Item 2</a></span></p></div>", 0),
+        ("<div><p><a>Item 1</a>Item 2</p></div>", 1),
+        ("<div><table><tr><td><a>Item 1</a></td></tr></table></div>", 0),
+        ("<div><script>Item 1</script><p>Item<!-- 2 --></p></div>", 2),
+        ("<div>Item 1</div>", 0),
+    ],
+)
+def test_count_text_matches_in_descendants(html, expected):
+    # Arrange
+    tag = bs4.BeautifulSoup(html, "lxml").div
+
+    # Act
+    actual = count_text_matches_in_descendants(
+        tag,
+        lambda text: text.startswith("Item"),
+    )
+
+    # Assert
+    assert actual == expected
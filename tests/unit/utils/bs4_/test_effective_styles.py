@@ -0,0 +1,67 @@
+from bs4 import BeautifulSoup
+
+from sec_parser.utils.bs4_.effective_styles import get_effective_styles
+from sec_parser.utils.bs4_.text_styles_metrics import compute_text_styles_metrics
+
+
+def test_closer_styles_take_precedence():
+    # Arrange
+    html = """
+    <div style="color:red; font-weight:600">
+        <p style="color:blue;color:green">
+            <span style="font-style: italic">text</span>
+        </p>
+    </div>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    table = {}
+
+    # Act
+    result = get_effective_styles(soup.find("span"), table)
+
+    # Assert
+    assert list(result.items()) == [
+        ("font-style", "italic"),
+        ("color", "blue"),
+        ("font-weight", "600"),
+    ]
+
+
+def test_tags_are_resolved_once_per_table():
+    # Arrange
+    html = """
+    <div style="color:red">
+        <p><b>first</b></p>
+        <p><i>second</i></p>
+    </div>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    table = {}
+    get_effective_styles(soup.find("b"), table)
+    soup.find("div")["style"] = "color:blue"
+
+    # Act
+    result = get_effective_styles(soup.find("i"), table)
+
+    # Assert
+    assert result == {"color": "red"}
+    assert get_effective_styles(soup.find("i"), {}) == {"color": "blue"}
+
+
+def test_shared_table_gives_same_metrics():
+    # Arrange
+    html = """
+    <div style="color:#000000;">
+        <p>This is text</p>
+        <p><span style="font-weight:600;">This is bold</span> and not bold</p>
+    </div>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    table = {}
+    tags = [soup.find("div"), *soup.find_all("p"), soup.find("span")]
+
+    # Act
+    results = [compute_text_styles_metrics(tag, table) for tag in reversed(tags)]
+
+    # Assert
+    assert results == [compute_text_styles_metrics(tag) for tag in reversed(tags)]
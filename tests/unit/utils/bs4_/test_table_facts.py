@@ -0,0 +1,85 @@
+import bs4
+import pytest
+
+from sec_parser.utils.bs4_.table_facts import (
+    ApproxTableMetrics,
+    TableFacts,
+    get_table_facts,
+)
+from sec_parser.utils.bs4_.table_grid import get_table_grid
+
+
+@pytest.mark.parametrize(
+    ("name", "html", "expected"),
+    values := [
+        (
+            "table_of_contents",
+            (
+                "<table><tr><td>Item</td><td> <b>Page</b> </td></tr>"
+                "<tr><td>Risk Factors</td><td>12</td></tr></table>"
+            ),
+            TableFacts(
+                metrics=ApproxTableMetrics(rows=2, numbers=1),
+                has_page_data_cell=True,
+                row_count=2,
+                column_count=2,
+                cell_count=4,
+            ),
+        ),
+        (
+            "page_in_header_and_sentence",
+            (
+                "<table><tr><td>A</td><th>Page</th><th>B</th></tr>"
+                "<tr><td>Page 1</td><td style='display:none'>2</td></tr></table>"
+            ),
+            TableFacts(
+                metrics=ApproxTableMetrics(rows=2, numbers=2),
+                has_page_data_cell=False,
+                row_count=2,
+                column_count=3,
+                cell_count=5,
+            ),
+        ),
+        (
+            "row_without_data_cell",
+            "<table><tr><th>page no.</th></tr><tr><td>page no.</td></tr></table>",
+            TableFacts(
+                metrics=None,
+                has_page_data_cell=True,
+                row_count=2,
+                column_count=1,
+                cell_count=2,
+            ),
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_get_table_facts(name: str, html: str, expected: TableFacts) -> None:
+    # Arrange
+    soup = bs4.BeautifulSoup(html, "lxml")
+    table = soup.html.body.table
+
+    # Act
+    actual = get_table_facts(lambda: get_table_grid(table))
+
+    # Assert
+    assert actual == expected, f"{name}: {actual} != {expected}"
+
+
+def test_get_table_facts_without_table() -> None:
+    # Arrange
+    soup = bs4.BeautifulSoup("<div><p>No table</p></div>", "lxml")
+    div = soup.html.body.div
+
+    # Act
+    with pytest.warns(UserWarning, match="Failed to get table metrics"):
+        actual = get_table_facts(lambda: get_table_grid(div))
+
+    # Assert
+    assert actual == TableFacts(
+        metrics=None,
+        has_page_data_cell=False,
+        row_count=0,
+        column_count=0,
+        cell_count=0,
+    )
@@ -0,0 +1,88 @@
+from io import StringIO
+
+import bs4
+import pandas as pd
+import pytest
+
+from sec_parser.utils.bs4_.table_grid import get_table_grid
+
+
+@pytest.mark.parametrize(
+    ("name", "html"),
+    values := [
+        (
+            "header_and_spans",
+            (
+                "<table><tr><th>A</th><th colspan=2>B</th></tr>"
+                "<tr><td rowspan=2>1,234</td><td colspan=2>2<br>3</td></tr>"
+                "<tr><td>(5</td><td>)</td></tr></table>"
+            ),
+        ),
+        (
+            "thead_tbody_tfoot",
+            (
+                "<table><thead><tr><th>x</th><th></th></tr><tr><th>y</th><th>z</th>"
+                "</tr></thead><tbody><tr><td>1.5</td><td>n/a</td></tr></tbody>"
+                "<tfoot><tr><td>f</td><td>g</td></tr></tfoot></table>"
+            ),
+        ),
+        (
+            "hidden_cells",
+            (
+                '<table><tr><td style="display: none">a</td><td>b<style>.c{}</style>'
+                '<span style="display:none">c</span>d</td></tr></table>'
+            ),
+        ),
+        (
+            "hidden_merged_cells",
+            (
+                '<table><tr><td colspan=2 style="display:none">a</td><th>b</th></tr>'
+                "<tr><td>1</td><td>2</td></tr></table>"
+            ),
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_to_dataframe_matches_read_html(name, html):
+    # Arrange
+    table = bs4.BeautifulSoup(html, "lxml").table
+    expected = pd.read_html(StringIO(html), flavor="lxml")[0]
+
+    # Act
+    actual = get_table_grid(table).to_dataframe()
+
+    # Assert
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_split_merged_data_cells():
+    # Arrange
+    html = (
+        "<table><tr><td colspan=3>a</td></tr>"
+        "<tr><td>1</td><td>2</td><td>3</td></tr></table>"
+    )
+    table = bs4.BeautifulSoup(html, "lxml").table
+    source_code = str(table)
+
+    # Act
+    actual = get_table_grid(table).to_dataframe(split_merged_data_cells=True)
+
+    # Assert
+    assert actual.fillna("").to_numpy().tolist() == [["", "", "a"], [1.0, 2.0, "3"]]
+    assert str(table) == source_code, "Expected the table to be left unchanged"
+
+
+def test_approx_table_metrics_counts():
+    # Arrange
+    html = (
+        "<table><tr><td>HELLO</td><td>1</td></tr><tr><td> </td><td>2</td></tr>"
+        '<tr><td style="display:none">3</td><th>x</th></tr></table>'
+    )
+    table = bs4.BeautifulSoup(html, "lxml").table
+
+    # Act
+    grid = get_table_grid(table)
+
+    # Assert
+    assert (grid.rows_with_text, grid.cells_with_numbers) == (2, 3)
+    assert not grid.has_row_without_data_cell
@@ -24,6 +24,26 @@ from tests.unit.utils.bs4_._data_html_tables import (
             """,
             "| Header 1 |\n|---|\n| Cell 1 |",
         ),
+        (
+            "hidden_merged_cell",
+            """
+            <table>
+                <tr>
+                    <td colspan="2" style="display:none">x</td>
+                    <th>a</th>
+                </tr>
+                <tr>
+                    <td>1</td>
+                </tr>
+            </table>
+            """,
+            "| | a |\n| 1.0 | |",
+        ),
+        (
+            "empty_merged_cell",
+            '<table><tr><td colspan="2"></td></tr></table>',
+            "",
+        ),
         (
             "10Q_CP_0000016875_20_000032",
             TABLE_10Q_CP_0000016875_20_000032__001,
@@ -43,3 +63,29 @@ def test_has_tag_children(name, html, expected):
 
     # Assert
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "html", "expected_error"),
+    error_tests := [
+        (
+            "no_text",
+            "<table><tr><td></td></tr></table>",
+            ValueError("No tables found matching regex '.+'"),
+        ),
+        (
+            "no_columns",
+            "<table><tr><td>&#160;</td></tr></table>",
+            IndexError("list index out of range"),
+        ),
+    ],
+    ids=[t[0] for t in error_tests],
+)
+def test_convert_error(name, html, expected_error):
+    # Arrange
+    converter = TableToMarkdown(bs4.BeautifulSoup(html, "lxml"))
+
+    # Act & Assert
+    with pytest.raises(type(expected_error)) as result_error:
+        converter.convert()
+    assert str(result_error.value) == str(expected_error)
@@ -0,0 +1,78 @@
+import bs4
+import pytest
+
+from sec_parser.utils.bs4_.count_tags import count_tags
+from sec_parser.utils.bs4_.has_tag_children import has_tag_children
+from sec_parser.utils.bs4_.has_text_outside_tags import has_text_outside_tags
+from sec_parser.utils.bs4_.is_unary_tree import is_unary_tree
+from sec_parser.utils.bs4_.tag_index import TagIndex, get_tag_index_entry
+
+NAMES = ("b", "i", "p", "span", "table", "td")
+
+
+def query_with_index(tag, index):
+    entry = get_tag_index_entry(tag, index)
+    return (
+        [index.count_tags(entry, name) for name in NAMES],
+        [index.has_text_outside_tags(entry, (name,)) for name in NAMES],
+        index.has_text_outside_tags(entry, ("b", "i")),
+        entry.is_unary_tree,
+        entry.has_tag_children,
+    )
+
+
+def query_without_index(tag):
+    return (
+        [count_tags(tag, name) - (tag.name == name) for name in NAMES],
+        [has_text_outside_tags(tag, (name,)) for name in NAMES],
+        has_text_outside_tags(tag, ("b", "i")),
+        is_unary_tree(tag),
+        has_tag_children(tag),
+    )
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<div><p> <b>bold</b> </p><table><tr><td>a</td><td>b</td></tr></table></div>",
+        "<div>  <span><i>text</i></span>  </div>",
+        "<div><!-- comment --><p>a<b>b<i>c</i></b></p>tail</div>",
+        "<div><b><i>text</i></b><i><b>text</b></i></div>",
+        "<section><div><table><tr><td><table></table></td></tr></table></div></section>",
+        "<div><p></p><!--   --><p>text</p></div>",
+    ],
+)
+def test_index_matches_traversals(html):
+    # Arrange
+    soup = bs4.BeautifulSoup(html, "lxml")
+    tags = [soup.body, *soup.body.find_all()]
+    index = TagIndex()
+
+    # Act
+    actual = [query_with_index(tag, index) for tag in tags]
+
+    # Assert
+    assert actual == [query_without_index(tag) for tag in tags]
+
+
+def test_tree_is_indexed_once():
+    # Arrange
+    soup = bs4.BeautifulSoup("<div><p><b>a</b></p><p>b<b>c</b></p></div>", "lxml")
+    paragraphs = soup.find_all("p")
+    index = TagIndex()
+    get_tag_index_entry(paragraphs[1], index)
+    size = index._size
+
+    # Act
+    div_entry = get_tag_index_entry(soup.div, index)
+    paragraph_entry = get_tag_index_entry(paragraphs[1], index)
+
+    # Assert
+    assert index._size == size, "Expected the ancestors to be indexed already"
+    assert index.count_tags(div_entry, "b") == 2
+    assert index.count_tags(paragraph_entry, "b") == 1
+    assert index.has_text_outside_tags(paragraph_entry, ("b",))
+    assert not index.has_text_outside_tags(
+        get_tag_index_entry(paragraphs[0], index),
+        ("b",),
+    )
@@ -1,7 +1,11 @@
 import bs4
 from bs4 import BeautifulSoup
 
-from sec_parser.utils.bs4_.without_tags import without_tags
+from sec_parser.utils.bs4_.without_tags import (
+    get_text_without_tags,
+    iter_without_tags,
+    without_tags,
+)
 
 
 def test_without_tags_single_tag():
@@ -85,3 +89,35 @@ def test_without_tags_empty_tag_list():
     assert (
         str(result) == "<div><b>foo</b><p>bar<i>bax</i></p></div>"
     ), "Expected no changes when tag list is empty"
+
+
+def test_iter_without_tags():
+    # Arrange
+    html = "<div><b>foo</b><p>bar<i>bax</i></p>qux</div>"
+    soup = BeautifulSoup(html, "lxml")
+    tag = soup.div
+    assert tag
+
+    # Act
+    result = [
+        node.name if isinstance(node, bs4.Tag) else str(node)
+        for node in iter_without_tags(tag, {"b", "i"})
+    ]
+
+    # Assert
+    assert result == ["div", "p", "bar", "qux"]
+    assert str(tag) == html, "Expected the tag to be left unchanged"
+
+
+def test_get_text_without_tags():
+    # Arrange
+    html = "<div><b>foo</b><p>bar<i>bax</i></p><script>x()</script>qux</div>"
+    soup = BeautifulSoup(html, "lxml")
+    tag = soup.div
+    assert tag
+
+    # Act
+    result = get_text_without_tags(tag, {"i"})
+
+    # Assert
+    assert result == without_tags(tag, ["i"]).text == "foobarqux"
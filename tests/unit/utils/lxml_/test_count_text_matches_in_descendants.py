@@ -0,0 +1,41 @@
+import bs4
+import pytest
+from lxml import etree
+
+from sec_parser.utils.bs4_.count_text_matches_in_descendants import (
+    count_text_matches_in_descendants as bs4_count_text_matches_in_descendants,
+)
+from sec_parser.utils.lxml_.count_text_matches_in_descendants import (
+    count_text_matches_in_descendants,
+)
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<div><p>Item 1</p><p> Item 1 </p><p>Item 2<b>b</b></p></div>",
+        "<div><a>Item 1</a><p><span><a>Item 2</a></span>Item 3</p></div>",
+        "<div><table><tr><td><a>Item 1</a></td></tr></table></div>",
+        "<div><script>Item 1</script><style>Item 2</style><p>Item<!-- 3 --></p></div>",
+        "<div><template><div>Item 1</div></template> <!-- c --> <a>Item 2</a></div>",
+    ],
+)
+def test_count_text_matches_in_descendants(html):
+    # Arrange
+    texts: set[str] = set()
+    expected_texts: set[str] = set()
+    element = etree.HTML(html).find("body")[0]
+    tag = bs4.BeautifulSoup(html, "lxml").body.contents[0]
+
+    # Act
+    actual = count_text_matches_in_descendants(
+        element,
+        lambda text: texts.add(text) or text.startswith("Item"),
+    )
+
+    # Assert
+    expected = bs4_count_text_matches_in_descendants(
+        tag,
+        lambda text: expected_texts.add(text) or text.startswith("Item"),
+    )
+    assert (actual, texts) == (expected, expected_texts)
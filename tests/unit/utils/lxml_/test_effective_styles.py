@@ -0,0 +1,26 @@
+from lxml import html as lxml_html
+
+from sec_parser.utils.lxml_.effective_styles import get_effective_styles
+
+
+def test_closer_styles_take_precedence():
+    # Arrange
+    root = lxml_html.fromstring(
+        '<div style="color:red; font-weight:600">'
+        '<p style="color:blue;color:green">'
+        '<span style="font-style: italic">text</span>'
+        "</p></div>",
+    )
+    table = {}
+
+    # Act
+    result = get_effective_styles(root.find(".//span"), table)
+
+    # Assert
+    assert list(result.items()) == [
+        ("font-style", "italic"),
+        ("color", "blue"),
+        ("font-weight", "600"),
+    ]
+    assert {root, root.find(".//p"), root.find(".//span")} <= set(table)
+    assert get_effective_styles(None, table) == {}
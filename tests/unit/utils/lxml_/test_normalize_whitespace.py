@@ -0,0 +1,25 @@
+import pytest
+from lxml import etree
+
+from sec_parser.utils.lxml_.normalize_whitespace import normalize_whitespace
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        ("<div> <p>a</p>\n\t<p>b</p></div>", "<div> <p>a</p>\n<p>b</p></div>"),
+        ("<div>\t\t<b> x </b>  </div>", "<div> <b> x </b> </div>"),
+        ("<div><pre>  <b>x</b>\n\n</pre>  </div>", "<div><pre>  <b>x</b>\n\n</pre> </div>"),
+        ("<div><!----><!--\n\n--></div>", "<div><!-- --><!--\n--></div>"),
+        ("<div>\xa0</div>", "<div>\xa0</div>"),
+    ],
+)
+def test_normalize_whitespace(html, expected):
+    # Arrange
+    root = etree.HTML(html).find(".//div")
+
+    # Act
+    normalize_whitespace(root)
+
+    # Assert
+    assert etree.tostring(root, encoding=str) == expected
@@ -0,0 +1,30 @@
+import bs4
+from lxml import html as lxml_html
+
+from sec_parser.utils.bs4_.table_grid import get_table_grid as get_bs4_table_grid
+from sec_parser.utils.lxml_.table_grid import get_table_grid
+
+HTML = (
+    "<div><table><thead><tr><th>A</th><th colspan=2>B<!-- note --></th></tr>"
+    "</thead><tr><td rowspan=2>1,234</td><td>2<br>3</td><td>(5</td></tr>"
+    '<tr><td><script>var x = 1;</script>4</td><td style="display:none">5</td>'
+    "<td>6</td></tr></table></div>"
+)
+
+
+def test_table_grid_matches_bs4():
+    # Arrange
+    expected = get_bs4_table_grid(bs4.BeautifulSoup(HTML, "lxml").div)
+
+    # Act
+    actual = get_table_grid(lxml_html.fromstring(HTML))
+
+    # Assert
+    assert actual.to_dataframe().equals(expected.to_dataframe())
+    assert actual.to_dataframe(split_merged_data_cells=True).equals(
+        expected.to_dataframe(split_merged_data_cells=True),
+    )
+    assert (actual.rows_with_text, actual.cells_with_numbers) == (
+        expected.rows_with_text,
+        expected.cells_with_numbers,
+    )
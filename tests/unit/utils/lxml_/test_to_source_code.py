@@ -0,0 +1,30 @@
+import bs4
+import pytest
+from lxml import etree
+
+from sec_parser.utils.lxml_.to_source_code import to_source_code
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        '<div id="x" class="  b   a " style="color:red">text</div>',
+        "<p>a &amp; b &lt;c&gt;<br/>d<img src='x.png'></p>",
+        "<div title='say \"hi\"' alt=\"it's\" data-x='\"&apos;'>x</div>",
+        "<div><script>if (a < b && c > d) {}</script><style>p > a {}</style></div>",
+        "<div><!-- comment --><?php echo 1; ?></div>",
+        '<div><meta charset="latin-1"><meta http-equiv="Content-Type" content="text/html; charset=latin-1"></div>',
+        '<table><tr><td headers=" a  b ">1</td><td></td></tr></table>',
+        "<ix:nonnumeric name='x'><span>tagged</span></ix:nonnumeric>",
+    ],
+)
+def test_to_source_code(html):
+    # Arrange
+    expected = str(bs4.BeautifulSoup(html, "lxml").body.contents[0])
+    element = etree.HTML(html).find("body")[0]
+
+    # Act
+    actual = to_source_code(element)
+
+    # Assert
+    assert actual == expected
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from sec_parser.exceptions import SecParserValueError
+from sec_parser.utils.style_declarations import (
+    StyleDeclarationCache,
+    parse_style_declarations,
+)
+
+
+@pytest.mark.parametrize(
+    ("style", "expected"),
+    [
+        ("", {}),
+        ("color: red", {"color": "red"}),
+        (
+            "font-weight:600; color:blue;color:green;;invalid",
+            {"font-weight": "600", "color": "blue"},
+        ),
+        ("background: url(http://example.com)", {"background": "url(http://example.com)"}),
+    ],
+)
+def test_parse_style_declarations(style, expected):
+    # Act
+    actual = parse_style_declarations(style)
+
+    # Assert
+    assert actual == expected
+
+
+def test_cache_returns_read_only_declarations():
+    # Arrange
+    cache = StyleDeclarationCache()
+
+    # Act
+    first = cache.get("color: red")
+    second = cache.get("color: red")
+
+    # Assert
+    assert first is second
+    assert first == {"color": "red"}
+    with pytest.raises(TypeError):
+        first["color"] = "blue"  # type: ignore[index]
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_cache_evicts_least_recently_used():
+    # Arrange
+    cache = StyleDeclarationCache(max_size=2)
+    a = cache.get("a: 1")
+    cache.get("b: 2")
+    cache.get("a: 1")
+
+    # Act
+    cache.get("c: 3")
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.get("a: 1") is a
+    cache.get("b: 2")
+    assert cache.misses == 4
+
+
+def test_clear():
+    # Arrange
+    cache = StyleDeclarationCache()
+    cache.get("a: 1")
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert len(cache) == 0
+    assert cache.hit_rate is None
+
+
+def test_concurrent_access():
+    # Arrange
+    cache = StyleDeclarationCache(max_size=8)
+    styles = [f"width: {i}px" for i in range(16)]
+
+    def worker():
+        for _ in range(50):
+            for style in styles:
+                assert cache.get(style) == parse_style_declarations(style)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert len(cache) == 8
+    assert cache.hits + cache.misses == 4 * 50 * 16
+
+
+def test_invalid_max_size():
+    # Act and Assert
+    with pytest.raises(SecParserValueError):
+        StyleDeclarationCache(max_size=-1)
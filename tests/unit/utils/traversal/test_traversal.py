@@ -0,0 +1,52 @@
+import pytest
+
+from sec_parser.utils.traversal import iter_postorder, iter_preorder
+
+FOREST = {
+    "a": {"b": {"c": {}, "d": {}}, "e": {}},
+    "f": {"g": {}},
+}
+
+
+def get_children(node: tuple[str, dict]) -> list[tuple[str, dict]]:
+    return list(node[1].items())
+
+
+@pytest.mark.parametrize(
+    ("name", "iterate", "expected"),
+    values := [
+        (
+            "preorder",
+            iter_preorder,
+            [("a", 0), ("b", 1), ("c", 2), ("d", 2), ("e", 1), ("f", 0), ("g", 1)],
+        ),
+        (
+            "postorder",
+            iter_postorder,
+            [("c", 2), ("d", 2), ("b", 1), ("e", 1), ("a", 0), ("g", 1), ("f", 0)],
+        ),
+    ],
+    ids=[v[0] for v in values],
+)
+def test_traversal(name, iterate, expected):
+    # Act
+    actual = [(node[0], depth) for node, depth in iterate(FOREST.items(), get_children)]
+
+    # Assert
+    assert actual == expected, name
+
+
+@pytest.mark.parametrize("iterate", [iter_preorder, iter_postorder])
+def test_traversal_of_deeply_nested_nodes(iterate):
+    # Arrange
+    depth = 10_000
+    chain = list(range(depth))
+
+    def get_next(i: int) -> list[int]:
+        return [i + 1] if i + 1 < depth else []
+
+    # Act
+    actual = [d for _, d in iterate([0], get_next)]
+
+    # Assert
+    assert actual == (chain if iterate is iter_preorder else chain[::-1])